@@ -1,6 +1,10 @@
 import { useEffect, useState } from "react";
 import { useAppDispatch, useAppSelector } from "./store/store";
-import { fetchHealthData } from "./features/dashboard/dashboardSlice";
+import {
+  fetchHealthData,
+  DASHBOARD_MANIFEST_FILE,
+  DASHBOARD_RECORDS_FILE,
+} from "./features/dashboard/dashboardSlice";
 import { SERVER_URL } from "@/lib/api";
 import { Sidebar } from "./components/dashboard/Sidebar";
 import { OverviewView } from "./components/dashboard/views/OverviewView";
@@ -33,7 +37,9 @@ function App() {
     const checkConfig = async () => {
       try {
         if (isTauri()) {
-          const hasData = await exists("dashboard_data.json", { baseDir: BaseDirectory.AppData });
+          const hasData =
+            (await exists(DASHBOARD_MANIFEST_FILE, { baseDir: BaseDirectory.AppData })) ||
+            (await exists(DASHBOARD_RECORDS_FILE, { baseDir: BaseDirectory.AppData }));
           
           if (hasData) {
             setIsFirstRun(false);
@@ -7,6 +7,7 @@ import {
   getRestorativeSleepSeries,
   getReadinessSeries,
   formatNumber,
+  statsFromSummary,
 } from "@/lib/analytics";
 import {
   TrendingUp,
@@ -20,7 +21,7 @@ import {
   ArrowUp,
 } from "lucide-react";
 import { InfoTooltip } from "@/components/ui/InfoTooltip";
-import { selectFilteredData } from "@/features/dashboard/dashboardSlice";
+import { selectFilteredData, selectFullRangeAggregates } from "@/features/dashboard/dashboardSlice";
 
 // --- Type Definitions ---
 interface KpiCardProps {
@@ -37,10 +38,29 @@ interface KpiCardProps {
 // --- Main Component ---
 export const KpiGrid = memo(function KpiGrid() {
   const filteredData = useAppSelector(selectFilteredData);
+  const aggregates = useAppSelector(selectFullRangeAggregates);
 
   const metrics = useMemo(() => {
     if (filteredData.length === 0) return null;
 
+    // Whole history selected: use the engine's precomputed summary instead of scanning every day
+    if (aggregates) {
+      const summary = aggregates.summary;
+      return {
+        rhr: statsFromSummary(summary.resting_bpm),
+        sleep: statsFromSummary(summary.overall_score),
+        cals: statsFromSummary(summary.calories_total, 0),
+        hrv: statsFromSummary(summary.rmssd),
+        spo2: statsFromSummary(summary.spo2_avg),
+        stress: statsFromSummary(summary.stress_score),
+        recovery: statsFromSummary(summary.recovery_score, 0),
+        readiness: statsFromSummary(summary.readiness_raw, 2),
+        restorative: statsFromSummary(summary.restorative_sleep_pct, 1),
+        lastRecovery: summary.recovery_score?.last ?? null,
+        lastReadiness: summary.readiness_raw?.last ?? null,
+      };
+    }
+
     const rhrStats = calculateStats(getValidSeries(filteredData, "resting_bpm"));
     const sleepStats = calculateStats(getValidSeries(filteredData, "overall_score"));
     const calsStats = calculateStats(getValidSeries(filteredData, "calories_total"), 0);
@@ -71,7 +91,7 @@ export const KpiGrid = memo(function KpiGrid() {
       lastRecovery: recoverySeries.length > 0 ? recoverySeries[recoverySeries.length - 1] : null,
       lastReadiness: readinessSeries.length > 0 ? readinessSeries[readinessSeries.length - 1] : null,
     };
-  }, [filteredData]);
+  }, [filteredData, aggregates]);
 
   if (!metrics) return null;
 
@@ -2,12 +2,18 @@ import { useMemo } from "react";
 import { useAppSelector } from "@/store/store";
 import { DataTable } from "../datagrid/DataTable";
 import { columns } from "../datagrid/columns";
-import { calculateStats } from "@/lib/statistics";
+import { calculateStats, statsFromAggregates } from "@/lib/statistics";
+import { selectFullRangeAggregates } from "@/features/dashboard/dashboardSlice";
 
 export function DataGridView() {
   const { filteredData } = useAppSelector((state) => state.dashboard);
 
-  const stats = useMemo(() => calculateStats(filteredData), [filteredData]);
+  const aggregates = useAppSelector(selectFullRangeAggregates);
+
+  const stats = useMemo(
+    () => (aggregates ? statsFromAggregates(aggregates) : calculateStats(filteredData)),
+    [aggregates, filteredData]
+  );
 
   return (
     <div className="space-y-6 animate-in fade-in slide-in-from-bottom-4 duration-500 pb-10">
@@ -202,6 +202,9 @@ export function ConfigForm({
         setLoading(false);
         alert("Error starting calculation on the server.");
       } else {
+        // Duplicate requests are coalesced server-side into the same job
+        const { job_id: jobId } = await resp.json();
+
         // Close form instantly and listen in background
         onSuccess();
         
@@ -210,6 +213,9 @@ export function ConfigForm({
         ws.onmessage = (event) => {
           try {
             const data = JSON.parse(event.data);
+            if (jobId && data.job_id && data.job_id !== jobId) {
+              return;
+            }
             if (data.event === "etl_progress") {
               dispatch(setEtlProgress({ progress: data.progress, step: data.step }));
             } else if (data.event === "etl_finished") {
@@ -217,7 +223,7 @@ export function ConfigForm({
               ws.close();
               if (data.status === "success") {
                 dispatch(fetchHealthData());
-              } else {
+              } else if (data.status !== "cancelled") {
                 alert("Error during ETL: " + data.message);
               }
             }
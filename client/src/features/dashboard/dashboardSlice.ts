@@ -3,14 +3,15 @@ import {
   createAsyncThunk,
   type PayloadAction,
 } from "@reduxjs/toolkit";
-import type { HealthRecord, DateRange } from "@/types/health";
+import type { HealthRecord, DateRange, DashboardAggregates } from "@/types/health";
 import { subMonths, parseISO, format } from "date-fns";
 import { isTauri } from "@tauri-apps/api/core";
-import { readTextFile, BaseDirectory } from "@tauri-apps/plugin-fs";
+import { readTextFile, exists, BaseDirectory } from "@tauri-apps/plugin-fs";
 
 interface DashboardState {
   data: HealthRecord[];
   filteredData: HealthRecord[];
+  aggregates: DashboardAggregates | null;
   dateRange: DateRange | null;
   minDataDate: string;
   maxDataDate: string;
@@ -24,6 +25,7 @@ interface DashboardState {
 const initialState: DashboardState = {
   data: [],
   filteredData: [],
+  aggregates: null,
   dateRange: null,
   minDataDate: "",
   maxDataDate: "",
@@ -34,30 +36,88 @@ const initialState: DashboardState = {
   etlStep: "",
 };
 
+// Columnar payload written by the engine: a manifest listing per-year chunks
+export const DASHBOARD_MANIFEST_FILE = "dashboard_manifest.json";
+// Legacy records payload (DASHBOARD_FORMAT=records or outputs of older engines)
+export const DASHBOARD_RECORDS_FILE = "dashboard_data.json";
+// Whole-history statistics precomputed by the engine (optional)
+export const DASHBOARD_AGGREGATES_FILE = "dashboard_aggregates.json";
+
+interface DashboardManifest {
+  version: number;
+  format: "columnar";
+  rows: number;
+  columns: string[];
+  chunks: { file: string; start: string | null; end: string | null; rows: number }[];
+}
+
+interface DashboardChunk {
+  dates: string[];
+  columns: Record<string, (number | null)[]>;
+}
+
+/** Reads a JSON file written by the engine, or null if it does not exist. */
+async function readDashboardFile<T>(name: string): Promise<T | null> {
+  if (isTauri()) {
+    if (!(await exists(name, { baseDir: BaseDirectory.AppData }))) return null;
+    return JSON.parse(await readTextFile(name, { baseDir: BaseDirectory.AppData })) as T;
+  }
+  const response = await fetch(`/${name}`);
+  if (response.status === 404) return null;
+  if (!response.ok) throw new Error(`Failed to load ${name}`);
+  // SPA fallbacks answer unknown paths with index.html
+  if (!(response.headers.get("content-type") ?? "").includes("json")) return null;
+  return (await response.json()) as T;
+}
+
+function chunkToRecords(chunk: DashboardChunk): HealthRecord[] {
+  const names = Object.keys(chunk.columns);
+  return chunk.dates.map((date, i) => {
+    const record: Record<string, string | number | null> = { date };
+    for (const name of names) {
+      record[name] = chunk.columns[name][i];
+    }
+    return record as unknown as HealthRecord;
+  });
+}
+
+async function loadRecords(): Promise<HealthRecord[]> {
+  const manifest = await readDashboardFile<DashboardManifest>(DASHBOARD_MANIFEST_FILE);
+  if (manifest) {
+    const chunks = await Promise.all(
+      manifest.chunks.map((chunk) => readDashboardFile<DashboardChunk>(chunk.file))
+    );
+    return chunks.flatMap((chunk) => (chunk ? chunkToRecords(chunk) : []));
+  }
+
+  const records = await readDashboardFile<HealthRecord[]>(DASHBOARD_RECORDS_FILE);
+  if (!records) {
+    console.warn("Dashboard data not found (normal on first run)");
+    return [];
+  }
+  return records;
+}
+
+async function loadAggregates(): Promise<DashboardAggregates | null> {
+  try {
+    return await readDashboardFile<DashboardAggregates>(DASHBOARD_AGGREGATES_FILE);
+  } catch (e) {
+    // Optional: views compute their statistics locally without it
+    console.warn("Dashboard aggregates unavailable:", e);
+    return null;
+  }
+}
+
 export const fetchHealthData = createAsyncThunk(
   "dashboard/fetchHealthData",
   async () => {
     try {
-      if (isTauri()) {
-        try {
-          const content = await readTextFile("dashboard_data.json", { baseDir: BaseDirectory.AppData });
-          return JSON.parse(content) as HealthRecord[];
-        } catch (fileErr) {
-          console.warn("dashboard_data.json not found locally. (Normal on first run)", fileErr);
-          return [];
-        }
-      } else {
-        const response = await fetch("/dashboard_data.json");
-        if (response.status === 404) {
-          console.warn("dashboard_data.json not found (normal on first run)");
-          return [];
-        }
-        if (!response.ok) throw new Error("Failed to load dashboard data");
-        return (await response.json()) as HealthRecord[];
-      }
+      const [records, aggregates] = await Promise.all([loadRecords(), loadAggregates()]);
+      return { records, aggregates: records.length > 0 ? aggregates : null };
     } catch (e) {
       console.error("Error fetching dashboard data:", e);
-      return []; // Return empty array instead of failing the state
+      // Return empty data instead of failing the state
+      return { records: [] as HealthRecord[], aggregates: null };
     }
   },
   {
@@ -109,12 +169,14 @@ const dashboardSlice = createSlice({
         state.status = "loading";
       })
       .addCase(fetchHealthData.fulfilled, (state, action) => {
+        const { records, aggregates } = action.payload;
         state.status = "succeeded";
-        state.data = action.payload;
+        state.data = records;
+        state.aggregates = aggregates;
 
-        if (action.payload.length > 0) {
-          const firstRecord = action.payload[0];
-          const lastRecord = action.payload[action.payload.length - 1];
+        if (records.length > 0) {
+          const firstRecord = records[0];
+          const lastRecord = records[records.length - 1];
 
           state.minDataDate = firstRecord.date;
           state.maxDataDate = lastRecord.date;
@@ -130,7 +192,7 @@ const dashboardSlice = createSlice({
           }
 
           state.dateRange = { start: startDate, end: endDate };
-          state.filteredData = action.payload.filter(
+          state.filteredData = records.filter(
             (d) => d.date >= startDate && d.date <= endDate
           );
         }
@@ -147,4 +209,11 @@ export const { setDateRange, resetFilter, setIsProcessing, setEtlProgress } = da
 export const selectFilteredData = (state: { dashboard: DashboardState }) => state.dashboard.filteredData;
 export const selectDashboardStatus = (state: { dashboard: DashboardState }) => state.dashboard.status;
 
+// The precomputed aggregates cover the whole history: only usable while all of it is selected
+export const selectFullRangeAggregates = (state: { dashboard: DashboardState }) => {
+  const { aggregates, dateRange, minDataDate, maxDataDate } = state.dashboard;
+  if (!aggregates || !dateRange) return null;
+  return dateRange.start <= minDataDate && dateRange.end >= maxDataDate ? aggregates : null;
+};
+
 export default dashboardSlice.reducer;
@@ -1,4 +1,4 @@
-import type { HealthRecord } from "@/types/health";
+import type { HealthRecord, AggregateSummary } from "@/types/health";
 
 export const formatNumber = (
   num: number | null | undefined,
@@ -21,6 +21,21 @@ export const calculateStats = (series: number[], decimals = 1) => {
   };
 };
 
+/**
+ * Same output as calculateStats, from a summary precomputed by the engine
+ * (which applies the getValidSeries rules).
+ */
+export const statsFromSummary = (summary: AggregateSummary | undefined, decimals = 1) => {
+  if (!summary || summary.count === 0 || summary.avg === null || summary.min === null || summary.max === null) {
+    return { avg: "--", min: "--", max: "--" };
+  }
+  return {
+    avg: summary.avg.toFixed(decimals),
+    min: summary.min.toFixed(decimals),
+    max: summary.max.toFixed(decimals),
+  };
+};
+
 /**
  * Filters and returns a valid series of numbers for a specific metric.
  */
@@ -1,4 +1,4 @@
-import type { HealthRecord } from "@/types/health";
+import type { HealthRecord, DashboardAggregates } from "@/types/health";
 
 export type ColumnStats = {
   min: number;
@@ -27,6 +27,18 @@ function getPercentiles(values: number[]): ColumnStats {
   };
 }
 
+/**
+ * Percentiles precomputed by the engine (same 33/66 rule), for the whole history.
+ */
+export function statsFromAggregates(aggregates: DashboardAggregates): StatsMap {
+  const stats: StatsMap = {};
+  for (const [key, s] of Object.entries(aggregates.stats)) {
+    if (s.min === null || s.p33 === null || s.p66 === null || s.max === null) continue;
+    stats[key] = { min: s.min, p33: s.p33, p66: s.p66, max: s.max };
+  }
+  return stats;
+}
+
 export function calculateStats(data: HealthRecord[]): StatsMap {
   const numericKeys: (keyof HealthRecord)[] = [
     "resting_bpm",
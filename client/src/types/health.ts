@@ -34,3 +34,36 @@ export interface HealthRecord {
   stress_score: number | null; // Stress
   spo2_avg: number | null;
 }
+
+// --- Precomputed aggregates (dashboard_aggregates.json, whole history) ---
+export interface AggregateStats {
+  min: number | null;
+  p33: number | null;
+  p66: number | null;
+  max: number | null;
+}
+
+export interface AggregateSummary {
+  count: number;
+  avg: number | null;
+  min: number | null;
+  max: number | null;
+  last: number | null;
+  last_date: string | null;
+}
+
+export interface AggregateRollup {
+  periods: string[];
+  days: number[];
+  columns: Record<string, (number | null)[]>;
+}
+
+export interface DashboardAggregates {
+  version: number;
+  generated_at: string;
+  decimals: number;
+  stats: Record<string, AggregateStats>;
+  summary: Record<string, AggregateSummary>;
+  weekly: AggregateRollup;
+  monthly: AggregateRollup;
+}
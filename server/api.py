@@ -1,19 +1,46 @@
 import os
-import json
 import asyncio
-from typing import List
+import json
+import multiprocessing
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Optional
 
 import uvicorn
-from pydantic import BaseModel, Field, validator
-from fastapi import FastAPI, BackgroundTasks, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
-from modules.briefing import get_daily_brief
+import config
+# Only lightweight modules here: pandas and the ETL/briefing modules are imported
+# on first use (or by the background prewarm), so /api/health answers right away
+from modules.profiles import DEFAULT_PROFILE, list_profiles, profile_context, save_session_config, validate_profile
 
 # Change working directory so relative paths in config.py work correctly
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-app = FastAPI(title="FitStats Config API")
+
+def _prewarm_imports():
+    """Imports the data stack (pandas, ETL, briefing) once the server is up, ahead of the first request."""
+    start = time.perf_counter()
+    from modules import briefing, pipeline, query  # noqa: F401
+    print(f"Data modules loaded in {time.perf_counter() - start:.2f}s")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    if config.API_PREWARM_IMPORTS:
+        threading.Thread(target=_prewarm_imports, name="prewarm-imports", daemon=True).start()
+    yield
+
+
+app = FastAPI(title="FitStats Config API", lifespan=lifespan)
 
 # Allow CORS for local development (React runs on 8080/5173, etc)
 app.add_middleware(
@@ -48,100 +75,369 @@ async def check_path(path: str):
     return {"valid": True, "path": target_path}
 
 
+class ClientChannel:
+    """
+    Outgoing messages of one WebSocket, drained by its own sender task.
+
+    Messages published with a key (e.g. the progress of a job) are coalesced:
+    while one is still waiting to be sent, a newer one replaces it in place.
+    """
+
+    def __init__(self, websocket: WebSocket, max_queue: int):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.items = deque()  # JSON texts, or coalescing keys (tuples) pointing into `latest`
+        self.latest = {}
+        self.wakeup = asyncio.Event()
+        self.task = None
+
+    def put(self, text: str, key: tuple = None) -> bool:
+        """Queues a serialized message; returns False if the queue is full."""
+        if key is not None and key in self.latest:
+            self.latest[key] = text  # Latest wins, keeping its place in the queue
+            return True
+        if len(self.items) >= self.max_queue:
+            return False
+        if key is not None:
+            self.latest[key] = text
+            self.items.append(key)
+        else:
+            self.items.append(text)
+        self.wakeup.set()
+        return True
+
+    def pop(self) -> str:
+        item = self.items.popleft()
+        return self.latest.pop(item) if isinstance(item, tuple) else item
+
+
 class ConnectionManager:
+    """
+    Fans status messages out to every connected WebSocket without blocking.
+
+    Publishing only serializes the message once and appends it to each client's
+    bounded queue; a sender task per client does the actual sends, so a slow or
+    half-dead client never delays the others. Clients whose send fails, times
+    out, or whose queue overflows are evicted.
+    """
+
+    MAX_QUEUE = 256
+    SEND_TIMEOUT = 5.0
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.channels = {}  # WebSocket -> ClientChannel
+        self._incoming = {}  # key -> message published from a worker thread, not yet on the loop
+        self._incoming_lock = threading.Lock()
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self.channels)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        channel = ClientChannel(websocket, self.MAX_QUEUE)
+        channel.task = asyncio.create_task(self._sender(channel))
+        self.channels[websocket] = channel
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                pass
+        channel = self.channels.pop(websocket, None)
+        if channel is not None and channel.task is not asyncio.current_task():
+            channel.task.cancel()
+
+    def publish(self, message: dict, key: tuple = None):
+        """
+        Queues a message for every client (event loop thread only, never blocks).
+
+        Args:
+            message (dict): JSON-serializable message.
+            key (tuple): Coalescing key: a queued message with the same key is replaced.
+        """
+        if not self.channels:
+            return
+        text = json.dumps(message)
+        for channel in list(self.channels.values()):
+            if not channel.put(text, key):
+                print(f"Evicting WebSocket client: {self.MAX_QUEUE} messages behind")
+                self.disconnect(channel.websocket)
+                asyncio.create_task(self._close(channel.websocket))
+
+    def publish_threadsafe(self, loop, message: dict, key: tuple = None):
+        """
+        publish() from a worker thread (e.g. the ETL).
+
+        Keyed messages are also coalesced before reaching the loop: however often
+        a job reports progress, at most one callback per key is pending.
+        """
+        if key is None:
+            loop.call_soon_threadsafe(self.publish, message)
+            return
+        with self._incoming_lock:
+            pending = key in self._incoming
+            self._incoming[key] = message
+        if not pending:
+            loop.call_soon_threadsafe(self._publish_incoming, key)
+
+    def _publish_incoming(self, key):
+        with self._incoming_lock:
+            message = self._incoming.pop(key)
+        self.publish(message, key)
+
+    async def broadcast(self, message: dict, key: tuple = None):
+        """Coroutine form of publish(), for callers on the event loop."""
+        self.publish(message, key)
+
+    async def _sender(self, channel):
+        try:
+            while True:
+                await channel.wakeup.wait()
+                channel.wakeup.clear()
+                while channel.items:
+                    text = channel.pop()
+                    await asyncio.wait_for(channel.websocket.send_text(text), self.SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Closed socket, or a client that stopped reading
+            await self._evict(channel)
+
+    async def _evict(self, channel):
+        if self.channels.get(channel.websocket) is channel:
+            self.disconnect(channel.websocket)
+            await self._close(channel.websocket)
+
+    @staticmethod
+    async def _close(websocket):
+        # 1013: try again later
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), 1.0)
+        except Exception:
+            pass
 
 
 manager = ConnectionManager()
 
 
-def run_etl_sync(payload, loop):
-    """Runs the synchronous ETL by sending updates to the queue."""
-    import config
-    from modules import etl, metrics
+class ETLJob:
+    """A single ETL run of a profile, requested through /api/start."""
+
+    def __init__(self, profile: str, payload: ConfigPayload):
+        self.id = uuid.uuid4().hex[:12]
+        self.profile = profile
+        self.payload = payload
+        self.status = "queued"  # queued | running | success | error | cancelled
+        self.progress = 0
+        self.step = None
+        self.message = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def done(self):
+        return self.status in ("success", "error", "cancelled")
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "profile": self.profile,
+            "status": self.status,
+            "progress": self.progress,
+            "step": self.step,
+            "message": self.message,
+            "cancel_requested": self.cancel_event.is_set(),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ETLJobManager:
+    """
+    Schedules ETL runs: single-flight per profile, bounded across profiles.
+
+    Each profile has at most one active job (its runs write the same output
+    files) and one queued job. Only the latest configuration matters: a request
+    identical to the queued job (or, without one, to the active job) is coalesced
+    into it; a request identical to the active job drops the queued one; any
+    other request becomes the queued job, replacing the previous one. Active jobs of different profiles share a pool of max_concurrent
+    threads, so N profiles refresh concurrently without overloading the host;
+    the others wait for a free slot. All methods are called from the event loop.
+    """
+
+    MAX_FINISHED_JOBS = 50
+
+    def __init__(self, max_concurrent=None):
+        self.max_concurrent = max(1, max_concurrent or config.ETL_MAX_CONCURRENT_JOBS)
+        self.jobs = OrderedDict()
+        self.active = {}  # profile -> ETLJob waiting for a slot or running
+        self.queued = {}  # profile -> ETLJob starting after the active one
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="etl")
+
+    def submit(self, profile: str, payload: ConfigPayload):
+        """
+        Schedules an ETL run of profile with payload.
+
+        Returns:
+            tuple: (ETLJob, coalesced) where coalesced is True if an equivalent
+                   job was already active or queued for the profile and is
+                   now the last one that will run.
+        """
+        queued, active = self.queued.get(profile), self.active.get(profile)
+        if queued is not None and queued.payload == payload:
+            return queued, True
+        if active is not None and active.payload == payload and not active.cancel_event.is_set():
+            # The running job already produces this configuration: a different queued one would overwrite it
+            if queued is not None:
+                self._finish(queued, "cancelled", f"Superseded by job {active.id}")
+            return active, True
+
+        job = ETLJob(profile, payload)
+        self._remember(job)
+        if profile in self.queued:
+            self._finish(self.queued[profile], "cancelled", f"Superseded by job {job.id}")
+        if profile not in self.active:
+            self._start(job)
+        else:
+            self.queued[profile] = job
+        return job, False
+
+    def get(self, job_id: str) -> Optional[ETLJob]:
+        return self.jobs.get(job_id)
+
+    def list(self, profile: str = None):
+        """Returns the known jobs, most recent first, optionally of one profile."""
+        return [job for job in reversed(self.jobs.values())
+                if profile is None or job.profile == profile]
+
+    def cancel(self, job_id: str) -> Optional[ETLJob]:
+        """
+        Cancels a job. A job that has not started is dropped immediately, a
+        running one stops at the next file or stage boundary without exporting
+        anything.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.done:
+            return job
+        job.cancel_event.set()
+        if job.status == "queued":
+            self._finish(job, "cancelled", "Cancelled before start")
+        return job
+
+    def _remember(self, job):
+        self.jobs[job.id] = job
+        finished = [j for j in self.jobs.values() if j.done]
+        for old in finished[:max(0, len(finished) - self.MAX_FINISHED_JOBS)]:
+            del self.jobs[old.id]
+
+    def _finish(self, job, status, message):
+        """Ends a job that will not (or no longer) run, e.g. superseded or cancelled while queued."""
+        job.status, job.message, job.finished_at = status, message, time.time()
+        if self.queued.get(job.profile) is job:
+            del self.queued[job.profile]
+        # Clients follow their job_id over the WebSocket: always send it a terminal event
+        manager.publish({"event": "etl_finished", "job_id": job.id, "profile": job.profile,
+                         "status": status, "message": message})
+
+    def _start(self, job):
+        self.active[job.profile] = job
+        asyncio.create_task(self._run(job))
+
+    async def _run(self, job):
+        try:
+            async with self._slots:
+                if job.done:  # Cancelled while waiting for a slot
+                    return
+                job.status, job.started_at = "running", time.time()
+                await run_etl_task(job, self._executor)
+        except Exception as e:
+            self._finish(job, "error", str(e))
+        finally:
+            del self.active[job.profile]
+            next_job = self.queued.pop(job.profile, None)
+            if next_job is not None:
+                self._start(next_job)
 
-    config.DATA_DIR = payload.data_path
-    config.USER_DOB = payload.dob
-    config.USER_HEIGHT_CM = payload.height
-    config.USER_WEIGHT_KG = payload.weight
-    config.USER_GENDER = payload.gender
 
-    def progress(pct, msg):
-        asyncio.run_coroutine_threadsafe(
-            manager.broadcast(
-                {"event": "etl_progress", "step": msg, "progress": pct}),
-            loop
-        )
-
-    try:
-        progress(10, "Loading and merging data files")
-        df = etl.merge_all_data(progress_callback=progress)
+def run_etl_sync(job, loop):
+    """Runs the synchronous ETL by sending updates to the queue."""
+    from modules import pipeline
+    from modules.briefing import get_dataset_cache
+    from modules.etl import ETLCancelled
+
+    payload = job.payload
+    ctx = profile_context(
+        job.profile,
+        data_dir=payload.data_path,
+        dob=payload.dob,
+        height_cm=payload.height,
+        weight_kg=payload.weight,
+        gender=payload.gender,
+    )
+    event = {"job_id": job.id, "profile": job.profile}
 
-        if df is not None:
-            progress(70, "Calculating readiness metrics")
-            df = metrics.calculate_readiness(df)
+    def progress(pct, msg):
+        job.progress, job.step = pct, msg
+        # Latest wins: clients that fall behind only get the newest progress of the job
+        manager.publish_threadsafe(
+            loop, {"event": "etl_progress", **event, "step": msg, "progress": pct},
+            key=("etl_progress", job.id))
 
-            progress(75, "Calculating metabolic metrics")
-            df = metrics.calculate_metabolic_metrics(df)
+    def stage_metrics(record):
+        manager.publish_threadsafe(loop, {"event": "etl_stage_metrics", **event, **record})
 
-            progress(80, "Calculating advanced metrics")
-            df = metrics.calculate_advanced_metrics(df)
+    def finished(status, message):
+        job.status, job.message, job.finished_at = status, message, time.time()
+        manager.publish_threadsafe(
+            loop, {"event": "etl_finished", **event, "status": status, "message": message})
 
-            progress(90, "Exporting analysis CSV")
-            # Required for BRIEFING module
-            df.to_csv(os.path.join(
-                config.CLIENT_PUBLIC_DIR, "fitbit_analysis.csv"))
+    try:
+        df, _ = pipeline.run_pipeline(progress_callback=progress, stage_callback=stage_metrics,
+                                      cancel_event=job.cancel_event, ctx=ctx)
 
-            progress(95, "Exporting dashboard JSON")
-            etl.export_to_json(df)
+        if df is not None:
+            # Serve briefings from the fresh dataset without reloading it from disk
+            get_dataset_cache(ctx).set(df)
 
             progress(100, "Complete")
-            asyncio.run_coroutine_threadsafe(
-                manager.broadcast(
-                    {"event": "etl_finished", "status": "success", "message": "ETL completed successfully"}),
-                loop
-            )
+            finished("success", "ETL completed successfully")
         else:
-            asyncio.run_coroutine_threadsafe(
-                manager.broadcast(
-                    {"event": "etl_finished", "status": "error", "message": "No valid data found."}),
-                loop
-            )
+            finished("error", "No valid data found.")
+    except ETLCancelled:
+        finished("cancelled", "ETL cancelled")
     except Exception as e:
-        asyncio.run_coroutine_threadsafe(
-            manager.broadcast(
-                {"event": "etl_finished", "status": "error", "message": str(e)}),
-            loop
-        )
+        finished("error", str(e))
 
 
-async def run_etl_task(payload):
-    """Starts the synchronous execution of the ETL in a separate thread."""
-    await manager.broadcast({"event": "etl_progress", "step": "Starting ETL engine...", "progress": 0})
+async def run_etl_task(job, executor=None):
+    """Starts the synchronous execution of the ETL in a separate thread (of executor if given)."""
+    manager.publish({"event": "etl_progress", "job_id": job.id, "profile": job.profile,
+                     "step": "Starting ETL engine...", "progress": 0}, key=("etl_progress", job.id))
     loop = asyncio.get_running_loop()
-    await asyncio.to_thread(run_etl_sync, payload, loop)
+    await loop.run_in_executor(executor, run_etl_sync, job, loop)
+
+
+jobs = ETLJobManager()
+
+
+def _validated_profile(profile):
+    """Validates a profile query parameter, answering 400 on invalid names."""
+    try:
+        return validate_profile(profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/api/start")
-async def start_etl(payload: ConfigPayload, background_tasks: BackgroundTasks):
-    """Saves biometric configurations and initiates the main ETL pipeline asynchronously via BackgroundTasks."""
-    import config
+async def start_etl(payload: ConfigPayload, profile: str = DEFAULT_PROFILE):
+    """
+    Saves the profile's biometric configuration and schedules its ETL pipeline.
+
+    Duplicate requests are coalesced into the active or queued job of the
+    profile instead of starting a second concurrent run.
+    """
+    profile = _validated_profile(profile)
     # Save to session_config.json to persist across runs and for watcher
     session_config = {
         "dob": payload.dob,
@@ -150,13 +446,64 @@ async def start_etl(payload: ConfigPayload, background_tasks: BackgroundTasks):
         "weight": payload.weight,
         "data_path": payload.data_path
     }
-    config_path = os.path.join(config.CLIENT_PUBLIC_DIR, "session_config.json")
-    with open(config_path, "w") as f:
-        json.dump(session_config, f)
+    save_session_config(profile, session_config)
 
     # Run ETL logic internally without subprocesses
-    background_tasks.add_task(run_etl_task, payload)
-    return {"status": "accepted", "message": "ETL process started in background"}
+    job, coalesced = jobs.submit(profile, payload)
+    if coalesced:
+        message = f"ETL job {job.id} already {job.status}, request coalesced"
+    elif profile in jobs.queued and jobs.queued[profile] is job:
+        message = f"ETL job {job.id} queued after the active job of profile '{profile}'"
+    else:
+        message = "ETL process started in background"
+    return {"status": "accepted", "job_id": job.id, "profile": profile, "job_status": job.status,
+            "coalesced": coalesced, "message": message}
+
+
+@app.get("/api/jobs")
+async def list_jobs(profile: str = None):
+    """Lists the active, queued and recently finished ETL jobs, optionally of one profile."""
+    if profile is not None:
+        profile = _validated_profile(profile)
+    return {
+        "max_concurrent": jobs.max_concurrent,
+        "active": {p: job.id for p, job in jobs.active.items() if profile in (None, p)},
+        "queued": {p: job.id for p, job in jobs.queued.items() if profile in (None, p)},
+        "jobs": [job.to_dict() for job in jobs.list(profile)],
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def job_status(job_id: str):
+    """Returns the status and progress of an ETL job."""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    return job.to_dict()
+
+
+@app.post("/api/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """Requests cancellation of a queued or running ETL job."""
+    job = jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    return job.to_dict()
+
+
+@app.get("/api/profiles")
+async def get_profiles():
+    """Lists the configured profiles with the status of their latest job."""
+    latest = {}
+    for job in jobs.list():
+        latest.setdefault(job.profile, job)
+    return {
+        "default": DEFAULT_PROFILE,
+        "profiles": [
+            {"name": p, "job": latest[p].to_dict() if p in latest else None}
+            for p in list_profiles()
+        ],
+    }
 
 
 @app.websocket("/ws/status")
@@ -167,32 +514,38 @@ async def websocket_status(websocket: WebSocket):
         while True:
             # Wait passively (keep-alive)
             data = await websocket.receive_text()
-    except WebSocketDisconnect:
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the socket was closed by an eviction
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
 @app.get("/api/config")
-async def get_config():
-    """Retrieves the current user session configuration if it exists."""
-    import config
-    config_path = os.path.join(config.CLIENT_PUBLIC_DIR, "session_config.json")
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            return json.load(f)
-    return {}
+async def get_config(profile: str = DEFAULT_PROFILE):
+    """Retrieves the current user session configuration of a profile if it exists."""
+    from modules.context import load_session_config
+    from modules.profiles import get_profile_dir
+    return load_session_config(get_profile_dir(_validated_profile(profile)))
 
 
 @app.delete("/api/clear")
-async def clear_data():
-    """Erases session config and computed dashboard data to simulate a factory reset."""
-    import config
-    client_dir = config.CLIENT_PUBLIC_DIR
+async def clear_data(profile: str = DEFAULT_PROFILE):
+    """Erases a profile's session config and computed dashboard data to simulate a factory reset."""
+    from modules.briefing import get_dataset_cache
+    from modules.parse_cache import get_cache_dir, remove_legacy_cache
+    from modules.store import get_store_path
+    from modules import dashboard
+    from modules.instrumentation import HISTORY_FILENAME
+    ctx = profile_context(_validated_profile(profile))
+    client_dir = ctx.out_dir
 
     files_to_remove = [
         os.path.join(client_dir, "session_config.json"),
-        os.path.join(client_dir, "dashboard_data.json"),
-        os.path.join(client_dir, "fitbit_analysis.csv")
-    ]
+        os.path.join(client_dir, "fitbit_analysis.csv"),
+        get_store_path(client_dir),
+        os.path.join(client_dir, HISTORY_FILENAME)
+    ] + dashboard.output_files(client_dir)
 
     cleared = []
     for filepath in files_to_remove:
@@ -203,15 +556,27 @@ async def clear_data():
         except Exception as e:
             print(f"Error removing {filepath}: {e}")
 
+    get_dataset_cache(ctx).invalidate()
+
+    cache_dir = get_cache_dir(ctx)
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        cleared.append(cache_dir)
+    legacy_dir = remove_legacy_cache(client_dir)
+    if legacy_dir:
+        cleared.append(legacy_dir)
+
     return {"status": "ok", "cleared": cleared}
 
 
 @app.post("/api/brief")
-async def run_brief(payload: dict = None):
-    """Generates a structured daily health briefing."""
+async def run_brief(payload: dict = None, profile: str = DEFAULT_PROFILE):
+    """Generates a structured daily health briefing of a profile."""
+    from modules.briefing import get_daily_brief
     date = payload.get("date") if payload else None
+    ctx = profile_context(_validated_profile(profile))
     try:
-        brief = get_daily_brief(date)
+        brief = get_daily_brief(date, ctx=ctx)
         if "error" in brief:
             raise HTTPException(status_code=404, detail=brief["error"])
         return brief
@@ -219,10 +584,47 @@ async def run_brief(payload: dict = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/brief/range")
+async def run_brief_range(start: str = None, end: str = None, profile: str = DEFAULT_PROFILE):
+    """Returns briefing values and Z-Score statuses for every day between start and end (YYYY-MM-DD)."""
+    from modules.briefing import get_brief_range
+    ctx = profile_context(_validated_profile(profile))
+    try:
+        brief_range = get_brief_range(start, end, ctx=ctx)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if "error" in brief_range:
+        raise HTTPException(status_code=404, detail=brief_range["error"])
+    return brief_range
+
+
+@app.get("/api/data")
+async def get_data(start: str = None, end: str = None, columns: str = None, resolution: str = "daily",
+                   profile: str = DEFAULT_PROFILE):
+    """
+    Returns a slice of a profile's master dataset as column arrays aligned on 'dates'.
+
+    `columns` is a comma-separated list (all columns when omitted), start/end are
+    inclusive YYYY-MM-DD days and `resolution` is daily, weekly or monthly (means).
+    """
+    from modules.query import query_data
+    ctx = profile_context(_validated_profile(profile))
+    names = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    try:
+        result = query_data(start, end, names, resolution, ctx=ctx)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    # Serialized directly: the generic encoder walks every value of the arrays
+    return Response(json.dumps(result, separators=(",", ":"), allow_nan=False), media_type="application/json")
+
+
 @app.get("/api/health")
 async def health():
     """Simple health check endpoint to verify API uptime."""
     return {"status": "ok"}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    multiprocessing.freeze_support()
+    uvicorn.run(app, host=config.API_HOST, port=config.API_PORT)
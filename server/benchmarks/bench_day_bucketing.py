@@ -0,0 +1,74 @@
+"""
+Micro-benchmark of the intraday timestamp-to-day bucketing used by the
+minute-level JSON parsers (calories, steps, distance, activity minutes).
+
+Compares the previous per-row pd.to_datetime(...).dt.normalize() + groupby
+against parsers.sum_by_day(), which parses each distinct day prefix only once.
+
+Usage (from the server folder):
+    python benchmarks/bench_day_bucketing.py [--days 31] [--repeat 10]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from modules import parsers
+
+
+def legacy_sum_by_day(df):
+    """The original per-row parsing path, kept as the comparison baseline."""
+    df = df.copy()
+    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+    df['date'] = pd.to_datetime(
+        df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
+    return df.groupby('date')['value'].sum().reset_index().rename(columns={'value': 'calories_total'}).set_index('date')
+
+
+def bucketed_sum_by_day(df):
+    return parsers.sum_by_day(df['dateTime'], df['value'], 'calories_total')
+
+
+def make_minute_frame(days):
+    """Builds the DataFrame a calories-*.json file decodes to: 1440 rows per day."""
+    rnd = random.Random(42)
+    start = datetime(2024, 1, 1)
+    rows = [{"dateTime": (start + timedelta(minutes=m)).strftime('%m/%d/%y %H:%M:%S'),
+             "value": f"{rnd.uniform(0.9, 12.0):.2f}"}
+            for m in range(days * 1440)]
+    return pd.DataFrame(rows)
+
+
+def best_time(func, df, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(df)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=31, help="Days in the synthetic file")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    df = make_minute_frame(args.days)
+    old_t, old_df = best_time(legacy_sum_by_day, df, args.repeat)
+    new_t, new_df = best_time(bucketed_sum_by_day, df, args.repeat)
+    pd.testing.assert_frame_equal(old_df, new_df)
+
+    print(f"{len(df)} rows ({args.days} days x 1440 minutes)")
+    print(f"per-row to_datetime : {old_t * 1000:8.2f} ms")
+    print(f"day-prefix buckets  : {new_t * 1000:8.2f} ms")
+    print(f"speedup x{old_t / new_t:.1f}")
+
+
+if __name__ == "__main__":
+    main()
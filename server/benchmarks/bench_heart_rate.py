@@ -0,0 +1,103 @@
+"""
+Benchmarks parse_heart_rate_intraday_summary against the previous
+json.load + DataFrame + pd.to_datetime implementation.
+
+Usage (from the server folder):
+    python benchmarks/bench_heart_rate.py [--days 1] [--step 5] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from modules import parsers
+
+
+def legacy_parse_heart_rate(file_path):
+    """The original implementation, kept here as the comparison baseline."""
+    with open(file_path, 'r') as f:
+        data = json.load(f)
+    if not data:
+        return None
+    records = []
+    for entry in data:
+        dt = entry.get('dateTime')
+        val = entry.get('value', {})
+        bpm = val.get('bpm')
+        if dt and bpm:
+            records.append({'dateTime': dt, 'bpm': bpm})
+    if not records:
+        return None
+    df = pd.DataFrame(records)
+    df['date'] = pd.to_datetime(
+        df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
+    stats = df.groupby('date')['bpm'].agg(['min', 'max', 'mean']).reset_index()
+    stats.rename(columns={'min': 'min_bpm',
+                 'max': 'max_bpm', 'mean': 'avg_bpm'}, inplace=True)
+    stats['avg_bpm'] = stats['avg_bpm'].round(1)
+    stats.set_index('date', inplace=True)
+    return stats
+
+
+def write_heart_rate_file(path, days, step):
+    """Writes a synthetic heart_rate file with one sample every `step` seconds."""
+    rnd = random.Random(42)
+    start = datetime(2024, 1, 1)
+    rows = []
+    for s in range(0, days * 86400, step):
+        ts = start + timedelta(seconds=s)
+        rows.append({"dateTime": ts.strftime('%m/%d/%y %H:%M:%S'),
+                     "value": {"bpm": rnd.randint(48, 170), "confidence": 2}})
+    with open(path, 'w') as f:
+        json.dump(rows, f)
+    return len(rows)
+
+
+def measure(func, path, repeat):
+    """Returns (best wall time in seconds, peak traced memory in bytes, result)."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(path)
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=1, help="Days covered by the file")
+    parser.add_argument("--step", type=int, default=5, help="Seconds between samples")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "heart_rate-2024-01-01.json")
+        samples = write_heart_rate_file(path, args.days, args.step)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{samples} samples, {size_mb:.1f} MB, ijson={'yes' if parsers.HAS_IJSON else 'no'}")
+
+        old_t, old_mem, old_df = measure(legacy_parse_heart_rate, path, args.repeat)
+        new_t, new_mem, new_df = measure(parsers.parse_heart_rate_intraday_summary, path, args.repeat)
+
+    pd.testing.assert_frame_equal(old_df, new_df, check_dtype=False, check_freq=False)
+    print(f"{'':10}{'time (ms)':>12}{'peak mem (MB)':>16}")
+    print(f"{'legacy':10}{old_t * 1000:>12.1f}{old_mem / 1e6:>16.1f}")
+    print(f"{'streaming':10}{new_t * 1000:>12.1f}{new_mem / 1e6:>16.1f}")
+    print(f"speedup x{old_t / new_t:.1f}, memory x{old_mem / max(new_mem, 1):.1f} lower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Micro-benchmark of the time_in_heart_rate_zone CSV parser.
+
+Compares the previous full pd.read_csv + per-row pd.to_datetime + groupby/unstack
+against parsers.parse_active_zones_csv(), which reads only the timestamp and
+zone columns (zone as a categorical), buckets minutes by their ISO date prefix
+and counts them per day and zone with np.bincount.
+
+Usage (from the server folder):
+    python benchmarks/bench_hr_zones.py [--days 31] [--repeat 10] [--offset Z]
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from modules import parsers
+from synthetic_export import ZONES
+
+
+def legacy_parse_active_zones_csv(file_path):
+    """The original parser, kept as the comparison baseline."""
+    df = pd.read_csv(file_path)
+    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
+    pivot = df.groupby(['date', 'heart rate zone type']).size().unstack(fill_value=0)
+    pivot.rename(columns={col: parsers.ZONE_COLUMNS.get(col, f"zone_{col.lower().replace(' ', '_')}")
+                          for col in pivot.columns}, inplace=True)
+    return pivot
+
+
+def write_zone_csv(path, days, offset):
+    """Writes a minute-level zone CSV spanning `days` days, like a Takeout export."""
+    rnd = random.Random(42)
+    start = date(2024, 1, 1)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "heart rate zone type", "data source"])
+        for d in range(days):
+            day = (start + timedelta(days=d)).isoformat()
+            for m in range(1440):
+                if rnd.random() < 0.6:
+                    writer.writerow([f"{day}T{m // 60:02d}:{m % 60:02d}:00{offset}",
+                                     rnd.choices(ZONES, [70, 20, 6, 2, 2])[0], "FITBIT"])
+
+
+def best_time(func, path, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(path)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=31, help="Days in the synthetic file")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--offset", default="Z",
+                        help="Timestamp suffix: 'Z', '' (no offset) or e.g. '+02:00' (slow path)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "time_in_heart_rate_zone_2024-01-01.csv")
+        write_zone_csv(path, args.days, args.offset)
+        size = os.path.getsize(path)
+        old_t, old_df = best_time(legacy_parse_active_zones_csv, path, args.repeat)
+        new_t, new_df = best_time(parsers.parse_active_zones_csv, path, args.repeat)
+    pd.testing.assert_frame_equal(old_df, new_df)
+
+    print(f"{int(old_df.to_numpy().sum())} rows ({args.days} days, {size / 1e6:.1f} MB)")
+    print(f"read_csv + to_datetime + unstack : {old_t * 1000:8.2f} ms")
+    print(f"usecols + prefix bincount        : {new_t * 1000:8.2f} ms")
+    print(f"speedup x{old_t / new_t:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmarks the intraday JSON engine (calories, steps, distance) against the
+previous json.load + DataFrame + groupby parsers.
+
+Times the per-file parsers and grouped_sum_by_day(), which decodes the files of
+one month into NumPy arrays and buckets their shared minute grid by day once.
+
+Usage (from the server folder):
+    python benchmarks/bench_intraday.py [--days 31] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from modules import parsers
+
+# File name prefix -> value generator of its synthetic minutes
+METRICS = {
+    "calories": lambda rnd: f"{rnd.uniform(0.9, 12.0):.3f}",
+    "steps": lambda rnd: str(rnd.randint(0, 120)),
+    "distance": lambda rnd: f"{rnd.uniform(0.0, 0.09):.4f}",
+}
+
+
+def legacy_sum_by_day(file_path):
+    """The previous parsers (json.load + DataFrame + groupby sum), kept as the comparison baseline."""
+    with open(file_path, 'r') as f:
+        data = json.load(f)
+    df = pd.DataFrame(data)
+    if df.empty:
+        return None
+    codes, days = parsers.day_buckets(df['dateTime'])
+    values = pd.to_numeric(df['value'], errors='coerce')
+    valid = codes >= 0
+    totals = values[valid].groupby(codes[valid]).sum()
+    index = days.take(totals.index.to_numpy())
+    index.name = 'date'
+    return pd.DataFrame({parsers.intraday_column(file_path): totals.to_numpy()}, index=index).sort_index()
+
+
+def grouped_sum_by_day(file_paths):
+    """
+    Daily totals of several intraday files in one pass, e.g. the steps,
+    distance and calories files of the same month. Not used by the ETL, which
+    parses (and caches) each collection separately.
+
+    Fitbit logs every metric on the same minute grid, so files whose timestamps
+    are identical (compared as one byte buffer) share a single day bucketing.
+
+    Args:
+        file_paths (list): '[{"dateTime", "value"}]' files, one column each (see parsers.intraday_column()).
+
+    Returns:
+        pd.DataFrame: Indexed by 'date' with one column per file, or None if every file is empty.
+    """
+    buckets = []  # (timestamps as a byte array, codes, days)
+    frames = []
+    for file_path in file_paths:
+        loaded = parsers.load_intraday(file_path)
+        if loaded is None:
+            continue
+        date_times, values = loaded
+        try:
+            raw = np.asarray(date_times, dtype='S')
+        except (UnicodeEncodeError, TypeError, ValueError):
+            raw = None
+        match = next((b for b in buckets if raw is not None and np.array_equal(b[0], raw)), None)
+        if match is None:
+            match = (raw, *parsers.intraday_day_buckets(date_times if raw is None else raw))
+            buckets.append(match)
+        frames.append(parsers.daily_totals(match[1], match[2], parsers.intraday_values(values),
+                                           parsers.intraday_column(file_path)))
+    if not frames:
+        return None
+    return pd.concat(frames, axis=1).sort_index()
+
+
+def write_intraday_files(folder, days):
+    """Writes one month-style file per metric, with one entry per minute."""
+    start = datetime(2024, 1, 1)
+    stamps = [(start + timedelta(minutes=m)).strftime('%m/%d/%y %H:%M:%S') for m in range(days * 1440)]
+    paths = []
+    for name, value in METRICS.items():
+        rnd = random.Random(name)
+        path = os.path.join(folder, f"{name}-{start:%Y-%m-%d}.json")
+        with open(path, 'w') as f:
+            json.dump([{"dateTime": ts, "value": value(rnd)} for ts in stamps], f)
+        paths.append(path)
+    return paths
+
+
+def best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=31, help="Days covered by each file")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_intraday_files(tmp, args.days)
+        size_mb = sum(os.path.getsize(p) for p in paths) / 1e6
+
+        old_t, old_df = best_time(lambda: pd.concat([legacy_sum_by_day(p) for p in paths], axis=1), args.repeat)
+        new_t, new_df = best_time(lambda: pd.concat([parsers.sum_by_day(*parsers.load_intraday(p),
+                                                                        parsers.intraday_column(p))
+                                                     for p in paths], axis=1), args.repeat)
+        group_t, group_df = best_time(lambda: grouped_sum_by_day(paths), args.repeat)
+
+    pd.testing.assert_frame_equal(old_df, new_df, check_freq=False)
+    pd.testing.assert_frame_equal(old_df, group_df, check_freq=False)
+    print(f"{len(paths)} files x {args.days * 1440} minutes, {size_mb:.1f} MB")
+    print(f"DataFrame + groupby (per file)  : {old_t * 1000:8.1f} ms")
+    print(f"NumPy engine (per file)         : {new_t * 1000:8.1f} ms  x{old_t / new_t:.1f}")
+    print(f"NumPy engine (one pass, grouped): {group_t * 1000:8.1f} ms  x{old_t / group_t:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmarks the merge stage of the ETL: etl.merge_datasets() (single k-way
+scatter onto the union date index, date filter applied first) against the
+previous chain of outer joins followed by filter_by_date().
+
+Usage (from the server folder):
+    python benchmarks/bench_merge.py [--years 10] [--collections 22] [--start-date 2024-01-01]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import config
+from modules import etl
+
+
+def legacy_merge(datasets):
+    """The original outer-join loop, kept as the comparison baseline."""
+    datasets = [d for d in datasets if not d.empty]
+    master_df = datasets[0]
+    for i in range(1, len(datasets)):
+        current = datasets[i]
+        if current.index.duplicated().any():
+            current = current.groupby(current.index).mean()
+        master_df = master_df.join(current, how='outer')
+    return etl.filter_by_date(master_df)
+
+
+def make_collections(years, count, seed=42):
+    """Builds `count` per-collection frames with 1-3 columns and partial date coverage."""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range('2015-01-01', periods=int(years * 365.25), freq='D', name='date')
+    collections = []
+    for i in range(count):
+        keep = np.sort(rng.choice(len(days), int(len(days) * rng.uniform(0.4, 1.0)), replace=False))
+        index = days[keep]
+        cols = {f"c{i}_{j}": rng.normal(size=len(index)) for j in range(rng.integers(1, 4))}
+        collections.append(pd.DataFrame(cols, index=index))
+    return collections
+
+
+def measure(func, datasets, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(datasets)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    func(datasets)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=float, default=10)
+    parser.add_argument("--collections", type=int, default=22)
+    parser.add_argument("--start-date", type=str, default=None, help="Optional START_DATE window")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config.START_DATE = args.start_date
+    config.END_DATE = None
+    datasets = make_collections(args.years, args.collections)
+
+    old_t, old_mem, old_df = measure(legacy_merge, datasets, args.repeat)
+    new_t, new_mem, new_df = measure(etl.merge_datasets, datasets, args.repeat)
+    pd.testing.assert_frame_equal(old_df, new_df, check_freq=False)
+
+    print(f"{args.collections} collections, {args.years:g} years, window from {args.start_date or 'start'}"
+          f" -> {new_df.shape[0]} rows x {new_df.shape[1]} columns")
+    print(f"{'':18}{'time (ms)':>12}{'peak mem (MB)':>16}")
+    print(f"{'outer-join chain':18}{old_t * 1000:>12.2f}{old_mem / 1e6:>16.2f}")
+    print(f"{'k-way merge':18}{new_t * 1000:>12.2f}{new_mem / 1e6:>16.2f}")
+    mem_delta = (new_mem - old_mem) / 1e6
+    print(f"speedup x{old_t / new_t:.1f}, peak memory {mem_delta:+.2f} MB "
+          f"({'higher' if mem_delta > 0 else 'lower'}, x{old_mem / max(new_mem, 1):.2f})")
+
+
+if __name__ == "__main__":
+    main()
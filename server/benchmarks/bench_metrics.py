@@ -0,0 +1,118 @@
+"""
+Benchmarks the metrics engine (calculate_readiness, calculate_metabolic_metrics,
+calculate_advanced_metrics) on a synthetic multi-year master dataset.
+
+Row-wise pandas entry points (DataFrame.apply, iterrows, itertuples) are
+disabled while the metrics run, so the benchmark fails if any metric falls
+back to a per-row Python loop.
+
+Usage (from the server folder):
+    python benchmarks/bench_metrics.py [--years 10] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import config
+from modules import metrics
+
+
+def make_master_frame(years, seed=42):
+    """Builds a master DataFrame shaped like etl.merge_all_data() output."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2015-01-01', periods=int(years * 365.25), freq='D', name='date')
+    n = len(index)
+
+    def sparse(values, coverage):
+        """Blanks out part of a series, like days without a sensor reading."""
+        return np.where(rng.random(n) < coverage, values, np.nan)
+
+    df = pd.DataFrame({
+        'resting_bpm': sparse(rng.normal(58, 4, n), 0.95),
+        'overall_score': sparse(rng.normal(78, 8, n), 0.9),
+        'weight': sparse(rng.normal(78, 2, n), 0.2),
+        'calories_total': rng.normal(2600, 350, n),
+        'very_active_minutes': rng.integers(0, 90, n),
+        'moderately_active_minutes': rng.integers(0, 60, n),
+        'lightly_active_minutes': rng.integers(60, 300, n),
+        'sedentary_minutes': rng.integers(500, 900, n),
+        'sleep_deep': rng.integers(30, 120, n),
+        'sleep_light': rng.integers(150, 300, n),
+        'sleep_rem': rng.integers(40, 130, n),
+        'sleep_awake': rng.integers(10, 80, n),
+        'rmssd': sparse(rng.normal(42, 9, n), 0.85),
+        'zone_fat_burn': rng.integers(0, 120, n),
+        'zone_cardio': rng.integers(0, 40, n),
+        'zone_peak': rng.integers(0, 15, n),
+        'temperature_variation': sparse(rng.normal(0, 0.4, n), 0.8),
+        'respiratory_rate': sparse(rng.normal(15, 1, n), 0.8),
+        'acwr_ratio': sparse(rng.normal(1.0, 0.25, n), 0.7),
+        'exercise_aef': sparse(rng.normal(2.2, 0.3, n), 0.4),
+    }, index=index)
+    return df
+
+
+def run_metrics(df):
+    df = metrics.calculate_readiness(df)
+    df = metrics.calculate_metabolic_metrics(df)
+    return metrics.calculate_advanced_metrics(df)
+
+
+def forbid_row_wise():
+    """Patches the row-wise pandas APIs so any use raises immediately."""
+    def fail(*args, **kwargs):
+        raise AssertionError("row-wise pandas call inside the metrics engine")
+    return [
+        mock.patch.object(pd.DataFrame, 'apply', fail),
+        mock.patch.object(pd.DataFrame, 'iterrows', fail),
+        mock.patch.object(pd.DataFrame, 'itertuples', fail),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=float, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config.USER_DOB, config.USER_GENDER = "1990-06-15", "male"
+    config.USER_HEIGHT_CM, config.USER_WEIGHT_KG = 180, 78.0
+
+    base = make_master_frame(args.years)
+    patches = forbid_row_wise()
+    for p in patches:
+        p.start()
+    try:
+        steps = [
+            ("calculate_readiness", metrics.calculate_readiness),
+            ("calculate_metabolic_metrics", metrics.calculate_metabolic_metrics),
+            ("calculate_advanced_metrics", metrics.calculate_advanced_metrics),
+        ]
+        timings = {name: float('inf') for name, _ in steps}
+        for _ in range(args.repeat):
+            df = base.copy()
+            for name, func in steps:
+                t0 = time.perf_counter()
+                df = func(df)
+                timings[name] = min(timings[name], time.perf_counter() - t0)
+    finally:
+        for p in patches:
+            p.stop()
+
+    object_cols = [c for c in df.columns if df[c].dtype == object]
+    print(f"{len(df)} days ({args.years:g} years), {len(df.columns)} columns, no row-wise calls")
+    for name, t in timings.items():
+        print(f"{name:30}{t * 1000:10.2f} ms")
+    print(f"{'total':30}{sum(timings.values()) * 1000:10.2f} ms")
+    if object_cols:
+        print(f"warning: object dtype columns {object_cols}")
+
+
+if __name__ == "__main__":
+    main()
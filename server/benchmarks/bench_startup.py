@@ -0,0 +1,131 @@
+"""
+Benchmarks the cold start of the API sidecar: the time from process launch
+until GET /api/health answers, and the import-time profile of `import api`
+(python -X importtime), listing the heaviest modules loaded at startup.
+
+Usage (from the server folder):
+    python benchmarks/bench_startup.py [--runs 5] [--port 8765] [--top 15] [--no-prewarm]
+                                       [--binary dist/fitstats-server] [--output startup.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that should not be needed to answer /api/health
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'seaborn', 'scipy', 'modules.etl', 'modules.briefing']
+
+
+def time_to_health(cmd, port, env, timeout=60.0):
+    """Launches the server and polls /api/health; returns the seconds until it answered."""
+    url = f"http://127.0.0.1:{port}/api/health"
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=SERVER_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server exited with code {proc.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1.0) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                time.sleep(0.005)
+        raise TimeoutError(f"/api/health did not answer within {timeout:.0f}s")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def import_profile(env):
+    """
+    Runs `python -X importtime -c "import api"` and parses its report.
+
+    Returns:
+        list: {"module", "depth", "self_ms", "cumulative_ms"} in report order.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import api"],
+                            cwd=SERVER_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part for part in line.replace("import time:", "|", 1).split("|"))
+        entries.append({
+            "module": name.strip(),
+            # The report indents nested imports by two spaces per level
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Server launches to time")
+    parser.add_argument("--port", type=int, default=8765, help="Port of the benchmarked server")
+    parser.add_argument("--top", type=int, default=15, help="Heaviest startup imports to list")
+    parser.add_argument("--no-prewarm", action="store_true",
+                        help="Disable the background import of the data modules (API_PREWARM_IMPORTS=0)")
+    parser.add_argument("--binary", type=str,
+                        help="Benchmark a built sidecar (e.g. dist/fitstats-server) instead of `python api.py`")
+    parser.add_argument("--output", type=str, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    env = dict(os.environ, API_PORT=str(args.port), API_PREWARM_IMPORTS="0" if args.no_prewarm else "1")
+    cmd = [os.path.abspath(args.binary)] if args.binary else [sys.executable, "api.py"]
+
+    # Warm-up launch: fills the OS file cache and the __pycache__ folders
+    time_to_health(cmd, args.port, env)
+    timings = [time_to_health(cmd, args.port, env) for _ in range(args.runs)]
+
+    imports = import_profile(env)
+    total = next((e["cumulative_ms"] for e in imports if e["module"] == "api"), None)
+    loaded = {e["module"] for e in imports}
+    direct = sorted((e for e in imports if e["depth"] == 1), key=lambda e: e["cumulative_ms"], reverse=True)
+
+    print(f"Time to /api/health ({' '.join(cmd)}, {args.runs} runs): "
+          f"min {min(timings) * 1000:.0f} ms, median {statistics.median(timings) * 1000:.0f} ms")
+    if total is not None:
+        print(f"import api: {total:.0f} ms")
+    print(f"\nHeaviest imports of api.py (cumulative):")
+    for entry in direct[:args.top]:
+        print(f"  {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+    heavy = [m for m in HEAVY_MODULES if m in loaded]
+    print(f"\nHeavy modules loaded at startup: {', '.join(heavy) if heavy else 'none'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "command": cmd,
+                "prewarm": not args.no_prewarm,
+                "time_to_health_s": timings,
+                "import_api_ms": total,
+                "heavy_modules": heavy,
+                "imports": direct[:args.top],
+            }, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+End-to-end ETL benchmark harness.
+
+Times every stage of the pipeline on a Fitbit export (a synthetic one is
+generated when --data-dir is omitted): each parser over its collection,
+load_collection's combine step, the merge, every metrics.calculate_* step,
+the exports and the briefing. Results are written as JSON so runs can be
+compared over time (--compare previous.json prints the deltas).
+
+Usage (from the server folder):
+    python benchmarks/run_benchmarks.py [--data-dir DIR | --years 1] [--output results.json]
+                                        [--compare baseline.json] [--workers 1]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from modules import briefing, etl, metrics
+from modules.context import RunContext
+from synthetic_export import generate_export
+
+
+class Recorder:
+    """Collects timing records as {stage, seconds, files, rows}."""
+
+    def __init__(self):
+        self.results = []
+
+    def time(self, stage, func, *args, repeat=1, files=None, **kwargs):
+        """Runs func `repeat` times, records the best wall time and returns the last result."""
+        best = float('inf')
+        result = None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            result = func(*args, **kwargs)
+            best = min(best, time.perf_counter() - t0)
+        rows = len(result) if isinstance(result, (pd.DataFrame, list)) else None
+        self.results.append({"stage": stage, "seconds": round(best, 6), "files": files, "rows": rows})
+        print(f"   {stage:70}{best * 1000:12.2f} ms")
+        return result
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def run(data_dir, out_dir, workers, repeat):
+    ctx = RunContext.from_config(data_dir=data_dir, out_dir=out_dir, start_date="", end_date="",
+                                 dob="1990-06-15", gender="male", height_cm=180, weight_kg=78.0)
+
+    rec = Recorder()
+
+    print("Parsers / load_collection")
+    datasets = []
+    for folder, pattern, func, label in etl.LOAD_PLAN:
+        files = etl._find_files(folder, pattern, ctx)
+        frames = rec.time(f"parse.{func.__name__} [{pattern}]",
+                          lambda: [etl._parse_file(func, f) for f in files], files=len(files))
+        datasets.append(rec.time(f"load_collection.combine [{pattern}]",
+                                 etl._combine_frames, frames, ctx, files=len(files)))
+
+    print("Merge")
+    rec.time("merge.merge_datasets", etl.merge_datasets, datasets, ctx, repeat=repeat)
+    df = rec.time(f"merge.merge_all_data (workers={workers}, no cache)",
+                  etl.merge_all_data, workers=workers, use_cache=False, ctx=ctx)
+
+    print("Metrics")
+    df = rec.time("metrics.calculate_readiness",
+                  lambda: metrics.calculate_readiness(df.copy()), repeat=repeat)
+    df = rec.time("metrics.calculate_metabolic_metrics",
+                  lambda: metrics.calculate_metabolic_metrics(df.copy(), ctx), repeat=repeat)
+    df = rec.time("metrics.calculate_advanced_metrics",
+                  lambda: metrics.calculate_advanced_metrics(df.copy()), repeat=repeat)
+
+    print("Exports")
+    rec.time("export.export_analysis", etl.export_analysis, df, export_csv=False, ctx=ctx, repeat=repeat)
+    rec.time("export.export_analysis (with CSV)", etl.export_analysis, df, export_csv=True, ctx=ctx, repeat=repeat)
+    rec.time("export.export_to_json", etl.export_to_json, df, ctx, repeat=repeat)
+
+    print("Briefing")
+    rec.time("briefing.load_data", briefing.load_data, ctx, repeat=repeat)
+    briefing.get_dataset_cache(ctx).invalidate()
+    rec.time("briefing.get_daily_brief (cold)", briefing.get_daily_brief, ctx=ctx)
+    rec.time("briefing.get_daily_brief (cached)", briefing.get_daily_brief, ctx=ctx, repeat=repeat * 20)
+    last = df.index[-1]
+    rec.time("briefing.get_brief_range (30 days)", briefing.get_brief_range,
+             (last - pd.Timedelta(days=29)).strftime('%Y-%m-%d'), last.strftime('%Y-%m-%d'), ctx=ctx, repeat=repeat)
+
+    return rec.results, df
+
+
+def compare(results, baseline_path):
+    """Prints per-stage deltas against a previous results file."""
+    with open(baseline_path) as f:
+        baseline = {r["stage"]: r["seconds"] for r in json.load(f)["results"]}
+    print(f"\nComparison with {baseline_path}")
+    for r in results:
+        old = baseline.get(r["stage"])
+        if not old:
+            continue
+        delta = (r["seconds"] - old) / old * 100
+        flag = "  <-- slower" if delta > 10 else ""
+        print(f"   {r['stage']:70}{old * 1000:10.2f} -> {r['seconds'] * 1000:10.2f} ms ({delta:+6.1f}%){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FitStats ETL benchmark harness")
+    parser.add_argument("--data-dir", type=str, help="Existing export to benchmark (default: synthetic)")
+    parser.add_argument("--years", type=float, default=1.0, help="Synthetic export length")
+    parser.add_argument("--hr-interval", type=int, default=10, help="Synthetic heart rate sampling (s)")
+    parser.add_argument("--workers", type=int, default=1, help="Workers for the merge_all_data run")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions of the cheap stages")
+    parser.add_argument("--output", type=str, default="benchmark_results.json")
+    parser.add_argument("--compare", type=str, help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir
+        if not data_dir:
+            data_dir = os.path.join(tmp, "export")
+            print(f"Generating a {args.years:g}-year synthetic export...")
+            generate_export(data_dir, args.years, hr_interval=args.hr_interval)
+        out_dir = os.path.join(tmp, "out")
+        os.makedirs(out_dir)
+
+        t0 = time.perf_counter()
+        results, df = run(data_dir, out_dir, args.workers, args.repeat)
+        total = time.perf_counter() - t0
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "data_dir": args.data_dir or f"synthetic ({args.years:g} years, hr every {args.hr_interval}s)",
+            "workers": args.workers,
+            "days": len(df),
+            "columns": len(df.columns),
+            "total_seconds": round(total, 3),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output} ({total:.1f}s total)")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
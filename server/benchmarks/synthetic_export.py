@@ -0,0 +1,197 @@
+"""
+Writes a synthetic Fitbit export tree covering every folder and file pattern
+of etl.LOAD_PLAN, so the ETL can be benchmarked without a personal export.
+
+Layout mirrors a real export:
+    Global Export Data/           monthly minute-level steps/distance/calories,
+                                  monthly daily summaries, daily heart_rate files
+    Sleep Score/, Stress Score/,
+    Oxygen Saturation (SpO2)/,
+    Heart Rate Variability/       daily CSV summaries
+    Physical Activity_GoogleData/ daily CSVs + per-day minute-level HR zone CSVs
+
+Usage (from the server folder):
+    python benchmarks/synthetic_export.py OUT_DIR [--years 1] [--hr-interval 10] [--seed 42]
+"""
+import argparse
+import os
+import random
+from datetime import date, timedelta
+
+GLOBAL = "Global Export Data"
+GOOGLE = "Physical Activity_GoogleData"
+ZONES = ["OUT_OF_RANGE", "FAT_BURN", "CARDIO", "PEAK", "LIGHT"]
+DAILY_ACTIVITY = ["very_active_minutes", "moderately_active_minutes",
+                  "lightly_active_minutes", "sedentary_minutes"]
+
+
+def _mdy(day, seconds=0):
+    """Fitbit intraday timestamp: 'MM/DD/YY HH:MM:SS'."""
+    return f"{day.strftime('%m/%d/%y')} {seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _write_json_rows(path, rows):
+    """Writes pre-serialized JSON objects as an array (much faster than json.dump of dicts)."""
+    _write(path, "[" + ",".join(rows) + "]")
+
+
+def _write_csv(path, header, rows):
+    _write(path, ",".join(header) + "\n" + "".join(",".join(map(str, r)) + "\n" for r in rows))
+
+
+def _months(days):
+    """Groups consecutive days by calendar month, like Fitbit's monthly files."""
+    months = {}
+    for d in days:
+        months.setdefault((d.year, d.month), []).append(d)
+    return list(months.values())
+
+
+def generate_export(root, years=1.0, start=None, hr_interval=10, seed=42):
+    """
+    Writes a synthetic export under `root`.
+
+    Args:
+        root (str): Output folder (the equivalent of DATA_DIR).
+        years (float): Covered period.
+        start (date): First day. Defaults to `years` before 2025-01-01.
+        hr_interval (int): Seconds between intraday heart rate samples.
+        seed (int): Random seed, the same arguments always produce the same files.
+
+    Returns:
+        dict: Summary with the number of days and files written.
+    """
+    rnd = random.Random(seed)
+    n_days = max(1, int(years * 365.25))
+    start = start or date(2025, 1, 1) - timedelta(days=n_days)
+    days = [start + timedelta(days=i) for i in range(n_days)]
+    g = os.path.join(root, GLOBAL)
+    files = 0
+
+    for month in _months(days):
+        first = month[0].isoformat()
+
+        # Minute-level intraday series (1440 rows per day)
+        for metric, lo, hi, decimals in [("calories", 1.0, 9.0, 2), ("steps", 0, 120, 0), ("distance", 0.0, 0.09, 4)]:
+            rows = []
+            for d in month:
+                for m in range(1440):
+                    value = rnd.uniform(lo, hi) if m % 7 else lo
+                    value = round(value, decimals) if decimals else int(value)
+                    rows.append(f'{{"dateTime":"{_mdy(d, m * 60)}","value":"{value}"}}')
+            _write_json_rows(os.path.join(g, f"{metric}-{first}.json"), rows)
+            files += 1
+
+        # Daily summaries
+        for metric in DAILY_ACTIVITY:
+            hi = 900 if metric == "sedentary_minutes" else 120
+            rows = [f'{{"dateTime":"{_mdy(d)}","value":"{rnd.randint(0, hi)}"}}' for d in month]
+            _write_json_rows(os.path.join(g, f"{metric}-{first}.json"), rows)
+            files += 1
+
+        rows = [f'{{"dateTime":"{_mdy(d)}","value":{{"date":"{d.strftime("%m/%d/%y")}",'
+                f'"value":{rnd.uniform(52, 64):.3f},"error":{rnd.uniform(1, 3):.3f}}}}}' for d in month]
+        _write_json_rows(os.path.join(g, f"resting_heart_rate-{first}.json"), rows)
+
+        rows = [f'{{"logId":{i},"weight":{rnd.uniform(165, 175):.1f},"bmi":{rnd.uniform(23, 25):.2f},'
+                f'"date":"{d.strftime("%m/%d/%y")}","time":"07:30:00","source":"Aria"}}'
+                for i, d in enumerate(month) if rnd.random() < 0.4]
+        _write_json_rows(os.path.join(g, f"weight-{first}.json"), rows)
+
+        rows = []
+        for d in month:
+            deep, light, rem, wake = (rnd.randint(40, 110), rnd.randint(180, 280),
+                                      rnd.randint(50, 120), rnd.randint(20, 70))
+            rows.append(f'{{"dateOfSleep":"{d.isoformat()}","levels":{{"summary":{{'
+                        f'"deep":{{"minutes":{deep}}},"light":{{"minutes":{light}}},'
+                        f'"rem":{{"minutes":{rem}}},"wake":{{"minutes":{wake}}}}}}}}}')
+        _write_json_rows(os.path.join(g, f"sleep-{first}.json"), rows)
+
+        rows = [f'{{"startTime":"{_mdy(d, 7 * 3600)}","duration":{rnd.randint(20, 90) * 60000},'
+                f'"calories":{rnd.randint(150, 700)},"averageHeartRate":{rnd.randint(110, 160)}}}'
+                for d in month if rnd.random() < 0.5]
+        _write_json_rows(os.path.join(g, f"exercise-{month[0].strftime('%Y%m')}.json"), rows)
+        files += 4
+
+    # Daily intraday heart rate files
+    for d in days:
+        rows = [f'{{"dateTime":"{_mdy(d, s)}","value":{{"bpm":{rnd.randint(48, 165)},"confidence":{rnd.randint(0, 3)}}}}}'
+                for s in range(0, 86400, hr_interval) if rnd.random() > 0.03]
+        _write_json_rows(os.path.join(g, f"heart_rate-{d.isoformat()}.json"), rows)
+        files += 1
+
+    # Daily CSV summaries
+    def iso(d):
+        return f"{d.isoformat()}T07:00:00Z"
+
+    _write_csv(os.path.join(root, "Sleep Score", "sleep_score.csv"),
+               ["sleep_log_entry_id", "timestamp", "overall_score", "composition_score",
+                "deep_sleep_in_minutes", "restlessness"],
+               [[i, iso(d), rnd.randint(55, 92), rnd.randint(15, 25), rnd.randint(40, 110),
+                 round(rnd.uniform(0.02, 0.12), 4)] for i, d in enumerate(days)])
+    _write_csv(os.path.join(root, "Stress Score", "Stress Score.csv"),
+               ["DATE", "UPDATED_AT", "STRESS_SCORE", "SLEEP_POINTS", "RESPONSIVENESS_POINTS"],
+               [[f"{d.isoformat()}T00:00:00", f"{d.isoformat()}T09:12:00",
+                 rnd.choice([0, rnd.randint(60, 95)]), rnd.randint(10, 30), rnd.randint(10, 30)] for d in days])
+    files += 2
+
+    for month in _months(days):
+        first, last = month[0].isoformat(), month[-1].isoformat()
+        _write_csv(os.path.join(root, "Oxygen Saturation (SpO2)", f"Daily SpO2 - {first}-{last}.csv"),
+                   ["timestamp", "average_value", "lower_bound", "upper_bound"],
+                   [[iso(d), round(rnd.uniform(94, 98), 1), 92.0, 99.5] for d in month])
+        _write_csv(os.path.join(root, "Heart Rate Variability", f"Daily Heart Rate Variability Summary - {first}.csv"),
+                   ["timestamp", "rmssd", "nremhr", "entropy"],
+                   [[f"{d.isoformat()}T00:00:00", round(rnd.uniform(25, 60), 3), round(rnd.uniform(50, 60), 3),
+                     round(rnd.uniform(2, 3), 3)] for d in month])
+        files += 2
+
+    google = os.path.join(root, GOOGLE)
+    _write_csv(os.path.join(google, "cardio_acute_chronic_workload_ratio.csv"),
+               ["timestamp", "ratio", "label", "data source"],
+               [[iso(d), round(rnd.uniform(0.6, 1.6), 3), "OPTIMAL", "FITBIT"] for d in days])
+    _write_csv(os.path.join(google, "demographic_vo2max.csv"),
+               ["timestamp", "demographic vo2max", "data source"],
+               [[iso(d), round(rnd.uniform(42, 48), 2), "FITBIT"] for d in days])
+    _write_csv(os.path.join(google, "daily_readiness.csv"),
+               ["timestamp", "score", "type", "readiness level"],
+               [[iso(d), rnd.randint(30, 95), "DAILY", "MEDIUM"] for d in days])
+    _write_csv(os.path.join(google, "daily_respiratory_rate.csv"),
+               ["timestamp", "breaths per minute", "data source"],
+               [[iso(d), round(rnd.uniform(13, 17), 2), "FITBIT"] for d in days])
+    _write_csv(os.path.join(google, "daily_sleep_temperature_derivations.csv"),
+               ["timestamp", "nightly temperature celsius", "baseline temperature celsius", "data source"],
+               [[iso(d), round(rnd.uniform(33.5, 35.5), 3), 34.4, "FITBIT"] for d in days])
+    files += 5
+
+    # Minute-by-minute heart rate zones (only the minutes spent in a zone are logged)
+    for d in days:
+        rows = [[f"{d.isoformat()}T{m // 60:02d}:{m % 60:02d}:00Z", rnd.choices(ZONES, [70, 20, 6, 2, 2])[0], "FITBIT"]
+                for m in range(1440) if rnd.random() < 0.6]
+        _write_csv(os.path.join(google, f"time_in_heart_rate_zone_{d.isoformat()}.csv"),
+                   ["timestamp", "heart rate zone type", "data source"], rows)
+        files += 1
+
+    return {"days": n_days, "start": start.isoformat(), "files": files}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic Fitbit export generator")
+    parser.add_argument("out_dir", help="Folder to write the export into (DATA_DIR)")
+    parser.add_argument("--years", type=float, default=1.0)
+    parser.add_argument("--hr-interval", type=int, default=10, help="Seconds between heart rate samples")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    summary = generate_export(args.out_dir, args.years, hr_interval=args.hr_interval, seed=args.seed)
+    print(f"Wrote {summary['files']} files covering {summary['days']} days from {summary['start']} to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,40 @@ DATA_DIR = os.environ.get("DATA_DIR", "data")
 START_DATE = os.environ.get("START_DATE", None)
 END_DATE = os.environ.get("END_DATE", None)
 
+# Parser processes used by the ETL (1 = serial, 0 = one per CPU core)
+ETL_WORKERS = int(os.environ.get("ETL_WORKERS", 1))
+
+# ETL jobs (profiles) the API server runs at the same time; each may use ETL_WORKERS parsers
+ETL_MAX_CONCURRENT_JOBS = int(os.environ.get("ETL_MAX_CONCURRENT_JOBS", 2))
+
+# API sidecar address (api.py run directly / PyInstaller binary)
+API_HOST = os.environ.get("API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("API_PORT", 8000))
+# Import pandas and the ETL/briefing modules in the background once the API is up
+# (0 = on the first request that needs them)
+API_PREWARM_IMPORTS = os.environ.get("API_PREWARM_IMPORTS", "1") not in ("0", "false", "False")
+
+# Per-profile output directories. Defaults to <CLIENT_PUBLIC_DIR>/profiles when empty
+PROFILES_DIR = os.environ.get("PROFILES_DIR", "")
+
+# Persistent per-file parse cache (reused across runs, invalidated on file or parser changes)
+PARSE_CACHE = os.environ.get("PARSE_CACHE", "1") not in ("0", "false", "False")
+# Defaults to <USER_CACHE_DIR>/parse_cache when empty (never inside CLIENT_PUBLIC_DIR, which the client serves)
+PARSE_CACHE_DIR = os.environ.get("PARSE_CACHE_DIR", "")
+
+# watch.py: quiet period that closes a batch of file changes, and the longest a batch may wait
+WATCH_DEBOUNCE_SECONDS = float(os.environ.get("WATCH_DEBOUNCE_SECONDS", 2.0))
+WATCH_MAX_DELAY_SECONDS = float(os.environ.get("WATCH_MAX_DELAY_SECONDS", 30.0))
+
+# Also export the analysis dataset as fitbit_analysis.csv (the briefing reads the binary store)
+EXPORT_ANALYSIS_CSV = os.environ.get("EXPORT_ANALYSIS_CSV", "0") in ("1", "true", "True")
+
+# Dashboard payload: "columnar" (manifest + column-array chunks) or "records" (legacy dashboard_data.json)
+DASHBOARD_FORMAT = os.environ.get("DASHBOARD_FORMAT", "columnar")
+# Columnar payload: one chunk per year (0 = single chunk) and float precision
+DASHBOARD_CHUNK_BY_YEAR = os.environ.get("DASHBOARD_CHUNK_BY_YEAR", "1") not in ("0", "false", "False")
+DASHBOARD_DECIMALS = int(os.environ.get("DASHBOARD_DECIMALS", 3))
+
 # User Metrics (Mifflin-St Jeor) - MUST BE SET VIA API/CONFIG
 USER_HEIGHT_CM = int(os.environ.get("USER_HEIGHT_CM", 0))
 USER_WEIGHT_KG = float(os.environ.get("USER_WEIGHT_KG", 0.0))
@@ -29,3 +63,14 @@ if getattr(sys, 'frozen', False):
     os.makedirs(CLIENT_PUBLIC_DIR, exist_ok=True)
 else:
     CLIENT_PUBLIC_DIR = os.environ.get("CLIENT_PUBLIC_DIR", os.path.join("..", "client", "public"))
+
+# Machine-local caches (the parse cache holds raw health data: keep it out of the served CLIENT_PUBLIC_DIR)
+if platform.system() == "Windows":
+    _cache_home = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "com.fitstats", "cache")
+elif platform.system() == "Darwin":
+    _cache_home = os.path.join(os.path.expanduser("~"), "Library", "Caches", "com.fitstats")
+else:
+    _cache_home = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                               "com.fitstats")
+USER_CACHE_DIR = os.environ.get("USER_CACHE_DIR", _cache_home)
+PARSE_CACHE_DIR = PARSE_CACHE_DIR or os.path.join(USER_CACHE_DIR, "parse_cache")
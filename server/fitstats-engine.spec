@@ -6,11 +6,15 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=['ijson.backends.yajl2_c', 'ijson.backends.python'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        # Not used by the engine: keep them (and their Qt/Tk backends) out of the bundle
+        'matplotlib', 'seaborn', 'scipy', 'tkinter', 'IPython', 'jupyter_client', 'notebook',
+        'PIL', 'pytest',
+    ],
     noarchive=False,
     optimize=0,
 )
@@ -11,12 +11,20 @@ a = Analysis(
         'uvicorn.protocols', 'uvicorn.protocols.http', 'uvicorn.protocols.http.auto',
         'uvicorn.protocols.websockets', 'uvicorn.protocols.websockets.auto',
         'uvicorn.lifespan', 'uvicorn.lifespan.on',
-        'modules.briefing', 'modules.etl', 'modules.metrics', 'modules.parsers'
+        # Imported lazily by api.py (on first use or by the background prewarm)
+        'modules.briefing', 'modules.etl', 'modules.metrics', 'modules.parsers',
+        'modules.pipeline', 'modules.query', 'modules.dashboard', 'modules.store',
+        'modules.parse_cache', 'modules.instrumentation',
+        'ijson.backends.yajl2_c', 'ijson.backends.python'
     ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        # Not used by the engine: keep them (and their Qt/Tk backends) out of the bundle
+        'matplotlib', 'seaborn', 'scipy', 'tkinter', 'IPython', 'jupyter_client', 'notebook',
+        'PIL', 'pytest',
+    ],
     noarchive=False,
     optimize=0,
 )
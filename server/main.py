@@ -1,42 +1,29 @@
 import argparse
-import os
+import multiprocessing
 import sys
-from modules import etl, metrics
-import config
+from modules import pipeline
+from modules.context import RunContext
 
 import json
 
 
-def load_session_config():
-    """Loads biometric properties from the local session_config.json if available."""
-    config_path = os.path.join(config.CLIENT_PUBLIC_DIR, "session_config.json")
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                sc = json.load(f)
-                config.USER_DOB = sc.get('dob', config.USER_DOB)
-                config.USER_HEIGHT_CM = sc.get('height', config.USER_HEIGHT_CM)
-                config.USER_WEIGHT_KG = sc.get('weight', config.USER_WEIGHT_KG)
-                config.USER_GENDER = sc.get('gender', config.USER_GENDER)
-                config.DATA_DIR = sc.get('data_path', config.DATA_DIR)
-                print(
-                    f"   -> Loaded session config: DOB {config.USER_DOB}, {config.USER_HEIGHT_CM}cm, {config.USER_WEIGHT_KG}kg, {config.USER_GENDER}")
-        except Exception as e:
-            print(f"Error loading session config: {e}")
-
-
 def progress(pct, msg):
     """Emit a structured progress line for the API to parse and broadcast via WebSocket."""
     print(f"PROGRESS:{pct}:{msg}", flush=True)
 
 
-def main():
-    """Entrypoint for the Fitbit Stats ETL Engine. Orchestrates data merging, metric calculation, and output export."""
-    parser = argparse.ArgumentParser(description="Fitbit Stats ETL Engine")
+def report_stage(record):
+    """Emit a structured per-stage metrics line (wall/CPU time, memory, files, rows)."""
+    print(f"STAGE:{json.dumps(record)}", flush=True)
+
+
+def build_parser(description="Fitbit Stats ETL Engine"):
+    """Returns the command line parser of the engine (shared with watch.py)."""
+    parser = argparse.ArgumentParser(description=description)
     parser.add_argument("--data-dir", type=str,
                         help="Directory containing Fitbit JSON exports")
     parser.add_argument("--out-dir", type=str,
-                        help="Directory to save dashboard_data.json")
+                        help="Directory to save the dashboard data")
     parser.add_argument("--dob", type=str,
                         help="User Date of Birth (YYYY-MM-DD)")
     parser.add_argument("--height", type=int,
@@ -48,66 +35,50 @@ def main():
     parser.add_argument("--start-date", type=str,
                         help="Start date (YYYY-MM-DD)")
     parser.add_argument("--end-date", type=str, help="End date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int,
+                        help="Parser processes (1 = serial, 0 = one per CPU core)")
+    parser.add_argument("--export-csv", action="store_true",
+                        help="Also export fitbit_analysis.csv next to the binary analysis store")
+    parser.add_argument("--dashboard-format", type=str, choices=["columnar", "records"],
+                        help="Dashboard payload: compact column chunks + manifest, or legacy dashboard_data.json")
+    return parser
+
+
+def context_from_args(args):
+    """Builds the run context: the saved session config, overridden by the CLI arguments provided."""
+    return RunContext.from_session_config(
+        data_dir=args.data_dir, out_dir=args.out_dir,
+        dob=args.dob, height_cm=args.height or None, weight_kg=args.weight or None, gender=args.gender,
+        start_date=args.start_date, end_date=args.end_date,
+        workers=args.workers, export_csv=args.export_csv or None, dashboard_format=args.dashboard_format)
 
-    args = parser.parse_args()
 
-    # 0. Load shared session config first
+def main():
+    """Entrypoint for the Fitbit Stats ETL Engine. Orchestrates data merging, metric calculation, and output export."""
+    args = build_parser().parse_args()
+
+    # 0. Load shared session config first, overridden by CLI arguments if provided
     progress(5, "Loading configuration")
-    load_session_config()
-
-    # Override with CLI arguments if provided
-    if args.data_dir:
-        config.DATA_DIR = args.data_dir
-    if args.out_dir:
-        config.CLIENT_PUBLIC_DIR = args.out_dir
-    if args.dob:
-        config.USER_DOB = args.dob
-    if args.height:
-        config.USER_HEIGHT_CM = args.height
-    if args.weight:
-        config.USER_WEIGHT_KG = args.weight
-    if args.gender:
-        config.USER_GENDER = args.gender
-    if args.start_date:
-        config.START_DATE = args.start_date
-    if args.end_date:
-        config.END_DATE = args.end_date
+    ctx = context_from_args(args)
+    print(f"   -> Configuration: DOB {ctx.dob}, {ctx.height_cm}cm, {ctx.weight_kg}kg, {ctx.gender}")
 
     # Validation: Ensure we have the metrics
-    if not config.USER_DOB or not config.USER_HEIGHT_CM or not config.USER_GENDER or not config.USER_WEIGHT_KG:
+    if not ctx.has_biometrics:
         print(
             "\n[main.py] ERROR: Biometric metrics (dob, height, weight, gender) are not set.")
         print("Please provide them via CLI or ensure session_config.json contains them.\n")
         return
 
-    # 1. Load & Merge
-    progress(10, "Loading and merging data files")
-    df = etl.merge_all_data(progress_callback=progress)
+    # 1. Load & Merge, 2. Calculate Metrics, 3. Export
+    df, _ = pipeline.run_pipeline(progress_callback=progress, stage_callback=report_stage, ctx=ctx)
 
     if df is not None:
-        # 2. Calculate Metrics
-        progress(70, "Calculating readiness metrics")
-        df = metrics.calculate_readiness(df)
-
-        progress(75, "Calculating metabolic metrics")
-        df = metrics.calculate_metabolic_metrics(df)
-
-        progress(80, "Calculating advanced metrics")
-        df = metrics.calculate_advanced_metrics(df)
-
-        # 3. Preview
+        # 4. Preview
         cols = ['resting_bpm', 'readiness_raw', 'bmr',
                 'active_calories', 'sleep_efficiency', 'autonomic_balance']
         print("\n=== HEAD ===")
         print(df[[c for c in cols if c in df.columns]].head())
 
-        # 4. Export
-        progress(90, "Exporting analysis CSV")
-        df.to_csv("fitbit_analysis.csv")  # Required for BRIEFING module
-
-        progress(95, "Exporting dashboard JSON")
-        etl.export_to_json(df)
-
         progress(100, "Complete")
     else:
         print("[main.py] ERROR: No valid data found in the specified directory.", file=sys.stderr)
@@ -115,4 +86,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the parser process pool inside the PyInstaller binary
+    multiprocessing.freeze_support()
     main()
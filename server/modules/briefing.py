@@ -1,14 +1,36 @@
 import pandas as pd
+import numpy as np
 import os
-import json
+import threading
 from datetime import datetime
 
-import config
+from modules import store
+from modules.context import RunContext
 
 # ==========================================
 # CONFIGURATION
 # ==========================================
-DATA_FILE = os.path.join(config.CLIENT_PUBLIC_DIR, "fitbit_analysis.csv")
+# Columns whose full-history mean/std drive the Z-Score statuses
+STAT_COLUMNS = ['resting_bpm', 'rmssd', 'overall_score']
+
+# Z-Score metrics of the briefing and their direction
+STATUS_METRICS = {
+    'resting_bpm': 'lower_is_better',
+    'rmssd': 'higher_is_better',
+    'overall_score': 'higher_is_better',
+}
+
+# Other values shown by the briefing, returned as-is by the range endpoint
+BRIEF_VALUE_COLUMNS = [
+    'stress_score', 'sleep_deep', 'sleep_rem', 'readiness_raw',
+    'calories_total', 'active_calories', 'intensity_index', 'weight',
+]
+
+# Compact status encoding used by get_brief_range()
+STATUS_LEGEND = ["N/A", "EXCELLENT", "NORMAL", "WARNING"]
+STATUS_EMOJI = ["⚪️", "🟢", "⚪️", "🔴"]
+# readiness_raw is coded on its own legend, with the labels of get_daily_brief()
+READINESS_LEGEND = ["N/A", "READY", "FATIGUED"]
 
 def get_status_emoji(value, mean, std, metric_type='lower_is_better'):
     """
@@ -32,6 +54,25 @@ def get_status_emoji(value, mean, std, metric_type='lower_is_better'):
             return "🔴", "WARNING"
         return "⚪️", "NORMAL"
 
+def get_status_codes(values, mean, std, metric_type='lower_is_better'):
+    """
+    Vectorized get_status_emoji(): Z-Score statuses of a whole array at once.
+
+    Returns:
+        np.ndarray: int8 indexes into STATUS_LEGEND / STATUS_EMOJI.
+    """
+    values = np.asarray(values, dtype='float64')
+    if pd.isna(mean) or pd.isna(std) or std == 0:
+        return np.zeros(len(values), dtype='int8')
+
+    z_score = (values - mean) / std
+    good, bad = (z_score < -1.0, z_score > 1.0)
+    if metric_type != 'lower_is_better':
+        good, bad = (z_score > 1.0, z_score < -1.0)
+    codes = np.select([np.isnan(values), good, bad], [0, 1, 3], default=2)
+    return codes.astype('int8')
+
+
 def calculate_age(dob_str, target_date):
     """ Calculates age correctly at the given target_date. """
     try:
@@ -42,58 +83,224 @@ def calculate_age(dob_str, target_date):
     except:
         return 0
 
-def load_data():
-    """Loads the processed fitbit_analysis.csv dataset and indexes it by date."""
-    if not os.path.exists(DATA_FILE):
+def load_data(ctx=None):
+    """
+    Loads the processed dataset indexed by date.
+
+    Reads the binary columnar store written by the ETL in the context's output
+    directory, falling back to fitbit_analysis.csv for outputs produced by
+    older versions.
+    """
+    ctx = ctx or RunContext.from_config()
+    df = store.read_store(store.get_store_path(ctx.out_dir))
+    if df is not None:
+        return df
+
+    data_file = os.path.join(ctx.out_dir, store.CSV_FILENAME)
+    if not os.path.exists(data_file):
         return None
 
-    df = pd.read_csv(DATA_FILE)
+    df = pd.read_csv(data_file)
     df['date'] = pd.to_datetime(df['date'])
     df.set_index('date', inplace=True)
     return df
 
-def load_metrics(target_date=None):
-    """ Loads user metrics from session_config.json and calculates age relative to target_date. """
-    metrics = {"age": "N/A", "gender": "N/A", "height": "N/A"}
-    config_path = os.path.join(config.CLIENT_PUBLIC_DIR, "session_config.json")
-    if os.path.exists(config_path):
+class BriefingDataset:
+    """An immutable snapshot of the master DataFrame plus its column statistics."""
+
+    def __init__(self, df):
+        self.df = df
+        self.stats = {
+            col: (df[col].mean(), df[col].std()) for col in STAT_COLUMNS if col in df.columns
+        }
+
+    def column_stats(self, col):
+        """Returns (mean, std) of a column over the whole history, NaNs if unavailable."""
+        return self.stats.get(col, (float('nan'), float('nan')))
+
+
+class DatasetCache:
+    """
+    Keeps the latest master dataset in memory for the API server.
+
+    The ETL pushes its result with set() when a run completes; readers always
+    get a complete snapshot since the swap is a single reference assignment.
+    If the store on disk is rewritten by another process (watcher, CLI engine),
+    the next get() reloads it.
+
+    Args:
+        ctx (RunContext): Profile whose output directory is served. None follows
+                          config.CLIENT_PUBLIC_DIR.
+    """
+
+    def __init__(self, ctx=None):
+        self.ctx = ctx
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._source_mtime = None
+
+    def _context(self):
+        return self.ctx or RunContext.from_config()
+
+    def _store_mtime(self):
         try:
-            with open(config_path, "r") as f:
-                sc = json.load(f)
-                dob = sc.get("dob")
-                if dob and target_date:
-                    metrics["age"] = calculate_age(dob, target_date)
-                else:
-                    metrics["age"] = sc.get("age", "N/A")
-
-                metrics["gender"] = sc.get("gender", "N/A")
-                metrics["height"] = sc.get("height", "N/A")
-        except:
-            pass
+            return os.stat(store.get_store_path(self._context().out_dir)).st_mtime_ns
+        except OSError:
+            return None
+
+    def set(self, df):
+        """Publishes a freshly computed dataset (e.g. at the end of an ETL run)."""
+        snapshot = BriefingDataset(df)
+        with self._lock:
+            self._snapshot = snapshot
+            self._source_mtime = self._store_mtime()
+
+    def invalidate(self):
+        """Drops the in-memory dataset; the next get() reloads it from disk."""
+        with self._lock:
+            self._snapshot = None
+            self._source_mtime = None
+
+    def get(self):
+        """
+        Returns the current BriefingDataset, loading it from disk when needed.
+
+        Returns:
+            BriefingDataset: The snapshot, or None if no dataset has been computed yet.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and self._source_mtime == self._store_mtime():
+            return snapshot
+
+        with self._lock:
+            mtime = self._store_mtime()
+            if self._snapshot is None or self._source_mtime != mtime:
+                df = load_data(self._context())
+                self._snapshot = BriefingDataset(df) if df is not None else None
+                self._source_mtime = mtime
+            return self._snapshot
+
+
+dataset_cache = DatasetCache()
+
+_profile_caches = {}
+_profile_caches_lock = threading.Lock()
+
+
+def get_dataset_cache(ctx=None):
+    """Returns the DatasetCache serving ctx's output directory (the default dataset_cache for None)."""
+    if ctx is None:
+        return dataset_cache
+    key = os.path.abspath(ctx.out_dir)
+    with _profile_caches_lock:
+        cache = _profile_caches.get(key)
+        if cache is None:
+            cache = _profile_caches[key] = DatasetCache(ctx)
+        return cache
+
+
+def load_metrics(target_date=None, ctx=None):
+    """
+    Returns the user metrics of the briefing, with the age calculated relative to target_date.
+
+    Args:
+        ctx (RunContext): Profile biometrics. Defaults to the session_config.json saved by the UI.
+    """
+    ctx = ctx or RunContext.from_session_config()
+    metrics = {"age": "N/A", "gender": ctx.gender or "N/A", "height": ctx.height_cm or "N/A"}
+    if ctx.dob and target_date:
+        metrics["age"] = calculate_age(ctx.dob, target_date)
     return metrics
 
-def get_daily_brief(target_date_str=None):
-    """Generates a structured daily briefing summary."""
-    df = load_data()
-    if df is None:
+def _json_values(values, decimals=2):
+    """Rounds an array and converts it to a JSON-friendly list (NaN -> None)."""
+    values = np.round(np.asarray(values, dtype='float64'), decimals)
+    return [None if v != v else v for v in values.tolist()]
+
+
+def get_brief_range(start_str=None, end_str=None, dataset=None, ctx=None):
+    """
+    Computes the briefing values and Z-Score statuses for every day of a range in one pass.
+
+    Args:
+        start_str (str): First day (inclusive). Defaults to the first available day.
+        end_str (str): Last day (inclusive). Defaults to the latest available day.
+        dataset (BriefingDataset): Snapshot to use. Defaults to the in-memory cache of ctx.
+        ctx (RunContext): Profile to brief, see get_dataset_cache().
+
+    Returns:
+        dict: Column arrays aligned on 'dates'. Statuses are int codes into 'legend',
+              except 'readiness_raw', coded into 'readinessLegend' (READY above 0,
+              FATIGUED otherwise) so a day gets the same status as in get_daily_brief().
+    """
+    if dataset is None:
+        dataset = get_dataset_cache(ctx).get()
+    if dataset is None:
         return {"error": "Data file not found. Run ETL first."}
+    df = dataset.df
 
-    # Select target date
+    lo = df.index.searchsorted(pd.to_datetime(start_str)) if start_str else 0
+    hi = df.index.searchsorted(pd.to_datetime(end_str), side='right') if end_str else len(df)
+    window = df.iloc[lo:hi]
+
+    statuses = {}
+    values = {}
+    for col, metric_type in STATUS_METRICS.items():
+        if col not in window.columns:
+            continue
+        col_values = window[col].to_numpy(dtype='float64')
+        values[col] = _json_values(col_values)
+        statuses[col] = get_status_codes(
+            col_values, *dataset.column_stats(col), metric_type).tolist()
+
+    for col in BRIEF_VALUE_COLUMNS:
+        if col in window.columns:
+            values[col] = _json_values(window[col].to_numpy(dtype='float64'))
+
+    if 'readiness_raw' in window.columns:
+        readiness = window['readiness_raw'].to_numpy(dtype='float64')
+        statuses['readiness_raw'] = np.select(
+            [np.isnan(readiness), readiness > 0], [0, 1], default=2).astype('int8').tolist()
+
+    return {
+        "dates": window.index.strftime('%Y-%m-%d').tolist(),
+        "values": values,
+        "statuses": statuses,
+        "legend": STATUS_LEGEND,
+        "legendEmoji": STATUS_EMOJI,
+        "readinessLegend": READINESS_LEGEND,
+    }
+
+
+def get_daily_brief(target_date_str=None, dataset=None, ctx=None):
+    """
+    Generates a structured daily briefing summary.
+
+    Args:
+        target_date_str (str): Date to brief (closest preceding day if missing). Defaults to the latest day.
+        dataset (BriefingDataset): Snapshot to use. Defaults to the in-memory cache of ctx.
+        ctx (RunContext): Profile to brief (dataset and biometrics). Defaults to the
+                          session saved in config.CLIENT_PUBLIC_DIR.
+    """
+    if dataset is None:
+        dataset = get_dataset_cache(ctx).get()
+    if dataset is None:
+        return {"error": "Data file not found. Run ETL first."}
+    df = dataset.df
+
+    # Select target date (the index is sorted: binary search for the closest preceding day)
+    pos = len(df) - 1
     if target_date_str:
         try:
-            t_date = pd.to_datetime(target_date_str)
-            if t_date not in df.index:
-                # Find the closest preceding date
-                t_date = df.index[df.index <= t_date].max()
-            latest_day = df.loc[t_date]
+            found = df.index.searchsorted(pd.to_datetime(target_date_str), side='right') - 1
+            if found >= 0:
+                pos = found
         except:
-            latest_day = df.iloc[-1]
-            t_date = df.index[-1]
-    else:
-        latest_day = df.iloc[-1]
-        t_date = df.index[-1]
+            pass
+    latest_day = df.iloc[pos]
+    t_date = df.index[pos]
 
-    user_metrics = load_metrics(t_date)
+    user_metrics = load_metrics(t_date, ctx)
     display_date = t_date.strftime('%d %B %Y')
     profile_str = f"{user_metrics['age']}yo {user_metrics['gender']}"
 
@@ -105,7 +312,7 @@ def get_daily_brief(target_date_str=None):
     # RHR
     rhr = latest_day.get('resting_bpm')
     if pd.notna(rhr):
-        emoji, status = get_status_emoji(rhr, df['resting_bpm'].mean(), df['resting_bpm'].std(), 'lower_is_better')
+        emoji, status = get_status_emoji(rhr, *dataset.column_stats('resting_bpm'), 'lower_is_better')
         physiology_metrics.append({
             "label": "Resting HR",
             "value": f"{rhr:.1f} bpm",
@@ -116,7 +323,7 @@ def get_daily_brief(target_date_str=None):
     # HRV
     hrv = latest_day.get('rmssd')
     if pd.notna(hrv):
-        emoji, status = get_status_emoji(hrv, df['rmssd'].mean(), df['rmssd'].std(), 'higher_is_better')
+        emoji, status = get_status_emoji(hrv, *dataset.column_stats('rmssd'), 'higher_is_better')
         physiology_metrics.append({
             "label": "HRV (rMSSD)",
             "value": f"{hrv:.1f} ms",
@@ -146,7 +353,7 @@ def get_daily_brief(target_date_str=None):
     sleep_advice = None
     
     if pd.notna(sleep_score):
-        emoji, status = get_status_emoji(sleep_score, df['overall_score'].mean(), df['overall_score'].std(), 'higher_is_better')
+        emoji, status = get_status_emoji(sleep_score, *dataset.column_stats('overall_score'), 'higher_is_better')
         
         deep = latest_day.get('sleep_deep', 0)
         rem = latest_day.get('sleep_rem', 0)
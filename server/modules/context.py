@@ -0,0 +1,101 @@
+import json
+import os
+from dataclasses import dataclass, field, replace
+
+import config
+
+SESSION_CONFIG_FILENAME = "session_config.json"
+
+# session_config.json key -> RunContext field
+SESSION_FIELDS = {
+    "dob": "dob",
+    "height": "height_cm",
+    "weight": "weight_kg",
+    "gender": "gender",
+    "data_path": "data_dir",
+}
+
+
+@dataclass(frozen=True)
+class RunContext:
+    """
+    Everything an ETL run or a briefing needs to know about one profile: input
+    export, output directory, analysis window, user biometrics and engine options.
+
+    The ETL, metrics and briefing modules read these values from the context they
+    are given instead of the module-level `config`, so several runs (profiles,
+    exports) can proceed concurrently in one process. Defaults come from `config`
+    (i.e. the environment) at creation time; the context itself is immutable,
+    use replace() to derive a modified copy.
+    """
+
+    data_dir: str = field(default_factory=lambda: config.DATA_DIR)
+    out_dir: str = field(default_factory=lambda: config.CLIENT_PUBLIC_DIR)
+    start_date: str = field(default_factory=lambda: config.START_DATE)
+    end_date: str = field(default_factory=lambda: config.END_DATE)
+
+    dob: str = field(default_factory=lambda: config.USER_DOB)
+    height_cm: int = field(default_factory=lambda: config.USER_HEIGHT_CM)
+    weight_kg: float = field(default_factory=lambda: config.USER_WEIGHT_KG)
+    gender: str = field(default_factory=lambda: config.USER_GENDER)
+
+    workers: int = field(default_factory=lambda: config.ETL_WORKERS)
+    parse_cache: bool = field(default_factory=lambda: config.PARSE_CACHE)
+    parse_cache_dir: str = field(default_factory=lambda: config.PARSE_CACHE_DIR)
+    export_csv: bool = field(default_factory=lambda: config.EXPORT_ANALYSIS_CSV)
+    dashboard_format: str = field(default_factory=lambda: config.DASHBOARD_FORMAT)
+    dashboard_chunk_by_year: bool = field(default_factory=lambda: config.DASHBOARD_CHUNK_BY_YEAR)
+    dashboard_decimals: int = field(default_factory=lambda: config.DASHBOARD_DECIMALS)
+
+    @classmethod
+    def from_config(cls, **overrides):
+        """Builds a context from `config`, overridden by the non-None keyword arguments."""
+        return cls(**{k: v for k, v in overrides.items() if v is not None})
+
+    @classmethod
+    def from_session_config(cls, session_dir=None, **overrides):
+        """
+        Builds a context from `config` and the session_config.json saved by the UI.
+
+        Args:
+            session_dir (str): Directory holding session_config.json, also used as
+                               out_dir unless overridden. Defaults to config.CLIENT_PUBLIC_DIR.
+            **overrides: Field values taking precedence over the session file (None is ignored).
+
+        Returns:
+            RunContext: The merged context.
+        """
+        values = {"out_dir": session_dir}
+        session = load_session_config(session_dir or config.CLIENT_PUBLIC_DIR)
+        for key, name in SESSION_FIELDS.items():
+            if session.get(key) is not None:
+                values[name] = session[key]
+        values.update({k: v for k, v in overrides.items() if v is not None})
+        return cls.from_config(**values)
+
+    def replace(self, **changes):
+        """Returns a copy of the context with the given fields changed."""
+        return replace(self, **changes)
+
+    @property
+    def has_biometrics(self):
+        """True if every value needed by the BMR calculation is set."""
+        return bool(self.dob and self.height_cm and self.gender and self.weight_kg)
+
+
+def load_session_config(out_dir):
+    """
+    Reads the session_config.json saved by the UI.
+
+    Returns:
+        dict: The session values, empty if the file is missing or unreadable.
+    """
+    config_path = os.path.join(out_dir, SESSION_CONFIG_FILENAME)
+    if not os.path.exists(config_path):
+        return {}
+    try:
+        with open(config_path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading session config: {e}")
+        return {}
@@ -0,0 +1,218 @@
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from modules import metrics
+
+MANIFEST_FILENAME = "dashboard_manifest.json"
+RECORDS_FILENAME = "dashboard_data.json"
+CHUNK_PREFIX = "dashboard_data_"
+AGGREGATES_FILENAME = "dashboard_aggregates.json"
+
+# Bump when the layout of the manifest or of the chunks changes
+FORMAT_VERSION = 1
+
+
+def encode_column(values, decimals):
+    """
+    Converts a column to a JSON-ready list: floats rounded to `decimals`,
+    whole-number columns as ints, NaN as None.
+    """
+    if values.dtype.kind not in 'iuf':
+        return [None if v is None or v != v else v for v in values.tolist()]
+
+    values = values.astype('float64', copy=False)
+    nan = np.isnan(values)
+    present = values[~nan]
+    if np.array_equal(present, np.floor(present)) and (present.size == 0 or np.abs(present).max() < 2 ** 53):
+        # Counts (steps, minutes, ...): '1234' instead of '1234.0'
+        ints = np.where(nan, 0, values).astype('int64').tolist()
+        return ints if not nan.any() else [None if m else v for v, m in zip(ints, nan.tolist())]
+
+    rounded = np.round(values, decimals).tolist()
+    return rounded if not nan.any() else [None if m else v for v, m in zip(rounded, nan.tolist())]
+
+
+def _write_text(path, text):
+    """Writes a file atomically (readers never see a half-written file)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _remove(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _stale_chunks(out_dir, keep):
+    return [os.path.join(out_dir, name) for name in os.listdir(out_dir)
+            if name.startswith(CHUNK_PREFIX) and name.endswith(".json") and name not in keep]
+
+
+def output_files(out_dir):
+    """Returns the dashboard files (manifest, chunks, legacy JSON) present in out_dir."""
+    if not os.path.isdir(out_dir):
+        return []
+    return [os.path.join(out_dir, n) for n in sorted(os.listdir(out_dir))
+            if (n.startswith(CHUNK_PREFIX) or n in (MANIFEST_FILENAME, RECORDS_FILENAME, AGGREGATES_FILENAME))
+            and n.endswith(".json")]
+
+
+def write_columnar(df, out_dir, chunk_by_year=True, decimals=3):
+    """
+    Writes the dashboard dataset as column arrays split into chunks, plus a manifest.
+
+    Every chunk holds {"dates": [...], "columns": {name: [...]}}: column names
+    appear once instead of once per day, floats are rounded to `decimals` and
+    whole-number columns are written as ints. The manifest lists the chunks
+    (one per year, or a single one) with their date range and row count, so a
+    client can load only the years it needs. It is written last: a reader that
+    gets the manifest always finds its chunks.
+
+    Args:
+        df (pd.DataFrame): Master dataset indexed by date.
+        out_dir (str): Output directory.
+        chunk_by_year (bool): One chunk per calendar year instead of a single chunk.
+        decimals (int): Float precision.
+
+    Returns:
+        list: Paths of the written files, the manifest last.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Columns are converted once, chunks are slices of the lists (the index is sorted)
+    dates = df.index.strftime('%Y-%m-%d').tolist()
+    columns = {col: encode_column(df[col].to_numpy(), decimals) for col in df.columns}
+
+    if chunk_by_year and len(df):
+        years = df.index.year.to_numpy()
+        bounds = np.flatnonzero(np.diff(years)) + 1
+        starts, ends = [0, *bounds.tolist()], [*bounds.tolist(), len(df)]
+        groups = [(str(years[lo]), lo, hi) for lo, hi in zip(starts, ends)]
+    else:
+        groups = [("all", 0, len(df))]
+
+    chunks, written = [], []
+    for key, lo, hi in groups:
+        name = f"{CHUNK_PREFIX}{key}.json"
+        path = os.path.join(out_dir, name)
+        payload = {"dates": dates[lo:hi], "columns": {col: values[lo:hi] for col, values in columns.items()}}
+        _write_text(path, json.dumps(payload, separators=(',', ':'), allow_nan=False))
+        written.append(path)
+        chunks.append({
+            "file": name,
+            "start": dates[lo] if hi > lo else None,
+            "end": dates[hi - 1] if hi > lo else None,
+            "rows": hi - lo,
+        })
+
+    manifest = {
+        "version": FORMAT_VERSION,
+        "format": "columnar",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "rows": len(df),
+        "start": chunks[0]["start"],
+        "end": chunks[-1]["end"],
+        "columns": list(df.columns),
+        "decimals": decimals,
+        "chunks": chunks,
+    }
+    manifest_path = os.path.join(out_dir, MANIFEST_FILENAME)
+    _write_text(manifest_path, json.dumps(manifest, separators=(',', ':')))
+    written.append(manifest_path)
+
+    # Outputs of a previous run or format would outlive this one
+    _remove(_stale_chunks(out_dir, {c["file"] for c in chunks}) + [os.path.join(out_dir, RECORDS_FILENAME)])
+    return written
+
+
+def write_records(df, out_dir):
+    """
+    Writes the legacy records-oriented dashboard_data.json (one object per day).
+
+    Returns:
+        list: The written path.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    export_df = df.reset_index()
+    export_df['date'] = export_df['date'].dt.strftime('%Y-%m-%d')
+
+    path = os.path.join(out_dir, RECORDS_FILENAME)
+    export_df.to_json(path, orient='records')
+
+    # The client prefers the manifest: drop columnar outputs of a previous run
+    _remove(_stale_chunks(out_dir, set()) + [os.path.join(out_dir, MANIFEST_FILENAME)])
+    return [path]
+
+
+def _per_column(frame, decimals):
+    """Turns a (statistic x column) DataFrame into {column: {statistic: value}}."""
+    rows = {label: encode_column(frame.loc[label].to_numpy(), decimals) for label in frame.index}
+    return {col: {label: values[i] for label, values in rows.items()} for i, col in enumerate(frame.columns)}
+
+
+def write_aggregates(aggregates, out_dir, decimals=3):
+    """
+    Writes the precomputed dashboard statistics (see
+    metrics.calculate_dashboard_aggregates) to dashboard_aggregates.json.
+
+    Layout: {"stats": {column: {min, p33, p66, max}},
+             "summary": {column: {count, avg, min, max, last, last_date}},
+             "weekly"/"monthly": {"periods": [...], "days": [...], "columns": {name: [...]}}}
+
+    Returns:
+        list: The written path.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    summary = _per_column(aggregates["summary"], decimals)
+    for col, date in aggregates["last_date"].items():
+        summary[col]["last_date"] = None if pd.isna(date) else date.strftime('%Y-%m-%d')
+
+    payload = {
+        "version": FORMAT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "decimals": decimals,
+        "stats": _per_column(aggregates["stats"], decimals),
+        "summary": summary,
+    }
+    for name in metrics.DASHBOARD_ROLLUPS:
+        means, days = aggregates[name]
+        payload[name] = {
+            "periods": means.index.strftime('%Y-%m-%d').tolist(),
+            "days": days.tolist(),
+            "columns": {col: encode_column(means[col].to_numpy(), decimals) for col in means.columns},
+        }
+
+    path = os.path.join(out_dir, AGGREGATES_FILENAME)
+    _write_text(path, json.dumps(payload, separators=(',', ':'), allow_nan=False))
+    return [path]
+
+
+def sync_outputs(paths, target_dir):
+    """
+    Mirrors freshly written dashboard files into target_dir (e.g. the production
+    'dist' build) by copying them instead of serializing the data again.
+
+    The target receives the same cleanup as the output directory: dashboard
+    files that were not just written are removed from it.
+    """
+    # Manifest last, like in the output directory
+    synced = []
+    for path in sorted(paths, key=lambda p: os.path.basename(p) == MANIFEST_FILENAME):
+        target = os.path.join(target_dir, os.path.basename(path))
+        shutil.copy2(path, f"{target}.tmp")
+        os.replace(f"{target}.tmp", target)
+        synced.append(target)
+
+    names = {os.path.basename(p) for p in paths}
+    _remove([p for p in output_files(target_dir) if os.path.basename(p) not in names])
+    return synced
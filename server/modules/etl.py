@@ -1,18 +1,85 @@
+import functools
 import glob
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
 import config
-from modules import parsers
-
-
-def filter_by_date(df):
+from modules import dashboard, metrics, parsers, store
+from modules.context import RunContext
+from modules.instrumentation import PipelineRecorder
+from modules.parse_cache import ParseCache, get_cache_dir, remove_legacy_cache
+
+# ISO dates embedded in export file names (calories-2024-01-01.json, Daily SpO2 - 2024-01-01-2024-02-01.csv)
+FILENAME_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Slack around a file's date window (e.g. a sleep logged on the evening before the file date)
+FILE_WINDOW_MARGIN = pd.Timedelta(days=1)
+
+
+
+class ETLCancelled(Exception):
+    """Raised when a run is cancelled through its cancel event."""
+
+
+def check_cancelled(cancel_event):
+    """Raises ETLCancelled if the (threading.Event-like) cancel_event is set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise ETLCancelled("ETL run cancelled")
+
+
+# Define Loading Plan: (Folder, Pattern, Parser, Label)
+LOAD_PLAN = [
+    ("Global Export Data", "resting_heart_rate-*.json",
+     parsers.parse_resting_heart_rate, "Resting heart rate"),
+    ("Global Export Data", "heart_rate-*.json",
+     parsers.parse_heart_rate_intraday_summary, "Heart rate intraday"),
+    ("Global Export Data", "steps-*.json", parsers.parse_steps_json, "Steps"),
+    ("Global Export Data", "distance-*.json", parsers.parse_distance_json, "Distance"),
+    ("Global Export Data", "exercise-*.json", parsers.parse_exercise_json, "Exercise sessions"),
+    ("Global Export Data", "weight-*.json", parsers.parse_weight, "Weight"),
+    ("Global Export Data", "calories-*.json", parsers.parse_calories_intraday, "Calories"),
+    ("Sleep Score", "sleep_score.csv", parsers.parse_sleep_score_csv, "Sleep scores"),
+    ("Global Export Data", "sleep-*.json", parsers.parse_sleep_json_detailed, "Sleep stages"),
+    ("Oxygen Saturation (SpO2)", "Daily SpO2 - *.csv", parsers.parse_spo2_csv, "SpO2"),
+    ("Heart Rate Variability",
+     "Daily Heart Rate Variability Summary - *.csv", parsers.parse_hrv_csv, "HRV"),
+    ("Stress Score", "Stress Score.csv", parsers.parse_stress_csv, "Stress scores"),
+    ("Global Export Data", "very_active_minutes-*.json",
+     parsers.parse_simple_activity_json, "Active minutes"),
+    ("Global Export Data", "moderately_active_minutes-*.json",
+     parsers.parse_simple_activity_json, "Moderate activity"),
+    ("Global Export Data", "lightly_active_minutes-*.json",
+     parsers.parse_simple_activity_json, "Light activity"),
+    ("Global Export Data", "sedentary_minutes-*.json",
+     parsers.parse_simple_activity_json, "Sedentary minutes"),
+    ("Physical Activity_GoogleData",
+     "cardio_acute_chronic_workload_ratio.csv", parsers.parse_acwr_csv, "ACWR"),
+    ("Physical Activity_GoogleData",
+     "demographic_vo2max.csv", parsers.parse_vo2max_csv, "VO2 Max"),
+    ("Physical Activity_GoogleData",
+     "daily_readiness.csv", parsers.parse_readiness_csv, "Readiness"),
+    ("Physical Activity_GoogleData", "daily_respiratory_rate.csv",
+     parsers.parse_respiratory_rate_csv, "Respiratory rate"),
+    ("Physical Activity_GoogleData", "daily_sleep_temperature_derivations.csv",
+     parsers.parse_skin_temperature_csv, "Skin temperature"),
+    ("Physical Activity_GoogleData", "time_in_heart_rate_zone_*.csv",
+     parsers.parse_active_zones_csv, "HR zones"),
+]
+
+
+
+def filter_by_date(df, ctx=None):
     """
-    Filters the DataFrame based on the configured START_DATE and optional END_DATE.
+    Filters the DataFrame based on the run's start_date and optional end_date.
 
     Ensures the DataFrame has a valid DatetimeIndex before applying the mask.
 
     Args:
         df (pd.DataFrame): The DataFrame to filter.
+        ctx (RunContext): The run context. Defaults to one built from config.
 
     Returns:
         pd.DataFrame: A new DataFrame containing only rows within the date range.
@@ -25,22 +92,260 @@ def filter_by_date(df):
         except:
             return df
 
+    ctx = ctx or RunContext.from_config()
     mask = None
-    if config.START_DATE:
-        mask = (df.index >= config.START_DATE)
+    if ctx.start_date:
+        mask = (df.index >= ctx.start_date)
 
-    if config.END_DATE:
+    if ctx.end_date:
         if mask is not None:
-            mask = mask & (df.index <= config.END_DATE)
+            mask = mask & (df.index <= ctx.end_date)
         else:
-            mask = (df.index <= config.END_DATE)
+            mask = (df.index <= ctx.end_date)
 
     if mask is not None:
         return df.loc[mask]
     return df
 
 
-def load_collection(folder_name, file_pattern, parser_func):
+def _date_window(ctx):
+    """Returns the run's (start_date, end_date) as Timestamps (None when unset)."""
+    start = pd.Timestamp(ctx.start_date) if ctx.start_date else None
+    end = pd.Timestamp(ctx.end_date) if ctx.end_date else None
+    return start, end
+
+
+def prune_files_by_date(files, ctx=None):
+    """
+    Drops the files whose date window cannot intersect the run's date range.
+
+    The window of a file comes from the dates in its name: a 'from-to' pair is
+    used as-is, while a single date (monthly 'calories-2024-01-01.json', daily
+    'heart_rate-2024-01-01.json') spans until the next file's date of the same
+    collection (open-ended for the last one). Files without a date in their
+    name are always kept. The original file order is preserved.
+
+    Args:
+        files (list): Paths of a collection.
+        ctx (RunContext): The run context. Defaults to one built from config.
+
+    Returns:
+        list: The files that may contain rows inside the configured range.
+    """
+    start, end = _date_window(ctx or RunContext.from_config())
+    if start is None and end is None:
+        return files
+
+    file_dates = {f: [pd.Timestamp(d) for d in FILENAME_DATE_RE.findall(os.path.basename(f))]
+                  for f in files}
+    single_starts = sorted({d[0] for d in file_dates.values() if len(d) == 1})
+
+    kept = []
+    for f in files:
+        dates = file_dates[f]
+        if not dates:
+            kept.append(f)
+            continue
+        first = dates[0]
+        if len(dates) > 1:
+            last = dates[-1]
+        else:
+            later = [d for d in single_starts if d > first]
+            last = later[0] if later else None
+
+        if end is not None and first - FILE_WINDOW_MARGIN > end:
+            continue
+        if start is not None and last is not None and last + FILE_WINDOW_MARGIN < start:
+            continue
+        kept.append(f)
+    return kept
+
+
+def _find_files(folder_name, file_pattern, ctx):
+    """
+    Returns the files of a collection that may hold rows inside the run's
+    date range, in the same order used by every loading mode.
+    """
+    search_path = os.path.join(ctx.data_dir, folder_name, file_pattern)
+    return prune_files_by_date(glob.glob(search_path), ctx)
+
+
+def _clip_to_window(chunk, ctx):
+    """Makes a parsed chunk timezone-naive and drops its rows outside the run's date range."""
+    if chunk is None:
+        return None
+    if isinstance(chunk.index, pd.DatetimeIndex) and chunk.index.tz is not None:
+        chunk = chunk.copy()
+        chunk.index = chunk.index.tz_localize(None)
+    chunk = filter_by_date(chunk, ctx)
+    return chunk if not chunk.empty else None
+
+
+def _parse_file(parser_func, file_path):
+    """
+    Runs a parser on a single file, swallowing and logging parse errors.
+
+    Kept at module level so it can be shipped to worker processes.
+
+    Returns:
+        pd.DataFrame: The parsed chunk, or None if the file yielded no data.
+    """
+    try:
+        chunk = parser_func(file_path)
+    except Exception as e:
+        print(f"Error {file_path}: {e}")
+        return None
+    if chunk is None or chunk.empty:
+        return None
+    return chunk
+
+
+def _parse_file_timed(parser_func, file_path):
+    """
+    Worker-side wrapper of _parse_file() that also measures the wall and CPU
+    time spent in the worker process.
+
+    Returns:
+        tuple: (chunk, wall_s, cpu_s)
+    """
+    t0, cpu0 = time.perf_counter(), time.process_time()
+    chunk = _parse_file(parser_func, file_path)
+    return chunk, time.perf_counter() - t0, time.process_time() - cpu0
+
+
+def _format_eta(seconds):
+    """Formats a remaining time as '<1s', '45s', '3m 05s' or '1h 02m'."""
+    if seconds < 1:
+        return "<1s"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+
+
+class LoadProgress:
+    """
+    Per-file progress of the loading stage, weighted by file size.
+
+    The completed share is bytes done / bytes of every file in the load plan,
+    mapped into the START_PCT - END_PCT band of the run. The ETA divides the
+    bytes left by the parse throughput measured since the tracker was created;
+    cached files count as done at once and are left out of the throughput.
+    Reports are throttled to one every MIN_INTERVAL seconds, so thousands of
+    small files do not flood the progress callback.
+    """
+
+    START_PCT = 10
+    END_PCT = 65
+    MIN_INTERVAL = 0.5
+    # No ETA before this much parsing time was measured
+    MIN_ETA_SECONDS = 1.0
+
+    def __init__(self, progress_callback, file_lists, labels):
+        """
+        Args:
+            progress_callback: Callable(pct, msg), or None to only track.
+            file_lists (list): Files of every load_plan entry (see _find_files()).
+            labels (list): Label of every load_plan entry.
+        """
+        self.progress_callback = progress_callback
+        self.labels = labels
+        self.sizes = [[_file_size(f) for f in files] for files in file_lists]
+        self.total_bytes = sum(sum(sizes) for sizes in self.sizes)
+        self.done_bytes = 0
+        self.parsed_bytes = 0
+        self.done_files = [0] * len(file_lists)
+        self.started = time.perf_counter()
+        self.last_report = None
+
+    def advance(self, i, j, parsed=True):
+        """
+        Records the completion of file j of load_plan entry i, and reports progress when due.
+
+        Args:
+            i (int): Index of the load_plan entry.
+            j (int): Index of the file in the entry's file list.
+            parsed (bool): False for a file taken from the parse cache.
+        """
+        size = self.sizes[i][j]
+        self.done_bytes += size
+        self.done_files[i] += 1
+        if parsed:
+            self.parsed_bytes += size
+
+        now = time.perf_counter()
+        if self.last_report is None or now - self.last_report >= self.MIN_INTERVAL:
+            self.report(i, now)
+
+    def report(self, i, now=None):
+        """Reports the current progress, naming load_plan entry i."""
+        self.last_report = now or time.perf_counter()
+        if self.progress_callback:
+            self.progress_callback(self.pct(), self.message(i, self.last_report))
+
+    def pct(self):
+        """Returns the overall progress of the run, within the loading band."""
+        share = self.done_bytes / self.total_bytes if self.total_bytes else 1.0
+        return self.START_PCT + int(share * (self.END_PCT - self.START_PCT))
+
+    def eta(self, now=None):
+        """Returns the estimated seconds left, or None while the throughput is unknown."""
+        elapsed = (now or time.perf_counter()) - self.started
+        if not self.parsed_bytes or elapsed < self.MIN_ETA_SECONDS:
+            return None
+        return (self.total_bytes - self.done_bytes) / (self.parsed_bytes / elapsed)
+
+    def message(self, i, now=None):
+        """Returns e.g. 'Loading Heart rate intraday (120/340 files, ETA 8s)'."""
+        detail = f"{self.done_files[i]}/{len(self.sizes[i])} files"
+        eta = self.eta(now)
+        if eta is not None:
+            detail += f", ETA {_format_eta(eta)}"
+        return f"Loading {self.labels[i]} ({detail})"
+
+
+def _file_size(file_path):
+    """Returns the size of a file in bytes, 0 if it vanished since it was listed."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def _combine_frames(frames, ctx):
+    """
+    Concatenates the parsed chunks of a collection into a clean time-series.
+
+    Each chunk is made timezone-naive (to allow merging different sources) and
+    clipped to the run's date range before concatenation. The index is
+    then deduplicated: the order of `frames` matters, on overlapping dates the
+    last chunk wins. A collection without any row in the range still returns
+    its (empty) columns.
+    """
+    parsed = [f for f in frames if f is not None]
+    frames = [_clip_to_window(f, ctx) for f in parsed]
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        if not parsed:
+            return pd.DataFrame()
+        # No row in the window: keep the columns, merge_datasets() turns them into all-NaN columns
+        columns = list(dict.fromkeys(col for f in parsed for col in f.columns))
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name='date'), dtype='float64')
+
+    full_df = pd.concat(frames)
+
+    # Deduplicate index: Keep the last entry if overlaps occur
+    if full_df.index.duplicated().any():
+        full_df = full_df[~full_df.index.duplicated(keep='last')]
+
+    full_df = full_df.sort_index()
+    return full_df
+
+
+def load_collection(folder_name, file_pattern, parser_func, cache=None, stats=None, cancel_event=None,
+                    ctx=None, files=None, progress=None):
     """
     Scans a specific folder for files matching a pattern, parses them,
     and aggregates them into a single DataFrame.
@@ -49,53 +354,167 @@ def load_collection(folder_name, file_pattern, parser_func):
     to ensure a clean time-series.
 
     Args:
-        folder_name (str): Subfolder name within DATA_DIR.
+        folder_name (str): Subfolder name within the run's data_dir.
         file_pattern (str): Glob pattern (e.g., "*.json").
         parser_func (function): Function to parse a single file into a DataFrame.
+        cache (ParseCache): Optional parse cache; only new or changed files are parsed.
+        stats (dict): Optional dict filled with the 'files' and 'cached' counts.
+        cancel_event (threading.Event): Checked between files; raises ETLCancelled when set.
+        ctx (RunContext): The run context. Defaults to one built from config.
+        files (list): The files to load. Defaults to the collection's files (see _find_files()).
+        progress: Optional callable(j, parsed) called once file j of `files` is loaded,
+                  parsed=False when it came from the cache (see LoadProgress.advance()).
 
     Returns:
         pd.DataFrame: Combined and sorted DataFrame for the specific metric.
     """
-    search_path = os.path.join(config.DATA_DIR, folder_name, file_pattern)
-    files = glob.glob(search_path)
+    ctx = ctx or RunContext.from_config()
+    if files is None:
+        files = _find_files(folder_name, file_pattern, ctx)
+    if stats is not None:
+        stats.update(files=len(files), cached=0)
     if not files:
         return pd.DataFrame()
 
-    print(f"   Loading {len(files)} files for {file_pattern}...")
+    cached = cache.lookup(folder_name, file_pattern, parser_func, files) if cache else {}
+    if stats is not None:
+        stats["cached"] = len(cached)
+    print(f"   Loading {len(files)} files for {file_pattern} ({len(cached)} cached)...")
 
     frames = []
-    for f in files:
-        try:
-            chunk = parser_func(f)
-            if chunk is not None and not chunk.empty:
-                frames.append(chunk)
-        except Exception as e:
-            print(f"Error {f}: {e}")
+    for j, f in enumerate(files):
+        if f not in cached and cancel_event is not None and cancel_event.is_set():
+            # Keep what was parsed so far, the next run starts from there
+            if cache:
+                cache.store(folder_name, file_pattern, parser_func, dict(zip(files, frames)))
+            check_cancelled(cancel_event)
+        frames.append(cached[f] if f in cached else _parse_file(parser_func, f))
+        if progress:
+            progress(j, f not in cached)
+
+    if cache:
+        cache.store(folder_name, file_pattern, parser_func, dict(zip(files, frames)))
+    return _combine_frames(frames, ctx)
+
+
+def resolve_workers(workers=None):
+    """
+    Resolves the number of parser processes to use.
 
-    if not frames:
-        return pd.DataFrame()
+    Args:
+        workers (int): Requested worker count. None falls back to config.ETL_WORKERS,
+                       0 or a negative value means "one per CPU core".
 
-    full_df = pd.concat(frames)
+    Returns:
+        int: The effective worker count (always >= 1).
+    """
+    if workers is None:
+        workers = config.ETL_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, workers)
 
-    # Normalize Timezone (Make naive) to allow merging different sources
-    if isinstance(full_df.index, pd.DatetimeIndex) and full_df.index.tz is not None:
-        full_df.index = full_df.index.tz_localize(None)
 
-    # Deduplicate index: Keep the last entry if overlaps occur
-    if full_df.index.duplicated().any():
-        full_df = full_df[~full_df.index.duplicated(keep='last')]
+def load_collections_parallel(load_plan, workers, progress_callback=None, cache=None, recorder=None,
+                              cancel_event=None, ctx=None):
+    """
+    Parallel counterpart of calling load_collection() for every load_plan entry.
 
-    full_df = full_df.sort_index()
-    return full_df
+    Every file of every collection becomes an independent task on a process pool,
+    so a collection with thousands of files is spread over all workers instead of
+    waiting behind the others. Chunks are re-assembled in glob order before being
+    combined, which keeps the result identical to the serial path.
 
+    Args:
+        load_plan (list): (Folder, Pattern, Parser, Label) tuples.
+        workers (int): Number of worker processes.
+        progress_callback: Optional callable(pct, msg), reported per file in the 10% - 65%
+                           band (see LoadProgress).
+        cache (ParseCache): Optional parse cache; cached files are not sent to the pool.
+        recorder (PipelineRecorder): Optional recorder. One "load" stage is added per
+                                     collection with the wall/CPU time summed over its
+                                     files as measured in the workers.
+        cancel_event (threading.Event): Checked as files complete. When set, pending files
+                                        are dropped, running ones are awaited, and
+                                        ETLCancelled is raised.
+        ctx (RunContext): The run context. Defaults to one built from config.
+
+    Returns:
+        list: One DataFrame per load_plan entry, in load_plan order.
+    """
+    ctx = ctx or RunContext.from_config()
+    file_lists = [_find_files(folder, pattern, ctx) for folder, pattern, _, _ in load_plan]
+    chunks = [[None] * len(files) for files in file_lists]
+    loaded = [set() for _ in file_lists]  # Indexes of the files whose chunk is known
+    timings = [[0.0, 0.0, 0] for _ in load_plan]  # wall_s, cpu_s, cached files
+    tracker = LoadProgress(progress_callback, file_lists, [label for _, _, _, label in load_plan])
+
+    tasks = []
+    for i, ((folder, pattern, func, _), files) in enumerate(zip(load_plan, file_lists)):
+        if not files:
+            continue
+        cached = cache.lookup(folder, pattern, func, files) if cache else {}
+        timings[i][2] = len(cached)
+        print(f"   Loading {len(files)} files for {pattern} ({len(cached)} cached)...")
+        for j, f in enumerate(files):
+            if f in cached:
+                chunks[i][j] = cached[f]
+                loaded[i].add(j)
+                tracker.advance(i, j, parsed=False)
+            else:
+                tasks.append((tracker.sizes[i][j], i, j, func, f))
+
+    # Largest files first: keeps every worker busy until the very end of the run
+    tasks.sort(key=lambda t: t[0], reverse=True)
+
+    cancelled = False
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_parse_file_timed, func, f): (i, j)
+                   for _, i, j, func, f in tasks}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            i, j = futures[future]
+            chunks[i][j], wall_s, cpu_s = future.result()
+            loaded[i].add(j)
+            timings[i][0] += wall_s
+            timings[i][1] += cpu_s
+
+            if not cancelled and cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                for pending in futures:
+                    pending.cancel()
+                continue
+            tracker.advance(i, j)
+
+    if cache:
+        for (folder, pattern, func, _), files, frames, idx in zip(load_plan, file_lists, chunks, loaded):
+            if idx:
+                cache.store(folder, pattern, func, {files[j]: frames[j] for j in sorted(idx)})
+    check_cancelled(cancel_event)
 
-def get_data_date_range():
+    datasets = []
+    for (_, _, _, label), files, frames, (wall_s, cpu_s, n_cached) in zip(load_plan, file_lists, chunks, timings):
+        t0, cpu0 = time.perf_counter(), time.thread_time()
+        df = _combine_frames(frames, ctx)
+        if recorder:
+            recorder.add_stage(
+                "load", label,
+                wall_s=wall_s + time.perf_counter() - t0,
+                cpu_s=cpu_s + time.thread_time() - cpu0,
+                files=len(files), rows=len(df), cached=n_cached, parallel=True)
+        datasets.append(df)
+    return datasets
+
+
+def get_data_date_range(ctx=None):
     """
     Scans the data directory to find the earliest and latest available dates.
     Uses 'calories-*.json' as the reliable anchor for date coverage.
     """
+    ctx = ctx or RunContext.from_config()
     search_path = os.path.join(
-        config.DATA_DIR, "Global Export Data", "calories-*.json")
+        ctx.data_dir, "Global Export Data", "calories-*.json")
     files = glob.glob(search_path)
     if not files:
         return None, None
@@ -115,99 +534,142 @@ def get_data_date_range():
     return min(dates).strftime('%Y-%m-%d'), max(dates).strftime('%Y-%m-%d')
 
 
-def merge_all_data(progress_callback=None):
+def merge_datasets(datasets, ctx=None):
+    """
+    Merges the per-collection DataFrames into the Master DataFrame in one step.
+
+    Each dataset is first restricted to the configured date range. The union
+    date index is computed once and every column is scattered into its own
+    preallocated array at the row positions of its dataset (columns already
+    covering the whole index are reused as-is). A dataset with no row in the
+    range still yields its columns, filled with NaN. This replaces a chain of
+    outer joins, which re-aligned and copied the growing master frame for
+    every collection.
+
+    Args:
+        datasets (list): DataFrames indexed by date, with disjoint columns.
+        ctx (RunContext): The run context. Defaults to one built from config.
+
+    Returns:
+        pd.DataFrame: The merged dataset, or None if no dataset has a row in the date range.
+    """
+    ctx = ctx or RunContext.from_config()
+    # Datasets without rows in the date range keep their columns (all NaN), as with outer joins
+    datasets = [d for d in datasets if len(d.columns)]
+    if not datasets:
+        return None
+
+    aligned = []
+    for current in datasets:
+        # Align indexes before merge just in case
+        if current.index.duplicated().any():
+            current = current.groupby(current.index).mean()
+        aligned.append(filter_by_date(current, ctx))
+
+    # Sort-based union of all dates (np.unique avoids a hash table over every row)
+    index = pd.DatetimeIndex(
+        np.unique(np.concatenate([d.index.to_numpy() for d in aligned])), name='date')
+    if not len(index):
+        return None
+
+    columns = {}
+    for current in aligned:
+        if current.index.equals(index):
+            for col in current.columns:
+                columns[col] = current[col].to_numpy()
+            continue
+
+        positions = index.get_indexer(current.index)
+        for col in current.columns:
+            values = current[col].to_numpy()
+            if values.dtype.kind in 'iuf':
+                # Missing days become NaN, exactly like an outer join would produce
+                out = np.full(len(index), np.nan,
+                              dtype=values.dtype if values.dtype.kind == 'f' else 'float64')
+                out[positions] = values
+            else:
+                out = current[col].reindex(index).to_numpy()
+            columns[col] = out
+
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def merge_all_data(progress_callback=None, workers=None, use_cache=None, recorder=None, cancel_event=None,
+                   ctx=None, changed_files=None):
     """
     Main ETL Orchestrator.
 
-    1. Defines the loading plan for all metrics (Heart Rate, Sleep, Activity, etc.).
-    2. Loads and parses each collection independently.
-    3. Merges all collections into a single Master DataFrame using Outer Join.
+    1. Walks the loading plan for all metrics (Heart Rate, Sleep, Activity, etc.).
+    2. Loads and parses each collection independently (optionally on a process pool).
+    3. Merges all collections into a single Master DataFrame (union of all dates).
     4. Fills NaN values with 0 for activity-based columns.
     5. Performs final cleanup to remove empty or future rows based on calorie data.
 
     Args:
         progress_callback: Optional callable(pct, msg) for progress reporting.
+        workers (int): Parser processes to use, see resolve_workers(). 1 loads serially.
+                       Defaults to ctx.workers.
+        use_cache (bool): Reuse chunks from the persistent parse cache. Defaults to ctx.parse_cache.
+        recorder (PipelineRecorder): Optional recorder for per-collection "load" stages and the "merge" stage.
+        cancel_event (threading.Event): Cooperative cancellation, checked between files.
+                                        Raises ETLCancelled when set.
+        ctx (RunContext): User paths, date range and options of the run. Defaults to one
+                          built from config. It is never modified: an auto-detected date
+                          range only applies to this run.
+        changed_files (iterable): Files or directories known to have changed since the
+                                  last run: their cached chunks are not reused.
 
     Returns:
         pd.DataFrame: The fully processed Master Dataset ready for analysis.
     """
+    recorder = recorder or PipelineRecorder()
+    ctx = ctx or RunContext.from_config()
+
     # Auto-detect date range if not explicitly set
-    detected_start, detected_end = get_data_date_range()
-    if not config.START_DATE and detected_start:
-        config.START_DATE = detected_start
-    if not config.END_DATE and detected_end:
-        config.END_DATE = detected_end
+    detected_start, detected_end = get_data_date_range(ctx)
+    ctx = ctx.replace(start_date=ctx.start_date or detected_start,
+                      end_date=ctx.end_date or detected_end)
 
-    date_str = f"{config.START_DATE} to {config.END_DATE}" if config.START_DATE else "All Time"
+    date_str = f"{ctx.start_date} to {ctx.end_date}" if ctx.start_date else "All Time"
     print(f"\n=== BUILDING MASTER DATASET ({date_str}) ===")
 
-    # Define Loading Plan: (Folder, Pattern, Parser, Label)
-    load_plan = [
-        ("Global Export Data", "resting_heart_rate-*.json",
-         parsers.parse_resting_heart_rate, "Resting heart rate"),
-        ("Global Export Data", "heart_rate-*.json",
-         parsers.parse_heart_rate_intraday_summary, "Heart rate intraday"),
-        ("Global Export Data", "steps-*.json", parsers.parse_steps_json, "Steps"),
-        ("Global Export Data", "distance-*.json", parsers.parse_distance_json, "Distance"),
-        ("Global Export Data", "exercise-*.json", parsers.parse_exercise_json, "Exercise sessions"),
-        ("Global Export Data", "weight-*.json", parsers.parse_weight, "Weight"),
-        ("Global Export Data", "calories-*.json", parsers.parse_calories_intraday, "Calories"),
-        ("Sleep Score", "sleep_score.csv", parsers.parse_sleep_score_csv, "Sleep scores"),
-        ("Global Export Data", "sleep-*.json", parsers.parse_sleep_json_detailed, "Sleep stages"),
-        ("Oxygen Saturation (SpO2)", "Daily SpO2 - *.csv", parsers.parse_spo2_csv, "SpO2"),
-        ("Heart Rate Variability",
-         "Daily Heart Rate Variability Summary - *.csv", parsers.parse_hrv_csv, "HRV"),
-        ("Stress Score", "Stress Score.csv", parsers.parse_stress_csv, "Stress scores"),
-        ("Global Export Data", "very_active_minutes-*.json",
-         parsers.parse_simple_activity_json, "Active minutes"),
-        ("Global Export Data", "moderately_active_minutes-*.json",
-         parsers.parse_simple_activity_json, "Moderate activity"),
-        ("Global Export Data", "lightly_active_minutes-*.json",
-         parsers.parse_simple_activity_json, "Light activity"),
-        ("Global Export Data", "sedentary_minutes-*.json",
-         parsers.parse_simple_activity_json, "Sedentary minutes"),
-        ("Physical Activity_GoogleData",
-         "cardio_acute_chronic_workload_ratio.csv", parsers.parse_acwr_csv, "ACWR"),
-        ("Physical Activity_GoogleData",
-         "demographic_vo2max.csv", parsers.parse_vo2max_csv, "VO2 Max"),
-        ("Physical Activity_GoogleData",
-         "daily_readiness.csv", parsers.parse_readiness_csv, "Readiness"),
-        ("Physical Activity_GoogleData", "daily_respiratory_rate.csv",
-         parsers.parse_respiratory_rate_csv, "Respiratory rate"),
-        ("Physical Activity_GoogleData", "daily_sleep_temperature_derivations.csv",
-         parsers.parse_skin_temperature_csv, "Skin temperature"),
-        ("Physical Activity_GoogleData", "time_in_heart_rate_zone_*.csv",
-         parsers.parse_active_zones_csv, "HR zones"),
-    ]
-
-    total = len(load_plan)
-    datasets = []
-    for i, (folder, pattern, func, label) in enumerate(load_plan):
-        # Progress from 10% to 65% spread across all collections
-        pct = 10 + int((i / total) * 55)
-        if progress_callback:
-            progress_callback(pct, f"Loading {label}")
-        datasets.append(load_collection(folder, pattern, func))
-
+    if use_cache is None:
+        use_cache = ctx.parse_cache
+    remove_legacy_cache(ctx.out_dir)
+    cache = ParseCache(get_cache_dir(ctx), invalidated=changed_files) if use_cache else None
+
+    workers = resolve_workers(ctx.workers if workers is None else workers)
+    if workers > 1:
+        print(f"   Parsing with {workers} worker processes")
+        with recorder.stage("load", "process_pool") as info:
+            datasets = load_collections_parallel(
+                LOAD_PLAN, workers, progress_callback, cache, recorder, cancel_event, ctx)
+            info.update(files=sum(s["files"] for s in recorder.stages if s.get("parallel")),
+                        workers=workers)
+    else:
+        file_lists = [_find_files(folder, pattern, ctx) for folder, pattern, _, _ in LOAD_PLAN]
+        tracker = LoadProgress(progress_callback, file_lists, [label for _, _, _, label in LOAD_PLAN])
+        datasets = []
+        for i, ((folder, pattern, func, label), files) in enumerate(zip(LOAD_PLAN, file_lists)):
+            if files:
+                tracker.report(i)
+            with recorder.stage("load", label) as info:
+                df = load_collection(folder, pattern, func, cache, stats=info,
+                                     cancel_event=cancel_event, ctx=ctx, files=files,
+                                     progress=functools.partial(tracker.advance, i))
+                info["rows"] = len(df)
+            datasets.append(df)
+
+    check_cancelled(cancel_event)
     if progress_callback:
         progress_callback(65, "Merging datasets")
 
-    # Filter empty datasets
-    datasets = [d for d in datasets if not d.empty]
-    if not datasets:
+    with recorder.stage("merge", "merge_datasets") as info:
+        master_df = merge_datasets(datasets, ctx)
+        info["rows"] = len(master_df) if master_df is not None else 0
+    if master_df is None:
         return None
 
-    # Merge Strategy: Outer Join starting from the first non-empty dataset
-    master_df = datasets[0]
-    for i in range(1, len(datasets)):
-        current = datasets[i]
-        # Align indexes before merge just in case
-        if current.index.duplicated().any():
-            current = current.groupby(current.index).mean()
-        master_df = master_df.join(current, how='outer')
-
-    master_df = filter_by_date(master_df)
-
     # Fill NaNs for activity and sleep metrics (logical 0)
     cols_zero = [
         'very_active_minutes', 'moderately_active_minutes', 'lightly_active_minutes', 'sedentary_minutes',
@@ -229,30 +691,61 @@ def merge_all_data(progress_callback=None):
     return master_df
 
 
-def export_to_json(df):
+def export_analysis(df, export_csv=None, ctx=None):
     """
-    Exports the processed Master DataFrame to a JSON file format suitable for the React Dashboard.
+    Exports the Master DataFrame for the BRIEFING module.
 
-    The file is saved directly to the client's public folder so it can be served via HTTP.
+    Writes the binary columnar store (typed columns + DatetimeIndex) and,
+    optionally, the legacy 'fitbit_analysis.csv'.
 
     Args:
         df (pd.DataFrame): The Master Dataset to export.
+        export_csv (bool): Also write the CSV. Defaults to ctx.export_csv.
+        ctx (RunContext): The run context (output directory). Defaults to one built from config.
     """
-    output_path = os.path.join(config.CLIENT_PUBLIC_DIR, "dashboard_data.json")
-    if not os.path.exists(config.CLIENT_PUBLIC_DIR):
-        os.makedirs(config.CLIENT_PUBLIC_DIR, exist_ok=True)
+    ctx = ctx or RunContext.from_config()
+    os.makedirs(ctx.out_dir, exist_ok=True)
+    store_path = store.get_store_path(ctx.out_dir)
+    store.write_store(df, store_path)
+    print(f"-> Analysis store exported to: {store_path}")
+
+    if export_csv is None:
+        export_csv = ctx.export_csv
+    if export_csv:
+        csv_path = os.path.join(ctx.out_dir, store.CSV_FILENAME)
+        df.to_csv(csv_path)
+        print(f"-> Analysis CSV exported to: {csv_path}")
 
-    # Reset index to include 'date' as a column in the JSON
-    export_df = df.reset_index()
-    export_df['date'] = export_df['date'].dt.strftime('%Y-%m-%d')
 
-    export_df.to_json(output_path, orient='records')
-    print(f"-> Dashboard JSON exported to: {output_path}")
+def export_to_json(df, ctx=None, aggregates=None):
+    """
+    Exports the processed Master DataFrame in the format read by the React Dashboard.
+
+    The files are saved directly to the client's public folder so they can be served
+    via HTTP: by default a manifest plus compact column-array chunks (see
+    modules.dashboard.write_columnar), or the legacy records-oriented
+    dashboard_data.json when ctx.dashboard_format is "records". The precomputed
+    statistics (dashboard_aggregates.json) are written alongside in both cases.
+
+    Args:
+        df (pd.DataFrame): The Master Dataset to export.
+        ctx (RunContext): The run context (output directory, format). Defaults to one built from config.
+        aggregates (dict): Result of metrics.calculate_dashboard_aggregates(df), computed here if omitted.
+    """
+    ctx = ctx or RunContext.from_config()
+    if aggregates is None:
+        aggregates = metrics.calculate_dashboard_aggregates(df)
+
+    written = dashboard.write_aggregates(aggregates, ctx.out_dir, ctx.dashboard_decimals)
+    if ctx.dashboard_format == "records":
+        written += dashboard.write_records(df, ctx.out_dir)
+    else:
+        written += dashboard.write_columnar(df, ctx.out_dir, ctx.dashboard_chunk_by_year, ctx.dashboard_decimals)
+    print(f"-> Dashboard JSON exported to: {written[-1]} ({len(written)} files)")
 
     # ALSO: If a 'dist' folder exists (production build), update it too!
     # This ensures that even after a build, the dashboard remains fresh.
-    dist_dir = config.CLIENT_PUBLIC_DIR.replace("public", "dist")
-    if os.path.exists(dist_dir):
-        dist_path = os.path.join(dist_dir, "dashboard_data.json")
-        export_df.to_json(dist_path, orient='records')
-        print(f"-> Syncing to production build: {dist_path}")
+    dist_dir = ctx.out_dir.replace("public", "dist")
+    if dist_dir != ctx.out_dir and os.path.exists(dist_dir):
+        synced = dashboard.sync_outputs(written, dist_dir)
+        print(f"-> Syncing to production build: {synced[-1]}")
@@ -0,0 +1,135 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
+import config
+
+HISTORY_FILENAME = "etl_run_history.json"
+HISTORY_MAX_RUNS = 50
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def peak_rss_mb():
+    """Returns the process' peak resident set size in MB, or None where unsupported."""
+    if not HAS_RESOURCE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb():
+    """Returns the process' current resident set size in MB, or None where unsupported (non-Linux)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * PAGE_SIZE / (1024 * 1024)
+
+
+class PipelineRecorder:
+    """
+    Measures every stage of an ETL run: wall time, CPU time, change of the
+    resident memory, files processed and rows produced.
+
+    CPU time is that of the calling thread (time.thread_time()), so it stays
+    exact when several profile jobs run concurrently in the API server; stages
+    parsed in worker processes report the CPU time measured there. Memory is
+    only known per process: 'rss_delta_mb' (current RSS after minus before the
+    stage, Linux only) and the run's 'peak_rss_mb' also include the allocations
+    of concurrent jobs, and the peak never decreases, so they are only
+    meaningful for runs that have the process to themselves.
+
+    Each finished stage is appended to `stages` and passed to `callback`
+    (e.g. to broadcast it over the WebSocket). Stages that ran inside worker
+    processes are added with add_stage() using the timings measured there.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.stages = []
+        self.started_at = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.thread_time()
+
+    def add_stage(self, stage, name, wall_s, cpu_s=None, rss_delta_mb=None, files=None, rows=None, **extra):
+        """Records an already measured stage."""
+        record = {
+            "stage": stage,
+            "name": name,
+            "wall_s": round(wall_s, 4),
+            "cpu_s": round(cpu_s, 4) if cpu_s is not None else None,
+            "rss_delta_mb": round(rss_delta_mb, 1) if rss_delta_mb is not None else None,
+            "files": files,
+            "rows": rows,
+            **extra,
+        }
+        self.stages.append(record)
+        if self.callback:
+            self.callback(record)
+        return record
+
+    @contextmanager
+    def stage(self, stage, name=None):
+        """
+        Times the enclosed block. The yielded dict can be filled with 'files',
+        'rows' or any extra field to attach to the record.
+        """
+        info = {}
+        rss0 = current_rss_mb()
+        t0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield info
+        finally:
+            rss1 = current_rss_mb()
+            self.add_stage(
+                stage, name or stage,
+                wall_s=time.perf_counter() - t0,
+                cpu_s=time.thread_time() - cpu0,
+                rss_delta_mb=(rss1 - rss0) if rss0 is not None and rss1 is not None else None,
+                **info,
+            )
+
+    def summary(self, status):
+        """Returns the run record persisted to the history file."""
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "status": status,
+            "wall_s": round(time.perf_counter() - self._t0, 3),
+            "cpu_s": round(time.thread_time() - self._cpu0, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1) if HAS_RESOURCE else None,
+            "stages": self.stages,
+        }
+
+    def save_history(self, status, out_dir=None):
+        """
+        Appends this run to 'etl_run_history.json' in the output directory,
+        keeping the last HISTORY_MAX_RUNS runs.
+        """
+        path = os.path.join(out_dir or config.CLIENT_PUBLIC_DIR, HISTORY_FILENAME)
+        history = []
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    history = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable run history {path}: {e}")
+
+        history.append(self.summary(status))
+        history = history[-HISTORY_MAX_RUNS:]
+        try:
+            with open(path, "w") as f:
+                json.dump(history, f, indent=1)
+        except OSError as e:
+            print(f"Could not write run history {path}: {e}")
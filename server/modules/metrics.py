@@ -1,8 +1,9 @@
-import config
 import pandas as pd
 import numpy as np
 from typing import Literal
 
+from modules.context import RunContext
+
 
 def calculate_readiness(df):
     """ Calculates Z-Score based Readiness. """
@@ -19,32 +20,38 @@ def calculate_readiness(df):
     return df
 
 
-def calculate_metabolic_metrics(df):
-    """ Calculates BMR (Mifflin-St Jeor), Active Calories, and Intensity. """
+def calculate_metabolic_metrics(df, ctx=None):
+    """
+    Calculates BMR (Mifflin-St Jeor), Active Calories, and Intensity.
+
+    The user biometrics (dob, height, weight, gender) come from ctx, which
+    defaults to a context built from config.
+    """
+    ctx = ctx or RunContext.from_config()
 
     # 1. Fill Weight
     if 'weight' in df.columns:
         # Interpolate missing values linearly to represent gradual changes
         df['weight_filled'] = df['weight'].interpolate(method='linear')
         # Fill remaining NaNs (edges or if no data points) with user configured fallback
-        df['weight_filled'] = df['weight_filled'].fillna(config.USER_WEIGHT_KG)
+        df['weight_filled'] = df['weight_filled'].fillna(ctx.weight_kg)
     else:
-        df['weight_filled'] = config.USER_WEIGHT_KG
+        df['weight_filled'] = ctx.weight_kg
 
     # 2. BMR
-    if not config.USER_GENDER or not config.USER_DOB or not config.USER_HEIGHT_CM:
+    if not ctx.gender or not ctx.dob or not ctx.height_cm:
         df['bmr'] = 0.0
         df['active_calories'] = 0.0
     else:
-        s: Literal[-161, 5] = 5 if config.USER_GENDER == 'male' else -161
+        s: Literal[-161, 5] = 5 if ctx.gender == 'male' else -161
 
         # Calculate age dynamically based on DOB and the record's date (index)
         try:
-            dob = pd.to_datetime(config.USER_DOB)
+            dob = pd.to_datetime(ctx.dob)
             # df.index is expected to be a DatetimeIndex
             age_series = (df.index - dob).days / 365.25
             df['bmr'] = (10 * df['weight_filled']) + \
-                (6.25 * config.USER_HEIGHT_CM) - (5 * age_series) + s
+                (6.25 * ctx.height_cm) - (5 * age_series) + s
         except Exception as e:
             print(f"BMR Error: {e}")
             df['bmr'] = 0.0
@@ -66,9 +73,10 @@ def calculate_metabolic_metrics(df):
         df['very_active_minutes']
     )
 
-    df['intensity_index'] = df.apply(
-        lambda row: row['active_calories'] / row['total_active_minutes']
-        if row['total_active_minutes'] > 0 else 0, axis=1
+    df['intensity_index'] = np.where(
+        df['total_active_minutes'] > 0,
+        df['active_calories'] / df['total_active_minutes'],
+        0.0
     )
 
     return df
@@ -148,7 +156,7 @@ def calculate_advanced_metrics(df):
     if 'rmssd' in df.columns:
         rmssd_mean = df['rmssd'].rolling('7D', min_periods=3).mean()
         rmssd_std = df['rmssd'].rolling('7D', min_periods=3).std()
-        df['hrv_cv'] = np.where((rmssd_mean > 0) & (pd.notna(rmssd_std)), (rmssd_std / rmssd_mean).round(3), None)
+        df['hrv_cv'] = np.where((rmssd_mean > 0) & (pd.notna(rmssd_std)), (rmssd_std / rmssd_mean).round(3), np.nan)
 
     # 10. ACWR Supercompensation & Injury Risk
     if 'acwr_ratio' in df.columns:
@@ -160,3 +168,113 @@ def calculate_advanced_metrics(df):
         df['exercise_aef'] = df['exercise_aef'].fillna(0.0).round(2)
 
     return df
+
+
+# Validity rules of the dashboard (client lib/analytics.ts getValidSeries): a value
+# only counts towards averages, extremes and rollups when above its floor
+DASHBOARD_VALID_FLOORS = {
+    'resting_bpm': 0,
+    'rmssd': 0,
+    'overall_score': 0,
+    'stress_score': 0,
+    'calories_total': 500,
+    'spo2_avg': 80,
+}
+
+# Rollup name -> pandas period frequency (weeks start on Monday)
+DASHBOARD_ROLLUPS = {
+    'weekly': 'W-SUN',
+    'monthly': 'M',
+}
+
+
+def _dashboard_synthetic_series(df):
+    """
+    Daily series the dashboard derives from several columns (see lib/analytics.ts):
+    recovery score (HRV, RHR, sleep) and restorative sleep share (deep + REM).
+    """
+    series = {}
+    if all(c in df.columns for c in ['rmssd', 'resting_bpm', 'overall_score']):
+        hrv, rhr, sleep = df['rmssd'], df['resting_bpm'], df['overall_score']
+        hrv_score = (hrv / 70 * 100).clip(upper=100)
+        rhr_score = ((85 - rhr) / (85 - 45) * 100).clip(0, 100)
+        # Math.round: halves go up
+        score = np.floor(hrv_score * 0.4 + rhr_score * 0.3 + sleep * 0.3 + 0.5)
+        series['recovery_score'] = score.where((hrv > 0) & (rhr > 0) & (sleep > 0))
+
+    sleep_cols = ['sleep_deep', 'sleep_light', 'sleep_rem', 'sleep_awake']
+    if all(c in df.columns for c in sleep_cols):
+        total = df[sleep_cols].sum(axis=1, min_count=len(sleep_cols))
+        restorative = df['sleep_deep'] + df['sleep_rem']
+        series['restorative_sleep_pct'] = (restorative / total * 100).where(total > 0)
+    return series
+
+
+def calculate_dashboard_aggregates(df):
+    """
+    Precomputes the statistics the dashboard shows for the whole history, so the
+    client does not sort and scan every column of a multi-year dataset on load.
+
+    All numeric columns (plus the recovery score and restorative sleep share) are
+    processed at once as a single 2-D array:
+      - stats: min / p33 / p66 / max of the non-null values, with the client's
+        percentile rule (sorted[floor(n * q)]), used by the heatmap table.
+      - summary: count / avg / min / max / last value and date of the *valid*
+        values (DASHBOARD_VALID_FLOORS), used by the KPI cards.
+      - weekly / monthly: mean of the valid values and number of days per period.
+
+    Args:
+        df (pd.DataFrame): Master dataset indexed by date.
+
+    Returns:
+        dict: {"stats": DataFrame (min, p33, p66, max) x columns,
+               "summary": DataFrame (count, avg, min, max, last) x columns,
+               "last_date": Series of dates (NaT without valid value),
+               "weekly"/"monthly": (DataFrame of means indexed by period start, Series of days)}
+    """
+    numeric = df.select_dtypes(include='number').select_dtypes(exclude='bool')
+    frame = numeric.assign(**_dashboard_synthetic_series(df))
+    columns = frame.columns
+    # A trailing all-NaN row keeps every lookup below in bounds (empty columns read NaN)
+    values = np.vstack([frame.to_numpy(dtype='float64', na_value=np.nan), np.full((1, len(columns)), np.nan)])
+    cols_idx = np.arange(len(columns))
+
+    # NaNs sort last, so the first `count` entries of every column are its values
+    counts = (~np.isnan(values)).sum(axis=0)
+    ordered = np.sort(values, axis=0)
+    stats = pd.DataFrame({
+        'min': ordered[0],
+        'p33': ordered[np.floor(counts * 0.33).astype('int64'), cols_idx],
+        'p66': ordered[np.floor(counts * 0.66).astype('int64'), cols_idx],
+        'max': ordered[np.maximum(counts - 1, 0), cols_idx],
+    }, index=columns).T
+
+    floors = np.array([DASHBOARD_VALID_FLOORS.get(c, -np.inf) for c in columns])
+    with np.errstate(invalid='ignore'):
+        valid = values > floors
+    valid_values = np.where(valid, values, np.nan)
+    valid_counts = valid.sum(axis=0)
+
+    # Last valid row of every column (the padding row for columns without one)
+    last_idx = np.where(valid_counts > 0, len(values) - 1 - np.argmax(valid[::-1], axis=0), len(frame))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg = np.nansum(valid_values, axis=0) / valid_counts
+    summary = pd.DataFrame({
+        'count': valid_counts,
+        'avg': avg,
+        # fmin/fmax skip NaNs without the all-NaN warning of nanmin/nanmax
+        'min': np.fmin.reduce(valid_values, axis=0),
+        'max': np.fmax.reduce(valid_values, axis=0),
+        'last': valid_values[last_idx, cols_idx],
+    }, index=columns).T
+    last_date = pd.Series(frame.index.append(pd.DatetimeIndex([pd.NaT]))[last_idx], index=columns)
+
+    aggregates = {"stats": stats, "summary": summary, "last_date": last_date}
+    valid_frame = pd.DataFrame(valid_values[:-1], index=frame.index, columns=columns)
+    for name, freq in DASHBOARD_ROLLUPS.items():
+        grouped = valid_frame.groupby(frame.index.to_period(freq))
+        means = grouped.mean()
+        days = grouped.size()
+        means.index = days.index = means.index.start_time
+        aggregates[name] = (means, days)
+    return aggregates
@@ -0,0 +1,206 @@
+import hashlib
+import marshal
+import os
+import pickle
+import shutil
+import sys
+import types
+
+import pandas as pd
+import config
+from modules import parsers
+from modules.context import RunContext
+
+# Bump to invalidate every cache entry after a change in the cache layout itself
+CACHE_VERSION = 1
+
+# Modules whose code determines the content of a parsed chunk
+FINGERPRINT_MODULES = [parsers]
+
+
+# Former default location inside the (served) output directory
+LEGACY_CACHE_DIRNAME = ".parse_cache"
+
+
+def get_cache_dir(ctx=None):
+    """Returns the parse cache directory of a run (parse_cache_dir, see config.PARSE_CACHE_DIR)."""
+    ctx = ctx or RunContext.from_config()
+    return ctx.parse_cache_dir or config.PARSE_CACHE_DIR
+
+
+def remove_legacy_cache(out_dir):
+    """
+    Deletes a parse cache left in <out_dir>/.parse_cache by earlier versions,
+    where the client build and web server could expose it.
+
+    Returns:
+        str: The removed directory, None if there was none.
+    """
+    path = os.path.join(out_dir, LEGACY_CACHE_DIRNAME)
+    if not os.path.isdir(path):
+        return None
+    shutil.rmtree(path, ignore_errors=True)
+    return path
+
+
+def _stable_repr(obj):
+    """Returns a repr that does not depend on hash randomization (sorts sets)."""
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_repr(v) for v in obj)) + "}"
+    if isinstance(obj, dict):
+        return "{" + ", ".join(f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in obj.items()) + "}"
+    if isinstance(obj, (list, tuple)):
+        return type(obj).__name__ + "(" + ", ".join(_stable_repr(v) for v in obj) + ")"
+    return repr(obj)
+
+
+def _module_digest(module):
+    """
+    Hashes a module's source file, falling back to its compiled code object when
+    the source is not shipped (PyInstaller builds).
+
+    If the loader cannot return the code object either, the bytecode of the
+    module's functions and classes and the repr of its public module-level data
+    (schemas, column maps, constants) are hashed instead.
+    """
+    path = getattr(module, "__file__", None)
+    if path and path.endswith(".py") and os.path.exists(path):
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    loader = getattr(module, "__loader__", None)
+    try:
+        code = loader.get_code(module.__name__)
+    except Exception:
+        code = None
+    if code is not None:
+        return hashlib.sha256(marshal.dumps(code)).hexdigest()
+
+    digest = hashlib.sha256()
+    for name in sorted(vars(module)):
+        obj = getattr(module, name)
+        if isinstance(obj, types.ModuleType):
+            continue
+        if isinstance(obj, (types.FunctionType, type)):
+            if getattr(obj, "__module__", None) != module.__name__:
+                continue
+            members = vars(obj).items() if isinstance(obj, type) else [(name, obj)]
+            for member_name, member in members:
+                code = getattr(member, "__code__", None)
+                if code is not None:
+                    digest.update(f"{name}.{member_name}".encode())
+                    digest.update(marshal.dumps(code))
+        elif not name.startswith("_") and not callable(obj):
+            digest.update(f"{name}={_stable_repr(obj)}".encode())
+    return digest.hexdigest()
+
+
+def parser_fingerprint():
+    """
+    Identifies the parser code that produced a cache entry.
+
+    Any edit to the parser modules or the CSV schemas, a pandas upgrade or a
+    new Python version yields a different fingerprint, which discards all cached chunks.
+    """
+    parts = [str(CACHE_VERSION), sys.version, pd.__version__]
+    parts += [_module_digest(m) for m in FINGERPRINT_MODULES]
+    # The CSV parsers are driven by these tables: changing one must invalidate their chunks
+    parts.append(_stable_repr(parsers.CSV_SCHEMAS))
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class ParseCache:
+    """
+    Persistent cache of parsed file chunks, keyed by path, size and mtime.
+
+    One pickle is kept per collection (folder + pattern + parser). A file is
+    re-parsed only when it is new, its size or mtime changed, it was reported
+    as changed (e.g. by the watcher), or the parser code changed since the
+    chunk was stored.
+    """
+
+    def __init__(self, cache_dir=None, invalidated=None):
+        """
+        Args:
+            cache_dir (str): Directory of the pickles. Defaults to get_cache_dir().
+            invalidated (iterable): Paths known to have changed (files, or directories
+                                    covering every file below them): their entries are
+                                    re-parsed even if size and mtime still match.
+        """
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.fingerprint = parser_fingerprint()
+        self._stats = {}
+        self._previous = {}
+        self._invalidated = tuple(os.path.normcase(os.path.abspath(p)) for p in invalidated or ())
+
+    def _is_invalidated(self, file_path):
+        if not self._invalidated:
+            return False
+        path = os.path.normcase(os.path.abspath(file_path))
+        return any(path == p or path.startswith(p + os.sep) for p in self._invalidated)
+
+    def _collection_path(self, folder_name, file_pattern, parser_func):
+        key = f"{folder_name}|{file_pattern}|{parser_func.__name__}"
+        name = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}.pkl")
+
+    def lookup(self, folder_name, file_pattern, parser_func, files):
+        """
+        Returns the cached chunks that are still valid for the given files.
+
+        Args:
+            files (list): Paths of the collection's files.
+
+        Returns:
+            dict: path -> parsed chunk (may be None for files without data).
+        """
+        entries = {}
+        path = self._collection_path(folder_name, file_pattern, parser_func)
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    stored = pickle.load(f)
+                if stored.get("fingerprint") == self.fingerprint:
+                    entries = stored.get("entries", {})
+            except Exception as e:
+                print(f"   Ignoring unreadable parse cache {path}: {e}")
+        self._previous[path] = entries
+
+        hits = {}
+        for file_path in files:
+            # Stat before parsing so a file modified mid-run is re-parsed next time
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            stat_key = (st.st_size, st.st_mtime_ns)
+            self._stats[file_path] = stat_key
+            entry = entries.get(file_path)
+            if entry is not None and entry[0] == stat_key and not self._is_invalidated(file_path):
+                hits[file_path] = entry[1]
+        return hits
+
+    def store(self, folder_name, file_pattern, parser_func, chunks):
+        """
+        Persists the chunks of a collection.
+
+        Entries of files that were not loaded this time (e.g. outside the date
+        range) are kept as long as the file still exists in the export.
+
+        Args:
+            chunks (dict): path -> parsed chunk, for every loaded file of the collection.
+        """
+        path = self._collection_path(folder_name, file_pattern, parser_func)
+        entries = {p: e for p, e in self._previous.get(path, {}).items()
+                   if p not in chunks and os.path.exists(p)}
+        entries.update({p: (self._stats[p], chunk)
+                        for p, chunk in chunks.items() if p in self._stats})
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"fingerprint": self.fingerprint, "entries": entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"   Could not write parse cache {path}: {e}")
@@ -1,8 +1,406 @@
 # backend/modules/parsers.py
+import fnmatch
 import json
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 import os
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Fitbit intraday timestamps look like '01/31/24 13:45:00': the first 8 chars are the day
+DAY_PREFIX_LEN = 8
+DAY_PREFIX_FORMAT = '%m/%d/%y'
+
+# Google Takeout ISO timestamps: '2024-01-31T13:45:00Z' (day prefix, then the seconds end)
+ISO_DAY_PREFIX_LEN = 10
+ISO_SECONDS_LEN = 19
+
+# Intraday JSON files: file name prefix -> daily total column (others keep their prefix)
+INTRADAY_COLUMNS = {
+    'calories': 'calories_total',
+    'steps': 'steps',
+    'distance': 'distance',
+}
+
+# time_in_heart_rate_zone CSVs: zone type -> output column
+ZONE_TYPE_COLUMN = 'heart rate zone type'
+ZONE_COLUMNS = {
+    'OUT_OF_RANGE': 'zone_out_of_range',
+    'FAT_BURN': 'zone_fat_burn',
+    'CARDIO': 'zone_cardio',
+    'PEAK': 'zone_peak',
+    'LIGHT': 'zone_light'
+}
+
+
+def parse_day_prefixes(prefixes):
+    """Converts unique 'MM/DD/YY' day prefixes into a DatetimeIndex."""
+    return pd.to_datetime(pd.Index(prefixes, dtype=object), format=DAY_PREFIX_FORMAT)
+
+
+def day_buckets(date_times):
+    """
+    Buckets 'MM/DD/YY HH:MM:SS' timestamps by day.
+
+    Only the date prefix is kept and each distinct day is parsed once, instead of
+    running pd.to_datetime + normalize over every minute-level timestamp.
+
+    Args:
+        date_times: Sequence of Fitbit intraday timestamp strings.
+
+    Returns:
+        tuple: (codes, days) where `codes[i]` is the position of row i in the
+               `days` DatetimeIndex, or -1 if the row has no timestamp.
+    """
+    prefixes = pd.Series(date_times, dtype=object).str.slice(0, DAY_PREFIX_LEN)
+    codes, uniques = pd.factorize(prefixes)
+    return codes, parse_day_prefixes(uniques)
+
+
+def iso_day_buckets(timestamps):
+    """
+    Buckets ISO 'YYYY-MM-DDTHH:MM:SS' timestamps by day, without parsing them.
+
+    In UTC ('Z') or without an offset, the first 10 characters of a timestamp
+    are its day (what pd.to_datetime(...).dt.normalize() yields). The strings
+    are viewed as a fixed-width byte matrix, so the prefixes are cut and
+    factorized without a per-row Python call, and each distinct day is parsed once.
+
+    Args:
+        timestamps (pd.Series): Timestamp strings, without missing values.
+
+    Returns:
+        tuple: (codes, days) where `codes[i]` is the position of row i in the
+               `days` DatetimeIndex (named 'date', UTC when the timestamps end
+               with 'Z'), or None when the prefix is not the day: other UTC
+               offsets, mixed 'Z'/naive rows, non-ISO or non-ASCII strings.
+    """
+    try:
+        raw = timestamps.to_numpy(dtype=object).astype('S')
+    except (UnicodeEncodeError, TypeError):
+        return None
+    width = raw.dtype.itemsize
+    if width < ISO_DAY_PREFIX_LEN:
+        return None
+    chars = raw.view('S1').reshape(len(raw), width)
+
+    # What follows the seconds: b'', b'Z', b'.000Z', b'+01:00', ...
+    suffixes = set()
+    if width > ISO_SECONDS_LEN:
+        suffixes = set(np.unique(np.ascontiguousarray(chars[:, ISO_SECONDS_LEN:])
+                                 .view(f'S{width - ISO_SECONDS_LEN}').ravel()))
+    utc = bool(suffixes) and all(s.endswith(b'Z') for s in suffixes)
+    if not utc and any(c in s for s in suffixes for c in (b'Z', b'+', b'-')):
+        return None
+
+    prefixes = np.ascontiguousarray(chars[:, :ISO_DAY_PREFIX_LEN]).view(f'S{ISO_DAY_PREFIX_LEN}').ravel()
+    codes, uniques = pd.factorize(prefixes)
+    days = pd.to_datetime(pd.Index(uniques.astype(str), dtype=object), format='%Y-%m-%d', errors='coerce')
+    if days.hasnans:
+        return None
+    if utc:
+        days = days.tz_localize('UTC')
+    days.name = 'date'
+    return codes, days
+
+
+def day_index(date_times):
+    """Returns the (normalized) day of every timestamp as a DatetimeIndex named 'date'."""
+    codes, days = day_buckets(date_times)
+    index = days.take(codes, allow_fill=True, fill_value=None)
+    index.name = 'date'
+    return index
+
+
+def intraday_day_buckets(date_times):
+    """
+    Buckets 'MM/DD/YY HH:MM:SS' timestamps by day, like day_buckets(), with integer arithmetic.
+
+    The timestamps are viewed as a fixed-width byte matrix and the digits of
+    their day prefix become an ordinal, so no string is sliced or hashed per
+    row. Falls back to day_buckets() when a timestamp is missing or has
+    another layout.
+
+    Args:
+        date_times: Sequence of Fitbit intraday timestamp strings.
+
+    Returns:
+        tuple: (codes, days) as returned by day_buckets().
+    """
+    try:
+        raw = np.asarray(date_times, dtype='S')
+    except (UnicodeEncodeError, TypeError, ValueError):
+        return day_buckets(date_times)
+    if raw.ndim != 1 or not len(raw) or raw.dtype.itemsize < DAY_PREFIX_LEN:
+        return day_buckets(date_times)
+
+    chars = raw.view(np.uint8).reshape(len(raw), raw.dtype.itemsize)
+    digits = chars[:, [0, 1, 3, 4, 6, 7]].astype(np.int64) - ord('0')
+    if ((digits < 0) | (digits > 9)).any() or (chars[:, [2, 5]] != ord('/')).any():
+        return day_buckets(date_times)
+    month = digits[:, 0] * 10 + digits[:, 1]
+    day = digits[:, 2] * 10 + digits[:, 3]
+    year = digits[:, 4] * 10 + digits[:, 5]
+    if month.max() > 12 or day.max() > 31:
+        return day_buckets(date_times)
+
+    # Dense ordinal of the prefix, then one code per distinct day
+    keys = (year * 13 + month) * 32 + day
+    present = np.flatnonzero(np.bincount(keys))
+    lookup = np.empty(present[-1] + 1, dtype=np.int64)
+    lookup[present] = np.arange(len(present))
+    prefixes = [f"{k // 32 % 13:02d}/{k % 32:02d}/{k // 416:02d}" for k in present.tolist()]
+    return lookup[keys], parse_day_prefixes(prefixes)
+
+
+def intraday_values(values):
+    """
+    Converts intraday values to a NumPy array, as pd.to_numeric(errors='coerce')
+    would: int64 when the exported strings are all integers, float64 otherwise
+    (non-numeric entries become NaN).
+    """
+    values = values if isinstance(values, list) else list(values)
+    if values and isinstance(values[0], str):
+        # NumPy parses the strings in C; the int attempt stops at the first decimal point
+        for dtype in (np.int64, np.float64):
+            try:
+                return np.array(values, dtype=dtype)
+            except (ValueError, TypeError, OverflowError):
+                continue
+    numeric = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+    if numeric.dtype.kind in 'iu':
+        return numeric.to_numpy(dtype=np.int64)
+    return numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def daily_totals(codes, days, values, column):
+    """
+    Sums values per day with np.bincount.
+
+    Args:
+        codes (np.ndarray): Day of every row, as returned by intraday_day_buckets() (-1 = no day).
+        days (pd.DatetimeIndex): The days the codes refer to.
+        values (np.ndarray): int64 or float64 values (NaNs are skipped).
+        column (str): Name of the output column.
+
+    Returns:
+        pd.DataFrame: Indexed by 'date' with the daily totals in `column`.
+    """
+    valid = codes >= 0
+    if not valid.all():
+        codes, values = codes[valid], values[valid]
+    weights = np.where(np.isnan(values), 0.0, values) if values.dtype.kind == 'f' else values
+    totals = np.bincount(codes, weights=weights, minlength=len(days))
+    if values.dtype.kind != 'f':
+        # Exact below 2**53, far above any daily total
+        totals = totals.astype(np.int64)
+    index = pd.DatetimeIndex(days, name='date')
+    return pd.DataFrame({column: totals}, index=index).sort_index()
+
+
+def sum_by_day(date_times, values, column):
+    """
+    Sums intraday values per day.
+
+    Args:
+        date_times: Sequence of Fitbit intraday timestamp strings.
+        values: Matching sequence of values (non-numeric entries are ignored).
+        column (str): Name of the output column.
+
+    Returns:
+        pd.DataFrame: Indexed by 'date' with the daily totals in `column`.
+    """
+    codes, days = intraday_day_buckets(date_times)
+    return daily_totals(codes, days, intraday_values(values), column)
+
+
+def load_intraday(file_path):
+    """
+    Decodes a '[{"dateTime": ..., "value": ...}]' export file into two plain lists,
+    without building a DataFrame.
+
+    Returns:
+        tuple: (date_times, values), or None if the file holds no entry.
+    """
+    with open(file_path, 'rb') as f:
+        data = json.load(f)
+    if not data:
+        return None
+    return [e.get('dateTime') for e in data], [e.get('value') for e in data]
+
+
+def intraday_column(file_path):
+    """Returns the output column of an intraday file ('steps-2024-01-01.json' -> 'steps')."""
+    base_name = os.path.basename(file_path).split('-')[0]
+    return INTRADAY_COLUMNS.get(base_name, base_name)
+
+
+@dataclass(frozen=True)
+class CsvSchema:
+    """
+    Declarative description of a daily Google Takeout / Fitbit CSV, read by read_schema_csv().
+
+    Only the listed columns are read, with explicit dtypes, and the day comes
+    from the ISO timestamp prefix (see iso_day_buckets), so no per-row format
+    inference is involved.
+    """
+
+    # File name pattern of the source (as in etl.LOAD_PLAN)
+    pattern: str
+    # Source column -> output column, in output order
+    columns: dict = field(default_factory=dict)
+    # Output column -> (minuend, subtrahend) source columns
+    differences: dict = field(default_factory=dict)
+    timestamp: str = 'timestamp'
+    # Timestamps with another offset than 'Z' are parsed with this format
+    timestamp_format: str = 'ISO8601'
+    # Convert the timestamps to UTC and drop the timezone (False keeps the file's offset)
+    utc: bool = False
+    # dtype the value columns are read as
+    dtype: str = 'float64'
+    # Output columns turned into int64 when all their values are integral (as read_csv would infer)
+    integer: tuple = ()
+    # Per-day aggregation ('mean', 'max', ...), None keeps one row per line
+    aggregate: str = None
+    # Output columns whose rows are dropped unless > 0
+    positive: tuple = ()
+    # Missing value columns are skipped instead of rejecting the file
+    optional: bool = False
+    # Header names carry stray whitespace
+    strip_header: bool = False
+
+    @property
+    def sources(self):
+        """Source value columns, in output order."""
+        names = list(self.columns)
+        for pair in self.differences.values():
+            names += [c for c in pair if c not in names]
+        return names
+
+
+# Daily CSV metrics. A new metric is a schema here plus a LOAD_PLAN entry using
+# parse_schema_csv (or a named wrapper, which keeps its parse cache key stable).
+CSV_SCHEMAS = {
+    'sleep_score': CsvSchema(
+        'sleep_score.csv',
+        columns={'overall_score': 'overall_score', 'deep_sleep_in_minutes': 'deep_sleep_in_minutes',
+                 'restlessness': 'restlessness'},
+        utc=True, aggregate='max', optional=True, integer=('overall_score', 'deep_sleep_in_minutes')),
+    'spo2': CsvSchema(
+        'Daily SpO2 - *.csv',
+        columns={'average_value': 'spo2_avg', 'lower_bound': 'spo2_min', 'upper_bound': 'spo2_max'},
+        utc=True, aggregate='mean'),
+    'hrv': CsvSchema(
+        'Daily Heart Rate Variability Summary - *.csv',
+        columns={'rmssd': 'rmssd'}),
+    'stress': CsvSchema(
+        'Stress Score.csv',
+        columns={'STRESS_SCORE': 'stress_score'}, timestamp='DATE',
+        positive=('stress_score',), strip_header=True, integer=('stress_score',)),
+    'acwr': CsvSchema(
+        'cardio_acute_chronic_workload_ratio.csv',
+        columns={'ratio': 'acwr_ratio'}),
+    'vo2max': CsvSchema(
+        'demographic_vo2max.csv',
+        columns={'demographic vo2max': 'vo2max'}),
+    'readiness': CsvSchema(
+        'daily_readiness.csv',
+        columns={'score': 'readiness_score'}, integer=('readiness_score',)),
+    'respiratory_rate': CsvSchema(
+        'daily_respiratory_rate.csv',
+        columns={'breaths per minute': 'respiratory_rate'}),
+    'skin_temperature': CsvSchema(
+        'daily_sleep_temperature_derivations.csv',
+        differences={'temperature_variation': ('nightly temperature celsius', 'baseline temperature celsius')}),
+}
+
+
+def _schema_days(timestamps, schema):
+    """
+    Returns the day of every timestamp as a DatetimeIndex named 'date'
+    (normalized, UTC-naive when schema.utc).
+    """
+    buckets = iso_day_buckets(timestamps)
+    if buckets is not None:
+        codes, days = buckets
+        index = days.take(codes)
+        if schema.utc and index.tz is not None:
+            index = index.tz_localize(None)
+    else:
+        index = pd.DatetimeIndex(pd.to_datetime(timestamps, format=schema.timestamp_format, utc=schema.utc))
+        if schema.utc:
+            index = index.tz_convert(None)
+        index = index.normalize()
+    index.name = 'date'
+    return index
+
+
+def read_schema_csv(file_path, schema):
+    """
+    Reads a daily CSV described by a CsvSchema.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        schema (CsvSchema): Columns, dtypes, timestamp handling and aggregation of the file.
+
+    Returns:
+        pd.DataFrame: Indexed by 'date' with the schema's output columns, or None
+                      when the file is unreadable or lacks a required column.
+    """
+    sources = schema.sources
+    try:
+        if schema.strip_header or schema.optional:
+            # Stripped name -> name in the file, from the header line alone
+            raw = {c.strip(): c for c in pd.read_csv(file_path, nrows=0).columns}
+        else:
+            raw = {c: c for c in [schema.timestamp] + sources}
+        present = [c for c in sources if c in raw]
+        if schema.timestamp not in raw or not present or (not schema.optional and len(present) < len(sources)):
+            return None
+        dtype = {raw[c]: schema.dtype for c in present}
+        dtype[raw[schema.timestamp]] = object
+        # A required column missing from the file fails here (usecols mismatch)
+        df = pd.read_csv(file_path, usecols=list(dtype), dtype=dtype)
+    except:
+        return None
+    if schema.strip_header:
+        df.columns = df.columns.str.strip()
+    if df[schema.timestamp].hasnans:
+        df = df[df[schema.timestamp].notna()]
+
+    kept = [c for c in schema.columns if c in present]
+    out = df[kept].set_axis([schema.columns[c] for c in kept], axis=1)
+    for dst, (a, b) in schema.differences.items():
+        out[dst] = df[a] - df[b]
+    for col in schema.positive:
+        out = out[out[col] > 0]
+        df = df.loc[out.index]
+    for col in schema.integer:
+        # Never truncate: a single fractional or missing value keeps the column float
+        if col in out.columns and not out[col].hasnans and (out[col] % 1 == 0).all():
+            out[col] = out[col].astype('int64')
+
+    out.index = _schema_days(df[schema.timestamp], schema)
+    if schema.aggregate:
+        out = out.groupby(level='date').agg(schema.aggregate)
+    return out
+
+
+def parse_schema_csv(file_path):
+    """
+    Parses any daily CSV of CSV_SCHEMAS, picking the schema whose pattern matches the file name.
+    """
+    name = os.path.basename(file_path)
+    for schema in CSV_SCHEMAS.values():
+        if fnmatch.fnmatchcase(name, schema.pattern):
+            return read_schema_csv(file_path, schema)
+    raise ValueError(f"No CSV schema matches {name}")
+
 
 def parse_resting_heart_rate(file_path):
     """
@@ -74,17 +472,7 @@ def parse_sleep_score_csv(file_path):
                       'deep_sleep_in_minutes', and 'restlessness'.
                       Aggregates multiple entries per day using max().
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    df.rename(columns={'timestamp': 'date'}, inplace=True)
-    df['date'] = pd.to_datetime(
-        df['date'], format='ISO8601', utc=True).dt.tz_convert(None).dt.normalize()
-    cols = [c for c in ['overall_score', 'deep_sleep_in_minutes',
-                        'restlessness'] if c in df.columns]
-    df = df[cols + ['date']]
-    return df.groupby('date').max()  # Simplified aggregation
+    return read_schema_csv(file_path, CSV_SCHEMAS['sleep_score'])
 
 
 def parse_simple_activity_json(file_path):
@@ -98,83 +486,140 @@ def parse_simple_activity_json(file_path):
         pd.DataFrame: Indexed by 'date' with a single column named after the
                       activity type (derived from filename).
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
-    if df.empty:
+    loaded = load_intraday(file_path)
+    if loaded is None:
         return None
-    base_name = os.path.basename(file_path).split('-')[0]
-    df['value'] = pd.to_numeric(df['value'], errors='coerce')
-    df['date'] = pd.to_datetime(
-        df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
-    df.set_index('date', inplace=True)
-    df.rename(columns={'value': base_name}, inplace=True)
-    return df[[base_name]]
+    date_times, values = loaded
+    codes, days = intraday_day_buckets(date_times)
+    index = days.take(codes, allow_fill=True, fill_value=None)
+    index.name = 'date'
+    return pd.DataFrame({intraday_column(file_path): intraday_values(values)}, index=index)
+
+
+def _add_heart_rate_sample(days, dt, bpm):
+    """Folds one sample into the [min, max, sum, count] accumulator of its 'MM/DD/YY' day."""
+    if not dt or not bpm:
+        return
+    day = dt[:DAY_PREFIX_LEN]
+    acc = days.get(day)
+    if acc is None:
+        days[day] = [bpm, bpm, bpm, 1]
+        return
+    if bpm < acc[0]:
+        acc[0] = bpm
+    elif bpm > acc[1]:
+        acc[1] = bpm
+    acc[2] += bpm
+    acc[3] += 1
+
+
+def _fold_heart_rate_events(f, days):
+    """
+    Folds a 'heart_rate-*.json' file into per-day accumulators from ijson's
+    basic parser events: only the 'dateTime' and 'value.bpm' scalars of each
+    sample are kept, no dict is built per sample.
+    """
+    depth = 0
+    key = dt = bpm = None
+    for event, value in ijson.basic_parse(f, use_float=True):
+        if event == 'map_key':
+            key = value
+        elif event == 'string' or event == 'number':
+            if key == 'dateTime' and depth == 1:
+                dt = value
+            elif key == 'bpm' and depth == 2:
+                bpm = value
+        elif event == 'start_map':
+            depth += 1
+        elif event == 'end_map':
+            depth -= 1
+            if depth == 0:
+                # End of a sample
+                _add_heart_rate_sample(days, dt, bpm)
+                dt = bpm = None
 
 
 def parse_heart_rate_intraday_summary(file_path):
     """
     Parses 'heart_rate-YYYY-MM-DD.json' to get Daily Min, Max, and Avg BPM.
-    """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    if not data:
-        return None
 
-    # Intraday detail is inside 'value' -> 'bpm'
-    records = []
-    for entry in data:
-        dt = entry.get('dateTime')
-        val = entry.get('value', {})
-        bpm = val.get('bpm')
-        if dt and bpm:
-            records.append({'dateTime': dt, 'bpm': bpm})
-
-    if not records:
+    With ijson, the file is read as a stream of parser events and every sample
+    is folded into per-day running aggregates keyed on the raw 'MM/DD/YY'
+    prefix, so memory stays flat and no per-sample object, DataFrame or
+    timestamp is ever built. Without it, falls back to json.load.
+    """
+    # day prefix -> [min, max, sum, count]
+    days = {}
+    with open(file_path, 'rb') as f:
+        if HAS_IJSON:
+            _fold_heart_rate_events(f, days)
+        else:
+            for entry in json.load(f):
+                _add_heart_rate_sample(days, entry.get('dateTime'), (entry.get('value') or {}).get('bpm'))
+
+    if not days:
         return None
-    df = pd.DataFrame(records)
-    df['date'] = pd.to_datetime(
-        df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
-
-    stats = df.groupby('date')['bpm'].agg(['min', 'max', 'mean']).reset_index()
-    stats.rename(columns={'min': 'min_bpm',
-                 'max': 'max_bpm', 'mean': 'avg_bpm'}, inplace=True)
+    stats = pd.DataFrame({
+        'min_bpm': [acc[0] for acc in days.values()],
+        'max_bpm': [acc[1] for acc in days.values()],
+        'avg_bpm': [acc[2] / acc[3] for acc in days.values()],
+    }, index=parse_day_prefixes(list(days)))
     stats['avg_bpm'] = stats['avg_bpm'].round(1)
-    stats.set_index('date', inplace=True)
-    return stats
+    stats.index.name = 'date'
+    return stats.sort_index()
+
+
+def _legacy_zone_counts(df):
+    """Counts minutes per (day, zone) by parsing every timestamp (any format or UTC offset)."""
+    df = df.assign(date=pd.to_datetime(df['timestamp']).dt.normalize(),
+                   **{ZONE_TYPE_COLUMN: df[ZONE_TYPE_COLUMN].astype(object)})
+    return df.groupby(['date', ZONE_TYPE_COLUMN]).size().unstack(fill_value=0)
 
 
 def parse_active_zones_csv(file_path):
     """
     Parses 'time_in_heart_rate_zone-YYYY-MM-DD.csv' (minute-by-minute logs).
+
+    Only the timestamp and zone columns are read, the zone as a categorical.
+    Minutes are bucketed by date prefix (see iso_day_buckets) and counted per
+    day and zone with a single np.bincount; timestamps with another UTC offset
+    than 'Z' fall back to parsing every row.
+
+    Returns:
+        pd.DataFrame: Indexed by 'date' with the minutes spent in each zone
+                      ('zone_cardio', 'zone_peak', ...).
     """
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, usecols=['timestamp', ZONE_TYPE_COLUMN],
+                         dtype={'timestamp': object, ZONE_TYPE_COLUMN: 'category'})
     except:
         return None
-    if 'heart rate zone type' not in df.columns:
+    if df['timestamp'].hasnans:
+        df = df[df['timestamp'].notna()]
+    if df.empty:
         return None
 
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
+    buckets = iso_day_buckets(df['timestamp'])
+    if buckets is None:
+        pivot = _legacy_zone_counts(df)
+    else:
+        day_codes, days = buckets
+        zones = df[ZONE_TYPE_COLUMN].cat.remove_unused_categories()
+        zone_codes = zones.cat.codes.to_numpy()
+        n_zones = len(zones.cat.categories)
 
-    # Group by date and zone type, count minutes (each row is 1 min)
-    zone_map = {
-        'OUT_OF_RANGE': 'zone_out_of_range',
-        'FAT_BURN': 'zone_fat_burn',
-        'CARDIO': 'zone_cardio',
-        'PEAK': 'zone_peak',
-        'LIGHT': 'zone_light'
-    }
+        # One bin per (day, zone) pair; rows without a zone (code -1) are skipped
+        valid = zone_codes >= 0
+        pairs = day_codes[valid].astype(np.int64) * n_zones + zone_codes[valid]
+        counts = np.bincount(pairs, minlength=len(days) * n_zones).reshape(-1, n_zones)
 
-    # Pivot to get zones as columns
-    pivot = df.groupby(['date', 'heart rate zone type']
-                       ).size().unstack(fill_value=0)
+        pivot = pd.DataFrame(counts, index=days, columns=pd.Index(zones.cat.categories, name=ZONE_TYPE_COLUMN))
+        pivot = pivot[counts.any(axis=1)].sort_index()
+        pivot = pivot[sorted(pivot.columns)]
 
     # Rename columns based on map
-    rename_cols = {col: zone_map.get(
-        col, f"zone_{col.lower().replace(' ', '_')}") for col in pivot.columns}
-    pivot.rename(columns=rename_cols, inplace=True)
-
+    pivot.rename(columns={col: ZONE_COLUMNS.get(col, f"zone_{col.lower().replace(' ', '_')}")
+                          for col in pivot.columns}, inplace=True)
     return pivot
 
 
@@ -189,15 +634,7 @@ def parse_spo2_csv(file_path):
         pd.DataFrame: Indexed by 'date' with 'spo2_avg', 'spo2_min', 'spo2_max'.
                       Handles duplicates by averaging values.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    df['date'] = pd.to_datetime(
-        df['timestamp'], utc=True).dt.tz_convert(None).dt.normalize()
-    df.rename(columns={'average_value': 'spo2_avg',
-              'lower_bound': 'spo2_min', 'upper_bound': 'spo2_max'}, inplace=True)
-    return df[['spo2_avg', 'spo2_min', 'spo2_max', 'date']].groupby('date').mean()
+    return read_schema_csv(file_path, CSV_SCHEMAS['spo2'])
 
 
 def parse_calories_intraday(file_path):
@@ -212,15 +649,10 @@ def parse_calories_intraday(file_path):
     Returns:
         pd.DataFrame: Indexed by 'date' with 'calories_total' (sum of the day).
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
-    if df.empty:
+    loaded = load_intraday(file_path)
+    if loaded is None:
         return None
-    df['value'] = pd.to_numeric(df['value'], errors='coerce')
-    df['date'] = pd.to_datetime(
-        df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
-    return df.groupby('date')['value'].sum().reset_index().rename(columns={'value': 'calories_total'}).set_index('date')
+    return sum_by_day(*loaded, 'calories_total')
 
 
 def parse_sleep_json_detailed(file_path):
@@ -271,15 +703,7 @@ def parse_hrv_csv(file_path):
         pd.DataFrame: Indexed by 'date' with 'rmssd' (Root Mean Square of Successive Differences).
                       Higher rMSSD generally indicates better recovery.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    if 'rmssd' not in df.columns:
-        return None
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
-    df.set_index('date', inplace=True)
-    return df[['rmssd']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['hrv'])
 
 
 def parse_stress_csv(file_path):
@@ -294,123 +718,58 @@ def parse_stress_csv(file_path):
     Returns:
         pd.DataFrame: Indexed by 'date' with 'stress_score'.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    df.columns = df.columns.str.strip()
-    if 'DATE' not in df.columns or 'STRESS_SCORE' not in df.columns:
-        return None
-    df = df[df['STRESS_SCORE'] > 0]
-    df['date'] = pd.to_datetime(df['DATE']).dt.normalize()
-    df.set_index('date', inplace=True)
-    df.rename(columns={'STRESS_SCORE': 'stress_score'}, inplace=True)
-    return df[['stress_score']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['stress'])
 
 
 def parse_acwr_csv(file_path):
     """
     Parses 'cardio_acute_chronic_workload_ratio.csv'.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    if 'ratio' not in df.columns:
-        return None
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
-    df.rename(columns={'ratio': 'acwr_ratio'}, inplace=True)
-    df.set_index('date', inplace=True)
-    return df[['acwr_ratio']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['acwr'])
 
 
 def parse_vo2max_csv(file_path):
     """
     Parses 'demographic_vo2max.csv'.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    if 'demographic vo2max' not in df.columns:
-        return None
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
-    df.rename(columns={'demographic vo2max': 'vo2max'}, inplace=True)
-    df.set_index('date', inplace=True)
-    return df[['vo2max']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['vo2max'])
 
 
 def parse_readiness_csv(file_path):
     """
     Parses 'daily_readiness.csv' to extract the true Fitbit Readiness Score.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    if 'score' not in df.columns:
-        return None
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
-    df.rename(columns={'score': 'readiness_score'}, inplace=True)
-    df.set_index('date', inplace=True)
-    return df[['readiness_score']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['readiness'])
 
 
 def parse_respiratory_rate_csv(file_path):
     """
     Parses 'daily_respiratory_rate.csv' for breath tracking.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    if 'breaths per minute' not in df.columns:
-        return None
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
-    df.rename(columns={'breaths per minute': 'respiratory_rate'}, inplace=True)
-    df.set_index('date', inplace=True)
-    return df[['respiratory_rate']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['respiratory_rate'])
 
 
 def parse_skin_temperature_csv(file_path):
     """
     Parses 'daily_sleep_temperature_derivations.csv' and calculates the variation.
     """
-    try:
-        df = pd.read_csv(file_path)
-    except:
-        return None
-    if 'nightly temperature celsius' not in df.columns or 'baseline temperature celsius' not in df.columns:
-        return None
-    df['date'] = pd.to_datetime(df['timestamp']).dt.normalize()
-    df['temperature_variation'] = df['nightly temperature celsius'] - \
-        df['baseline temperature celsius']
-    df.set_index('date', inplace=True)
-    return df[['temperature_variation']]
+    return read_schema_csv(file_path, CSV_SCHEMAS['skin_temperature'])
 
 
 def parse_steps_json(file_path):
     """Parses 'steps-YYYY-MM-DD.json'."""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
-    if df.empty:
+    loaded = load_intraday(file_path)
+    if loaded is None:
         return None
-    df['value'] = pd.to_numeric(df['value'], errors='coerce')
-    df['date'] = pd.to_datetime(df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
-    return df.groupby('date')['value'].sum().reset_index().rename(columns={'value': 'steps'}).set_index('date')
+    return sum_by_day(*loaded, 'steps')
 
 
 def parse_distance_json(file_path):
     """Parses 'distance-YYYY-MM-DD.json'."""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
-    if df.empty:
+    loaded = load_intraday(file_path)
+    if loaded is None:
         return None
-    df['value'] = pd.to_numeric(df['value'], errors='coerce')
-    df['date'] = pd.to_datetime(df['dateTime'], format='%m/%d/%y %H:%M:%S').dt.normalize()
-    return df.groupby('date')['value'].sum().reset_index().rename(columns={'value': 'distance'}).set_index('date')
+    return sum_by_day(*loaded, 'distance')
 
 
 def parse_exercise_json(file_path):
@@ -444,7 +803,7 @@ def parse_exercise_json(file_path):
         return None
         
     df = pd.DataFrame(records)
-    df['date'] = pd.to_datetime(df['date'], format='%m/%d/%y %H:%M:%S').dt.normalize()
+    df['date'] = day_index(df['date'])
     
     aggs = {
         'exercise_duration': 'sum',
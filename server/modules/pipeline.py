@@ -0,0 +1,88 @@
+from modules import etl, metrics
+from modules.context import RunContext
+from modules.instrumentation import PipelineRecorder
+
+# (Progress %, Message, Step, Needs the run context) run on the merged dataset, in order
+METRIC_STEPS = [
+    (70, "Calculating readiness metrics", metrics.calculate_readiness, False),
+    (75, "Calculating metabolic metrics", metrics.calculate_metabolic_metrics, True),
+    (80, "Calculating advanced metrics", metrics.calculate_advanced_metrics, False),
+]
+
+
+def run_pipeline(progress_callback=None, stage_callback=None, export_csv=None, workers=None,
+                 cancel_event=None, ctx=None, changed_files=None):
+    """
+    Runs the full ETL: load & merge, metrics, analysis store and dashboard JSON
+    (with its precomputed aggregates).
+
+    Every stage is measured by a PipelineRecorder (wall time, thread CPU time,
+    RSS change, files and rows). Finished stages are passed to `stage_callback` as
+    they complete, and the whole run is appended to the run history file.
+
+    Args:
+        progress_callback: Optional callable(pct, msg) for progress reporting.
+        stage_callback: Optional callable(record) receiving each stage record.
+        export_csv (bool): Also write the analysis CSV, see etl.export_analysis().
+        workers (int): Parser processes, see etl.resolve_workers().
+        cancel_event (threading.Event): Cooperative cancellation, checked between files
+                                        and stages. Nothing is exported once it is set.
+        ctx (RunContext): Input, output, date range and biometrics of the run.
+                          Defaults to one built from config.
+        changed_files (iterable): Files or directories known to have changed, re-parsed
+                                  even if the parse cache holds them, see etl.merge_all_data().
+
+    Raises:
+        etl.ETLCancelled: If the run was cancelled.
+
+    Returns:
+        tuple: (pd.DataFrame or None if no data was found, PipelineRecorder)
+    """
+    def progress(pct, msg):
+        if progress_callback:
+            progress_callback(pct, msg)
+
+    ctx = ctx or RunContext.from_config()
+    recorder = PipelineRecorder(stage_callback)
+    status = "error"
+    try:
+        progress(10, "Loading and merging data files")
+        df = etl.merge_all_data(progress_callback=progress_callback, workers=workers,
+                                recorder=recorder, cancel_event=cancel_event, ctx=ctx,
+                                changed_files=changed_files)
+        if df is None:
+            status = "no_data"
+            return None, recorder
+
+        for pct, msg, step, uses_ctx in METRIC_STEPS:
+            etl.check_cancelled(cancel_event)
+            progress(pct, msg)
+            with recorder.stage("metrics", step.__name__) as info:
+                df = step(df, ctx) if uses_ctx else step(df)
+                info["rows"] = len(df)
+
+        etl.check_cancelled(cancel_event)
+        progress(85, "Calculating dashboard aggregates")
+        with recorder.stage("metrics", "dashboard_aggregates") as info:
+            aggregates = metrics.calculate_dashboard_aggregates(df)
+            info["rows"] = len(df)
+
+        etl.check_cancelled(cancel_event)
+        progress(90, "Exporting analysis store")
+        # Required for BRIEFING module
+        with recorder.stage("export", "analysis_store") as info:
+            etl.export_analysis(df, export_csv=export_csv, ctx=ctx)
+            info["rows"] = len(df)
+
+        progress(95, "Exporting dashboard JSON")
+        with recorder.stage("export", "dashboard_json") as info:
+            etl.export_to_json(df, ctx, aggregates=aggregates)
+            info["rows"] = len(df)
+
+        status = "success"
+        return df, recorder
+    except etl.ETLCancelled:
+        status = "cancelled"
+        raise
+    finally:
+        recorder.save_history(status, ctx.out_dir)
@@ -0,0 +1,89 @@
+import json
+import os
+import re
+
+import config
+from modules.context import RunContext, SESSION_CONFIG_FILENAME
+
+# Profile served from CLIENT_PUBLIC_DIR itself (single-user desktop and Docker setups)
+DEFAULT_PROFILE = "default"
+
+# Profile names double as directory names: keep them filesystem and URL safe
+PROFILE_NAME_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+def get_profiles_root():
+    """Returns the directory holding the non-default profiles (PROFILES_DIR or CLIENT_PUBLIC_DIR/profiles)."""
+    return config.PROFILES_DIR or os.path.join(config.CLIENT_PUBLIC_DIR, "profiles")
+
+
+def validate_profile(profile):
+    """
+    Normalizes a profile name.
+
+    Returns:
+        str: The profile name, DEFAULT_PROFILE when empty.
+
+    Raises:
+        ValueError: If the name contains anything but letters, digits, '-' and '_'.
+    """
+    profile = profile or DEFAULT_PROFILE
+    if not PROFILE_NAME_RE.match(profile):
+        raise ValueError(f"Invalid profile name '{profile}' (allowed: letters, digits, '-', '_')")
+    return profile
+
+
+def get_profile_dir(profile=None):
+    """
+    Returns the output directory of a profile: its session config, analysis store,
+    dashboard JSON and run history all live there.
+    """
+    profile = validate_profile(profile)
+    if profile == DEFAULT_PROFILE:
+        return config.CLIENT_PUBLIC_DIR
+    return os.path.join(get_profiles_root(), profile)
+
+
+def get_profile_cache_dir(profile=None):
+    """Returns the parse cache directory of a profile (<PARSE_CACHE_DIR>/<profile>)."""
+    return os.path.join(config.PARSE_CACHE_DIR, validate_profile(profile))
+
+
+def list_profiles():
+    """Returns the names of the profiles that have a saved session config."""
+    profiles = []
+    if os.path.exists(os.path.join(config.CLIENT_PUBLIC_DIR, SESSION_CONFIG_FILENAME)):
+        profiles.append(DEFAULT_PROFILE)
+
+    root = get_profiles_root()
+    if os.path.isdir(root):
+        for name in sorted(os.listdir(root)):
+            if (PROFILE_NAME_RE.match(name) and name != DEFAULT_PROFILE
+                    and os.path.exists(os.path.join(root, name, SESSION_CONFIG_FILENAME))):
+                profiles.append(name)
+    return profiles
+
+
+def profile_context(profile=None, **overrides):
+    """
+    Builds the RunContext of a profile from its saved session config.
+
+    Args:
+        profile (str): Profile name, DEFAULT_PROFILE when empty.
+        **overrides: RunContext fields taking precedence over the session (None is ignored).
+
+    Returns:
+        RunContext: A context whose out_dir is the profile directory and whose
+                    parse cache is private to the profile.
+    """
+    if overrides.get("parse_cache_dir") is None:
+        overrides["parse_cache_dir"] = get_profile_cache_dir(profile)
+    return RunContext.from_session_config(get_profile_dir(profile), **overrides)
+
+
+def save_session_config(profile, session):
+    """Writes a profile's session_config.json, creating the profile directory if needed."""
+    profile_dir = get_profile_dir(profile)
+    os.makedirs(profile_dir, exist_ok=True)
+    with open(os.path.join(profile_dir, SESSION_CONFIG_FILENAME), "w") as f:
+        json.dump(session, f)
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+from modules import dashboard
+from modules.briefing import get_dataset_cache
+from modules.context import RunContext
+
+# Resolution -> pandas period frequency of its buckets (None: one row per day)
+RESOLUTIONS = {
+    "daily": None,
+    "weekly": "W-SUN",
+    "monthly": "M",
+}
+
+
+def slice_rows(index, start=None, end=None):
+    """
+    Binary search of a date range in a sorted DatetimeIndex.
+
+    Args:
+        index (pd.DatetimeIndex): Sorted index of the dataset.
+        start (str): First day (inclusive), None for the first row.
+        end (str): Last day (inclusive), None for the last row.
+
+    Returns:
+        tuple: (lo, hi) row positions, the range is index[lo:hi].
+    """
+    lo = index.searchsorted(pd.to_datetime(start)) if start else 0
+    hi = index.searchsorted(pd.to_datetime(end), side='right') if end else len(index)
+    return lo, max(lo, hi)
+
+
+def downsample(index, values, freq):
+    """
+    Means of every column per period (NaNs skipped), in one pass over the sorted rows.
+
+    Args:
+        index (pd.DatetimeIndex): Sorted index of the rows.
+        values (np.ndarray): 2-D float array (rows x columns).
+        freq (str): Pandas period frequency, see RESOLUTIONS.
+
+    Returns:
+        tuple: (period start dates, means array (periods x columns), days per period)
+    """
+    if len(index) == 0:
+        return index, values, np.zeros(0, dtype='int64')
+
+    # Rows are sorted, so every period is a contiguous run of equal keys
+    keys = index.to_period(freq).asi8
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    present = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(present, values, 0.0), starts, axis=0)
+    counts = np.add.reduceat(present.astype('int64'), starts, axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+
+    periods = index[starts].to_period(freq).start_time
+    days = np.diff(np.r_[starts, len(index)])
+    return periods, means, days
+
+
+def query_data(start=None, end=None, columns=None, resolution="daily", decimals=None, dataset=None, ctx=None):
+    """
+    Returns a slice of the master dataset in the compact column-array encoding of
+    the dashboard chunks, so a chart only transfers what it displays.
+
+    The rows come from the in-memory dataset of the profile (see
+    briefing.get_dataset_cache), located by binary search on its sorted index.
+
+    Args:
+        start (str): First day (inclusive, YYYY-MM-DD). Defaults to the first available day.
+        end (str): Last day (inclusive, YYYY-MM-DD). Defaults to the latest available day.
+        columns (list): Columns to return. Defaults to all of them.
+        resolution (str): "daily", or "weekly"/"monthly" for the per-period means
+                          (flags become the share of flagged days).
+        decimals (int): Float precision. Defaults to ctx.dashboard_decimals.
+        dataset (BriefingDataset): Snapshot to use. Defaults to the in-memory cache of ctx.
+        ctx (RunContext): Profile to query.
+
+    Raises:
+        ValueError: On an unknown column or resolution, or an unparsable date.
+
+    Returns:
+        dict: {"resolution", "rows", "dates", "columns": {name: [...]}} plus "days"
+              (days per period) for downsampled resolutions.
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution '{resolution}' (expected one of {', '.join(RESOLUTIONS)})")
+    if decimals is None:
+        decimals = (ctx or RunContext.from_config()).dashboard_decimals
+
+    if dataset is None:
+        dataset = get_dataset_cache(ctx).get()
+    if dataset is None:
+        return {"error": "Data file not found. Run ETL first."}
+    df = dataset.df
+
+    columns = list(df.columns) if not columns else list(dict.fromkeys(columns))
+    unknown = [c for c in columns if c not in df.columns]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+
+    lo, hi = slice_rows(df.index, start, end)
+    window = df.iloc[lo:hi]
+
+    freq = RESOLUTIONS[resolution]
+    if freq is None:
+        result = {
+            "resolution": resolution,
+            "rows": len(window),
+            "dates": window.index.strftime('%Y-%m-%d').tolist(),
+            "columns": {col: dashboard.encode_column(window[col].to_numpy(), decimals) for col in columns},
+        }
+    else:
+        values = window[columns].to_numpy(dtype='float64', na_value=np.nan)
+        periods, means, days = downsample(window.index, values, freq)
+        result = {
+            "resolution": resolution,
+            "rows": len(periods),
+            "dates": periods.strftime('%Y-%m-%d').tolist(),
+            "days": days.tolist(),
+            "columns": {col: dashboard.encode_column(means[:, i], decimals) for i, col in enumerate(columns)},
+        }
+    return result
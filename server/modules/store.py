@@ -0,0 +1,138 @@
+import json
+import os
+import struct
+
+import numpy as np
+import pandas as pd
+import config
+
+STORE_FILENAME = "fitbit_analysis.store"
+CSV_FILENAME = "fitbit_analysis.csv"
+
+# File layout: MAGIC | uint32 header length | JSON header | padding | column buffers
+MAGIC = b"FITSTORE"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+
+def get_store_path(out_dir=None):
+    """Returns the path of the columnar analysis store inside the output directory."""
+    return os.path.join(out_dir or config.CLIENT_PUBLIC_DIR, STORE_FILENAME)
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _column_array(series):
+    """
+    Returns a fixed-width NumPy array for a column, or None if the column only
+    fits as Python objects (stored in the JSON header instead).
+    """
+    values = series.to_numpy()
+    if values.dtype != object:
+        return np.ascontiguousarray(values)
+    # Object columns (e.g. np.where(..., None)) are numeric with missing values
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.notna().sum() == series.notna().sum():
+        return np.ascontiguousarray(numeric.to_numpy(dtype='float64'))
+    return None
+
+
+def write_store(df, path):
+    """
+    Writes the Master DataFrame to a single-file binary columnar store.
+
+    Each column is a raw, 64-byte aligned NumPy buffer described by a small
+    JSON header (name, dtype, offset). The DatetimeIndex is stored the same way,
+    so reading back needs no parsing at all. The file is replaced atomically.
+
+    Args:
+        df (pd.DataFrame): Dataset indexed by date.
+        path (str): Destination file.
+    """
+    index = np.ascontiguousarray(df.index.to_numpy())
+    buffers = [index]
+    header = {
+        "version": FORMAT_VERSION,
+        "rows": len(df),
+        "index": {"name": df.index.name, "dtype": index.dtype.str},
+        "columns": [],
+        "object_columns": {},
+    }
+
+    for name in df.columns:
+        arr = _column_array(df[name])
+        if arr is None:
+            values = df[name].astype(object).where(df[name].notna(), None)
+            header["object_columns"][str(name)] = values.tolist()
+            header["columns"].append({"name": str(name), "dtype": None})
+            continue
+        header["columns"].append({"name": str(name), "dtype": arr.dtype.str})
+        buffers.append(arr)
+
+    # Assign offsets (relative to the start of the data section)
+    offset = 0
+    offsets = []
+    for arr in buffers:
+        offsets.append(offset)
+        offset = _align(offset + arr.nbytes)
+    header["index"]["offset"] = offsets[0]
+    numeric_cols = [c for c in header["columns"] if c["dtype"] is not None]
+    for col, off in zip(numeric_cols, offsets[1:]):
+        col["offset"] = off
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _align(len(MAGIC) + 4 + len(header_bytes))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for arr, off in zip(buffers, offsets):
+            f.seek(data_start + off)
+            f.write(arr.tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_store(path):
+    """
+    Reads a store written by write_store().
+
+    The file is read with a single call and every column is a NumPy view on
+    that buffer, so opening the store costs little more than the disk read.
+
+    Returns:
+        pd.DataFrame: The dataset with its DatetimeIndex, or None if missing.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        buf = bytearray(f.read())
+
+    if buf[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not an analysis store")
+    (header_len,) = struct.unpack_from("<I", buf, len(MAGIC))
+    header_end = len(MAGIC) + 4 + header_len
+    header = json.loads(buf[len(MAGIC) + 4:header_end].decode("utf-8"))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported analysis store version {header.get('version')}")
+
+    data_start = _align(header_end)
+    rows = header["rows"]
+
+    def view(dtype, offset):
+        return np.frombuffer(buf, dtype=np.dtype(dtype), count=rows, offset=data_start + offset)
+
+    data = {}
+    for col in header["columns"]:
+        if col["dtype"] is None:
+            data[col["name"]] = pd.Series(header["object_columns"][col["name"]], dtype=object).to_numpy()
+        else:
+            data[col["name"]] = view(col["dtype"], col["offset"])
+
+    index = pd.Index(view(header["index"]["dtype"], header["index"]["offset"]),
+                     name=header["index"]["name"])
+    return pd.DataFrame(data, index=index, copy=False)
@@ -0,0 +1,63 @@
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api
+
+
+def payload(weight):
+    return api.ConfigPayload(dob="1990-01-01", gender="male", height=180, weight=weight, data_path="/data")
+
+
+class ETLJobManagerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.runs = []  # (job_id, weight) in execution order
+
+        async def fake_run(job, executor=None):
+            self.runs.append((job.id, job.payload.weight))
+            await asyncio.sleep(0.05)
+            job.status = "success"
+
+        patches = [mock.patch.object(api, "run_etl_task", fake_run),
+                   mock.patch.object(api.manager, "publish")]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.jobs = api.ETLJobManager(max_concurrent=1)
+
+    async def drain(self):
+        while self.jobs.active:
+            await asyncio.sleep(0.01)
+
+    async def test_request_matching_running_job_drops_queued_one(self):
+        a, _ = self.jobs.submit("p", payload(75))
+        await asyncio.sleep(0)
+        b, coalesced_b = self.jobs.submit("p", payload(80))
+        again, coalesced_again = self.jobs.submit("p", payload(75))
+        await self.drain()
+
+        self.assertFalse(coalesced_b)
+        self.assertIs(again, a)
+        self.assertTrue(coalesced_again)
+        self.assertEqual(b.status, "cancelled")
+        self.assertEqual(self.runs, [(a.id, 75)])
+
+    async def test_latest_request_runs_last(self):
+        self.jobs.submit("p", payload(75))
+        await asyncio.sleep(0)
+        self.jobs.submit("p", payload(80))
+        _, coalesced = self.jobs.submit("p", payload(80))
+        c, _ = self.jobs.submit("p", payload(85))
+        await self.drain()
+
+        self.assertTrue(coalesced)
+        self.assertEqual([w for _, w in self.runs], [75, 85])
+        self.assertEqual(self.runs[-1][0], c.id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
-import time
-import subprocess
+import multiprocessing
 import os
-import sys
+import threading
+import time
+
+import config
+from main import build_parser, context_from_args, progress
+from modules import pipeline
+from modules.context import SESSION_CONFIG_FILENAME
 
 try:
     from watchdog.observers import Observer
@@ -12,63 +17,154 @@ except ImportError:
 
 DATA_DIR = os.environ.get("DATA_DIR", "/app/data")
 
-
-def run_etl():
-    """Spawns a subprocess to execute the ETL pipeline using main.py."""
-    print("\\n[watch.py] Running ETL...")
-    # Pass any arguments down to main.py
-    subprocess.run(["python", "main.py"] + sys.argv[1:], check=False)
-    print("\\n[watch.py] ETL run complete.")
+# Only changes to these files (or to whole directories) trigger a run
+WATCHED_EXTENSIONS = ('.json', '.csv')
+WATCHED_EVENTS = ('created', 'modified', 'moved', 'deleted')
 
 
-if not HAS_WATCHDOG:
-    print("watchdog module not found, running ETL once and exiting.")
-    run_etl()
-    sys.exit(0)
+class ChangeQueue:
+    """
+    Coalescing set of changed paths, filled by the watchdog thread and drained by the ETL loop.
 
+    Adding never blocks the observer thread, and a path changed many times is
+    queued once. Paths added while a run is in progress stay queued and form the
+    next batch, so no change is ever dropped.
+    """
 
-class DataHandler(FileSystemEventHandler):
     def __init__(self):
-        self.last_run = time.time()
-
-    def on_modified(self, event):
-        if event.is_directory:
-            return
-
-        # Only trigger on relevant data files
-        if not event.src_path.lower().endswith(('.json', '.csv')):
-            return
-
-        # Debounce to prevent multiple runs for a single batch of file changes
-        current_time = time.time()
-        if current_time - self.last_run > 10.0:  # Increased debounce
-            self.last_run = current_time
-            print(
-                f"[watch.py] File modified: {event.src_path}. Triggering ETL in 2s...")
-            time.sleep(2)
-            run_etl()
-
-
-if __name__ == "__main__":
-    # Ensure dir exists
-    os.makedirs(DATA_DIR, exist_ok=True)
-
-    # Run ONLY if session_config.json exists (implies user has configured it once)
-    if os.path.exists("session_config.json"):
-        print("[watch.py] Initializing with existing session config...")
-        run_etl()
+        self._cond = threading.Condition()
+        self._paths = set()
+        self._first = None
+        self._last = None
+
+    def add(self, path):
+        """Queues a changed path."""
+        with self._cond:
+            now = time.monotonic()
+            if not self._paths:
+                self._first = now
+            self._paths.add(path)
+            self._last = now
+            self._cond.notify()
+
+    def next_batch(self, debounce, max_delay):
+        """
+        Waits for changes, then for them to settle, and drains them.
+
+        A batch closes once no new path arrived for `debounce` seconds, or
+        `max_delay` seconds after its first change when files keep changing.
+
+        Returns:
+            set: The changed paths.
+        """
+        with self._cond:
+            while True:
+                if not self._paths:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                deadline = min(self._last + debounce, self._first + max_delay)
+                if now >= deadline:
+                    paths, self._paths = self._paths, set()
+                    return paths
+                self._cond.wait(timeout=deadline - now)
+
+
+if HAS_WATCHDOG:
+    class DataHandler(FileSystemEventHandler):
+        """Queues created, modified, moved and deleted data files; no work happens in the observer thread."""
+
+        def __init__(self, queue):
+            self.queue = queue
+
+        def on_any_event(self, event):
+            if event.event_type not in WATCHED_EVENTS:
+                return
+            # A directory's own 'modified' event only echoes changes to its files
+            if event.is_directory and event.event_type == 'modified':
+                return
+
+            # Moves count for both ends (e.g. an editor's temp file renamed over the export)
+            for path in (event.src_path, getattr(event, 'dest_path', None)):
+                if path and (event.is_directory or path.lower().endswith(WATCHED_EXTENSIONS)):
+                    self.queue.add(path)
+
+
+def run_etl(args, changed=None):
+    """
+    Runs the ETL pipeline in this process.
+
+    The parse cache is always on here: files whose path, size and mtime are
+    unchanged are taken from it, and the changed paths are re-parsed even if
+    their size and mtime match (e.g. an export extracted with its original
+    timestamps), so a run after a change parses exactly the changed files.
+
+    Args:
+        args (argparse.Namespace): Command line arguments, see main.build_parser().
+        changed (set): Paths (files or directories) that triggered the run.
+    """
+    # Re-read on every run: the UI may have saved a new session config meanwhile
+    ctx = context_from_args(args)
+    if not ctx.has_biometrics:
+        print("[watch.py] Biometric metrics are not set, skipping run (configure them in the UI).")
+        return
+    ctx = ctx.replace(parse_cache=True)
+
+    if changed:
+        names = sorted(os.path.basename(p) for p in changed)
+        shown = ", ".join(names[:5]) + (f" (+{len(names) - 5} more)" if len(names) > 5 else "")
+        print(f"\n[watch.py] {len(names)} change(s): {shown}. Running ETL...")
     else:
-        print("[watch.py] No session config found. Waiting for UI configuration...")
+        print("\n[watch.py] Running ETL...")
 
-    print(f"\n[watch.py] Watching {DATA_DIR} for changes...")
-    event_handler = DataHandler()
+    start = time.perf_counter()
+    try:
+        df, _ = pipeline.run_pipeline(progress_callback=progress, ctx=ctx, changed_files=changed)
+    except Exception as e:
+        print(f"[watch.py] ETL run failed: {e}")
+        return
+    if df is None:
+        print("[watch.py] No valid data found.")
+        return
+    print(f"[watch.py] ETL run complete in {time.perf_counter() - start:.1f}s ({len(df)} days).")
+
+
+def main():
+    args = build_parser(description="Fitbit Stats ETL watcher").parse_args()
+    if not HAS_WATCHDOG:
+        print("watchdog module not found, running ETL once and exiting.")
+        run_etl(args)
+        return
+
+    data_dir = args.data_dir or DATA_DIR
+    os.makedirs(data_dir, exist_ok=True)
+
+    # Start watching before the initial run: changes made during it are queued
+    queue = ChangeQueue()
     observer = Observer()
-    observer.schedule(event_handler, path=DATA_DIR, recursive=True)
+    observer.schedule(DataHandler(queue), path=data_dir, recursive=True)
     observer.start()
 
     try:
+        # Run ONLY if session_config.json exists (implies user has configured it once)
+        if os.path.exists(os.path.join(context_from_args(args).out_dir, SESSION_CONFIG_FILENAME)):
+            print("[watch.py] Initializing with existing session config...")
+            run_etl(args)
+        else:
+            print("[watch.py] No session config found. Waiting for UI configuration...")
+
+        print(f"\n[watch.py] Watching {data_dir} for changes...")
         while True:
-            time.sleep(1)
+            changed = queue.next_batch(config.WATCH_DEBOUNCE_SECONDS, config.WATCH_MAX_DELAY_SECONDS)
+            run_etl(args, changed)
     except KeyboardInterrupt:
+        pass
+    finally:
         observer.stop()
-    observer.join()
+        observer.join()
+
+
+if __name__ == "__main__":
+    # Required for the parser process pool (ETL_WORKERS > 1)
+    multiprocessing.freeze_support()
+    main()